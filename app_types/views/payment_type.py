@@ -6,6 +6,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from architect.utils.pagination import InvalidCursor, paginate, wants_page
+
 from ..serializers.payment_type import PaymentTypeSerializer
 from ..services import payment_type_service as service
 
@@ -23,8 +25,15 @@ def _json_body(request):
 @permission_classes([IsAuthenticated])
 def payment_type_list(request):
     items = service.list_active()
+    page = {}
+    if wants_page(request.GET):
+        # Mismo orden que la lista completa (por nombre); el id desempata
+        try:
+            items, page = paginate(request.GET, items, key=("name", "id"))
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
     data = PaymentTypeSerializer(items, many=True).data
-    return JsonResponse({"payment_type": data})
+    return JsonResponse({"payment_type": data, **page})
 
 
 @csrf_exempt
@@ -3,4 +3,9 @@ from django.apps import AppConfig
 
 class ArchitectConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'architect'
\ No newline at end of file
+    name = 'architect'
+
+    def ready(self):
+        # Invalida la caché de datos de referencia cuando cambian los catálogos
+        from .utils import reference_data
+        reference_data.connect_signals()
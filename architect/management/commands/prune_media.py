@@ -0,0 +1,57 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from architect.storage import content_storage
+
+
+class Command(BaseCommand):
+    help = ("Elimina de media los archivos que ningún registro referencia (fotos reemplazadas, "
+            "variantes huérfanas, temporales de subidas interrumpidas).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--min-age", type=int, default=3600,
+                            help="Solo archivos sin modificar hace al menos estos segundos (por defecto: 3600)")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Solo lista lo que se eliminaría")
+
+    def handle(self, *args, **opt):
+        if opt["min_age"] < 0:
+            raise CommandError("--min-age no puede ser negativo")
+        # La antigüedad mínima protege las subidas cuyo registro aún no se guardó
+        cutoff = time.time() - opt["min_age"]
+        dry_run = opt["dry_run"]
+
+        directories = sorted({
+            field.upload_to.strip("/") for _, field in content_storage.reference_fields()
+            if isinstance(field.upload_to, str) and field.upload_to.strip("/")
+        })
+        referenced = content_storage.referenced_names()
+
+        removed = kept = 0
+        for directory in directories + [".tmp"]:
+            for name in self._walk(directory):
+                if name in referenced:
+                    kept += 1
+                    continue
+                if os.path.getmtime(content_storage.path(name)) > cutoff:
+                    continue
+                removed += 1
+                if dry_run:
+                    self.stdout.write(f"  {name}")
+                else:
+                    content_storage.purge(name)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Se eliminarían' if dry_run else 'Eliminados'}: {removed} | En uso: {kept}"
+        ))
+
+    def _walk(self, directory):
+        if not content_storage.exists(directory):
+            return
+        subdirs, files = content_storage.listdir(directory)
+        for filename in files:
+            yield f"{directory}/{filename}"
+        for subdir in subdirs:
+            yield from self._walk(f"{directory}/{subdir}")
@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+from ..utils import reference_data
+
+
+class CachedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField para catálogos de referencia: resuelve el id contra la
+    caché en memoria del proceso en lugar de hacer un SELECT por campo.
+    El queryset solo se usa para conocer el modelo y listar opciones.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if self.pk_field is not None:
+            data = self.pk_field.to_internal_value(data)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        obj = reference_data.get(self.get_queryset().model, pk)
+        if obj is None:
+            self.fail('does_not_exist', pk_value=data)
+        return obj
@@ -0,0 +1,123 @@
+"""
+Almacenamiento direccionado por contenido para fotos subidas por los usuarios.
+
+Cada archivo se guarda como <upload_to>/<h[0:2]>/<h[2:4]>/<sha256><ext>: el
+hash se calcula mientras el archivo se copia a disco, imágenes idénticas
+comparten un solo archivo y ningún directorio crece sin límite. Como el nombre
+depende del contenido, la URL de un archivo nunca cambia de contenido y puede
+cachearse para siempre (IMMUTABLE_CACHE_CONTROL).
+
+Al compartirse archivos, delete() solo borra cuando ningún campo que use este
+storage referencia el nombre; purge() borra sin comprobar (comando prune_media).
+"""
+import hashlib
+import os
+import posixpath
+import re
+import tempfile
+
+from django.apps import apps
+from django.core.files.storage import FileSystemStorage
+from django.db import models
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+CONTENT_NAME_RE = re.compile(r"(^|/)[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(\.\w+)?$")
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Funciones que devuelven nombres referenciados fuera de FileFields (p. ej. las
+# variantes guardadas en JSON); solo las usa prune_media
+_reference_sources = []
+
+
+def register_references(func):
+    """Registra una función sin argumentos que devuelve los nombres en uso"""
+    _reference_sources.append(func)
+    return func
+
+
+def is_content_name(name):
+    return bool(CONTENT_NAME_RE.search(name or ""))
+
+
+class ContentAddressedStorage(FileSystemStorage):
+
+    def get_available_name(self, name, max_length=None):
+        # El nombre definitivo se calcula en _save a partir del contenido
+        return name
+
+    def _save(self, name, content):
+        directory = posixpath.dirname(name)
+        extension = os.path.splitext(name)[1].lower()
+
+        temp_dir = self.path(".tmp")
+        os.makedirs(temp_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=temp_dir)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                if hasattr(content, "seek"):
+                    content.seek(0)
+                for chunk in content.chunks(HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+                    out.write(chunk)
+
+            h = digest.hexdigest()
+            final_name = posixpath.join(directory, h[:2], h[2:4], f"{h}{extension}")
+            final_path = self.path(final_name)
+            if os.path.exists(final_path):
+                # Contenido repetido: se reutiliza el archivo existente
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(temp_path, self.file_permissions_mode)
+                os.replace(temp_path, final_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return final_name
+
+    def reference_fields(self):
+        """(modelo, campo) de los FileFields que usan este tipo de storage"""
+        for model in apps.get_models():
+            for field in model._meta.concrete_fields:
+                if isinstance(field, models.FileField) and isinstance(field.storage, ContentAddressedStorage):
+                    yield model, field
+
+    def is_referenced(self, name):
+        return any(
+            model._default_manager.filter(**{field.name: name}).exists()
+            for model, field in self.reference_fields()
+        )
+
+    def referenced_names(self):
+        names = set()
+        for model, field in self.reference_fields():
+            names.update(
+                model._default_manager.exclude(**{field.name: ""})
+                .exclude(**{f"{field.name}__isnull": True})
+                .values_list(field.name, flat=True)
+            )
+        for source in _reference_sources:
+            names.update(source())
+        return names
+
+    def delete(self, name):
+        """Borra el archivo si ningún registro lo usa; devuelve True si lo borró"""
+        if not name or self.is_referenced(name):
+            return False
+        self.purge(name)
+        return True
+
+    def purge(self, name):
+        super().delete(name)
+
+
+content_storage = ContentAddressedStorage()
+
+
+def get_content_storage():
+    """Callable para FileField(storage=...); evita serializar la instancia en migraciones"""
+    return content_storage
@@ -1,6 +1,6 @@
 from django.urls import path
 from .views.auth import LoginView, RegisterView, LogoutView
-from .views.user import UserView, UserPhotoUploadView
+from .views.user import UserView, UserExportView, UserPhotoUploadView
 from .views.permission import PermissionView, RoleView
 
 app_name = 'architect'
@@ -13,6 +13,7 @@ urlpatterns = [
     
     # Usuarios - Actualizado para soportar todas las operaciones
     path('users/', UserView.as_view(), name='users'),  # GET (listar), POST (crear)
+    path('users/export/', UserExportView.as_view(), name='users_export'),  # GET (XLSX)
     path('users/<int:pk>/', UserView.as_view(), name='users_detail'),  # GET, PUT, PATCH, DELETE (operaciones específicas)
     path('users/<int:pk>/upload/', UserPhotoUploadView.as_view(), name='user_photo_upload'),  # POST (subir foto)
     
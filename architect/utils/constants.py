@@ -40,4 +40,13 @@ MESSAGES = {
     'PERMISSION_DENIED': 'No tienes permisos para realizar esta acción',
     'INVALID_CREDENTIALS': 'Credenciales inválidas',
     'USER_NOT_FOUND': 'Usuario no encontrado'
-} 
\ No newline at end of file
+} 
+
+
+class SystemConstants:
+    """Agrupa las constantes del sistema para importarlas desde architect.utils"""
+    ROLES = ROLES
+    USER_STATUS = USER_STATUS
+    PERMISSION_TYPES = PERMISSION_TYPES
+    JWT_SETTINGS = JWT_SETTINGS
+    MESSAGES = MESSAGES
@@ -0,0 +1,128 @@
+"""
+Paginación por cursor (keyset) para las vistas basadas en funciones.
+
+El cursor es opaco para el cliente: contiene el último valor de la clave de
+ordenamiento servida, codificado en base64. Cada página es un
+`WHERE key > cursor ORDER BY key LIMIT n`, que usa el índice y cuesta lo mismo
+sin importar en qué página esté el cliente. La clave puede ser compuesta
+(p. ej. ("name", "id") para listar catálogos por nombre sin perder filas con
+nombres repetidos).
+
+Las vistas de lista se suscriben con `wants_page` + `paginate`: sin `cursor`
+ni `limit` siguen devolviendo la lista completa.
+"""
+import base64
+import json
+
+from django.db.models import Q
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+ITERATOR_CHUNK_SIZE = 2000
+
+
+class InvalidCursor(ValueError):
+    """Cursor o límite mal formado enviado por el cliente."""
+
+
+def encode_cursor(value):
+    raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError):
+        raise InvalidCursor("Cursor inválido")
+
+
+def parse_limit(value, default=DEFAULT_LIMIT, maximum=MAX_LIMIT):
+    """Convierte el parámetro `limit` a entero dentro de [1, maximum]."""
+    if value in (None, ""):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise InvalidCursor("El parámetro 'limit' debe ser un número entero")
+    return max(1, min(limit, maximum))
+
+
+def _key_of(obj, key):
+    if isinstance(key, tuple):
+        return [_key_of(obj, k) for k in key]
+    return obj[key] if isinstance(obj, dict) else getattr(obj, key)
+
+
+def _is_scalar(value):
+    return isinstance(value, (int, str)) and not isinstance(value, bool)
+
+
+def _after(key, last):
+    """Condición `key > last`; para claves compuestas, orden lexicográfico"""
+    if not isinstance(key, tuple):
+        if not _is_scalar(last):
+            raise InvalidCursor("Cursor inválido")
+        return Q(**{f"{key}__gt": last})
+    if not isinstance(last, list) or len(last) != len(key) or not all(map(_is_scalar, last)):
+        raise InvalidCursor("Cursor inválido")
+    # (a, b) > (x, y)  <=>  a > x  OR  (a = x AND b > y)
+    condition = Q()
+    for i, k in enumerate(key):
+        condition |= Q(**{f"{k}__gt": last[i]}, **dict(zip(key[:i], last[:i])))
+    return condition
+
+
+def keyset_page(queryset, cursor=None, limit=DEFAULT_LIMIT, key="id"):
+    """
+    Devuelve (items, next_cursor, has_more) ordenando por `key` ascendente
+    (un campo o una tupla de campos cuyo último elemento sea único).
+    Se pide un elemento extra para saber si hay más páginas sin hacer COUNT(*).
+    """
+    qs = queryset.order_by(*key) if isinstance(key, tuple) else queryset.order_by(key)
+    if cursor:
+        qs = qs.filter(_after(key, decode_cursor(cursor)))
+
+    items = list(qs[:limit + 1])
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = encode_cursor(_key_of(items[-1], key)) if has_more else None
+    return items, next_cursor, has_more
+
+
+def wants_page(params):
+    """La petición pidió paginación (?cursor= o ?limit=)"""
+    return "cursor" in params or "limit" in params
+
+
+def paginate(params, queryset, key="id", default=DEFAULT_LIMIT, maximum=MAX_LIMIT):
+    """
+    Página keyset según ?cursor= y ?limit= (acotado a `maximum`). Devuelve
+    (items, {"next_cursor", "has_more"}) para mezclar en la respuesta; lanza
+    InvalidCursor con parámetros mal formados.
+    """
+    limit = parse_limit(params.get("limit"), default=default, maximum=maximum)
+    items, next_cursor, has_more = keyset_page(queryset, params.get("cursor"), limit, key=key)
+    return items, {"next_cursor": next_cursor, "has_more": has_more}
+
+
+def iter_keyset(queryset, chunk_size=ITERATOR_CHUNK_SIZE, key="id"):
+    """
+    Recorre el queryset completo en bloques keyset de `chunk_size` filas.
+
+    MySQL no tiene cursores del lado del servidor en Django: `iterator()` por sí
+    solo deja que el driver cargue todo el resultado en memoria. Acotando cada
+    consulta con LIMIT, el consumo queda fijo en un bloque.
+    """
+    qs = queryset.order_by(key)
+    last = None
+    while True:
+        chunk = qs if last is None else qs.filter(**{f"{key}__gt": last})
+        count = 0
+        for obj in chunk[:chunk_size].iterator(chunk_size=chunk_size):
+            count += 1
+            last = _key_of(obj, key)
+            yield obj
+        if count < chunk_size:
+            return
@@ -0,0 +1,137 @@
+"""
+Paginación numerada sin COUNT(*) exacto sobre tablas grandes.
+
+- Listados sin filtros: en MySQL se usa la estimación de filas de InnoDB
+  (information_schema.TABLES.TABLE_ROWS), que no recorre el índice. Puede
+  quedarse corta: se toma como mínimo y, al pedir la última página estimada o
+  una posterior, se lee esa página más una fila para saber si hay más.
+- Listados filtrados (o tablas pequeñas): se cuenta hasta un tope con
+  `SELECT COUNT(*) FROM (... LIMIT tope + 1)`. Si se supera, el total se
+  informa como aproximado y el tope crece solo cuando el cliente pide páginas
+  más allá de él.
+
+`EstimatedCountPaginator` reemplaza a django.core.paginator.Paginator (admin);
+`EstimatedCountPagination` es la clase de paginación de DRF.
+"""
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models.query import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+# Filas contadas como máximo en listados filtrados
+COUNT_CAP = 10000
+# Por debajo de esta estimación se cuenta igual (la estimación es poco fiable en tablas chicas)
+ESTIMATE_MIN_ROWS = 10000
+
+
+def estimated_table_rows(model, using):
+    """Filas estimadas por MySQL para la tabla del modelo, o None si no aplica"""
+    connection = connections[using]
+    if connection.vendor != "mysql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None else None
+
+
+def is_unfiltered(queryset):
+    """True si el queryset devuelve todas las filas de la tabla (joins de select_related aparte)"""
+    query = queryset.query
+    return not (
+        query.where or query.distinct or query.is_sliced or query.combinator
+        or query.group_by is not None or query.extra
+    )
+
+
+class EstimatedCountPaginator(Paginator):
+    count_cap = COUNT_CAP
+    estimate_min_rows = ESTIMATE_MIN_ROWS
+
+    def __init__(self, *args, count_cap=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if count_cap is not None:
+            self.count_cap = count_cap
+        # False cuando `count` es una estimación o un tope
+        self.count_is_exact = True
+        self._capped = False
+        self._estimated = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return super().count
+
+        if is_unfiltered(queryset):
+            estimate = estimated_table_rows(queryset.model, queryset.db)
+            if estimate is not None and estimate >= self.estimate_min_rows:
+                self.count_is_exact = False
+                self._estimated = True
+                return estimate
+        return self._capped_count(self.count_cap)
+
+    def _capped_count(self, cap):
+        counted = self.object_list.order_by()[:cap + 1].count()
+        self._capped = counted > cap
+        self.count_is_exact = not self._capped
+        return cap if self._capped else counted
+
+    def _set_count(self, count):
+        self.__dict__["count"] = count
+        self.__dict__.pop("num_pages", None)
+
+    def _probe_count(self, number):
+        """
+        Total según la página `number` más una fila: si la fila extra existe hay
+        más páginas (num_pages pasa a number + 1, has_next() es True); si no,
+        el total queda exacto.
+        """
+        offset = (number - 1) * self.per_page
+        found = len(self.object_list[offset:offset + self.per_page + 1])
+        if found == 0 and number > 1:
+            # La estimación se pasó: el total real es como mucho `offset`
+            self._set_count(min(self.count, offset))
+            return
+        self.count_is_exact = found <= self.per_page
+        self._set_count(offset + found)
+
+    def validate_number(self, number):
+        try:
+            wanted = int(number)
+        except (TypeError, ValueError):
+            wanted = None
+        if wanted is not None and wanted >= 1 and self.count:
+            if self._estimated and wanted >= self.num_pages:
+                self._probe_count(wanted)
+            elif self._capped and (wanted + 1) * self.per_page > self.count_cap:
+                # Se cuenta una página más allá de la pedida para que has_next() sea correcto
+                self.count_cap = (wanted + 1) * self.per_page
+                self._set_count(self._capped_count(self.count_cap))
+        return super().validate_number(number)
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """PageNumberPagination con total estimado; la respuesta indica si es exacto"""
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data["count_is_exact"] = self.page.paginator.count_is_exact
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_exact"] = {"type": "boolean", "example": True}
+        return response_schema
+
+
+class EstimatedCountAdminMixin:
+    """Para ModelAdmin: paginador estimado y sin el segundo COUNT(*) del total sin filtros"""
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
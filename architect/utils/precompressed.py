@@ -0,0 +1,71 @@
+"""
+Documentos JSON que se sirven ya serializados y comprimidos.
+
+`PrecompressedDocument` guarda el cuerpo en identity, gzip y brotli (si está
+instalado) una sola vez; `precompressed_response` elige la codificación según
+Accept-Encoding, responde 304 si el ETag coincide y, con ?v=<versión> vigente,
+marca la respuesta como inmutable.
+"""
+import gzip
+
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from architect.storage import IMMUTABLE_CACHE_CONTROL
+
+try:
+    import brotli
+except ImportError:  # brotli es opcional: sin él solo se ofrece gzip
+    brotli = None
+
+
+class PrecompressedDocument:
+    """
+    Cuerpo `identity` (bytes) en cada codificación disponible. `version` no
+    debe contener "-": el ETag de cada codificación es "<version>-<codificación>".
+    """
+
+    def __init__(self, identity, version):
+        self.version = version
+        self.identity = identity
+        self.encodings = {"gzip": gzip.compress(identity, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.encodings["br"] = brotli.compress(identity, quality=11)
+
+    def body(self, accept_encoding):
+        """(contenido, Content-Encoding o None) según Accept-Encoding"""
+        accepted = {part.split(";")[0].strip().lower() for part in (accept_encoding or "").split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in self.encodings:
+                return self.encodings[encoding], encoding
+        return self.identity, None
+
+
+def etag_matches(header, version):
+    """If-None-Match contiene la versión (en cualquier codificación)"""
+    for tag in (header or "").split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.strip('"').split("-")[0] == version:
+            return True
+    return False
+
+
+def precompressed_response(request, document, cache_control):
+    """Respuesta GET/HEAD para `document`, con ETag por codificación y 304"""
+    content, encoding = document.body(request.META.get("HTTP_ACCEPT_ENCODING"))
+
+    if etag_matches(request.META.get("HTTP_IF_NONE_MATCH"), document.version):
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(content, content_type="application/json; charset=utf-8")
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+    # Un ETag distinto por codificación: son representaciones distintas
+    response["ETag"] = f'"{document.version}-{encoding}"' if encoding else f'"{document.version}"'
+    if request.GET.get("v") == document.version:
+        response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    else:
+        response["Cache-Control"] = cache_control
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
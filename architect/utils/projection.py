@@ -0,0 +1,195 @@
+"""
+Proyecciones: representación JSON de filas declarada una sola vez.
+
+Una `Projection` declara, por cada clave de la respuesta, qué columnas necesita
+(incluidas columnas de tablas unidas, p. ej. `region__name`). A partir de eso:
+
+- `values(queryset, fields)` arma un `.values()` solo con esas columnas: no se
+  instancian modelos ni objetos relacionados, el join lo resuelve la consulta.
+- `compile(fields, **contexto)` devuelve una función fila -> dict ya armada
+  para esas claves (se guarda por combinación de claves y contexto).
+
+    BRAND = Projection(
+        id=Column("id"),
+        name=Column("name"),
+        country=Related("country"),
+        created_at=Column("created_at", isoformat),
+    )
+    to_dict = BRAND.compile()
+    data = [to_dict(row) for row in BRAND.values(Brand.objects.all())]
+
+La proyección se comporta como un mapeo de sus claves, así que sirve como
+`spec` de `parse_fields` (?fields=).
+"""
+from functools import partial
+from operator import itemgetter
+
+from rest_framework.response import Response
+
+# Combinaciones de campos compiladas que se guardan por proyección
+MAX_COMPILED = 256
+
+
+def isoformat(value):
+    return value.isoformat() if value else None
+
+
+def drf_datetime(value):
+    """Mismo formato que rest_framework.fields.DateTimeField (UTC como 'Z')"""
+    if value is None:
+        return None
+    value = value.isoformat()
+    return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+
+class Column:
+    """Valor de una columna, opcionalmente convertido"""
+
+    def __init__(self, column, convert=None):
+        self.columns = (column,)
+        self.column = column
+        self.convert = convert
+
+    def getter(self, context):
+        column, convert = self.column, self.convert
+        if convert is None:
+            return itemgetter(column)
+        return lambda row: convert(row[column])
+
+
+class Related:
+    """
+    {"id", "name"} de una FK; None si la FK es nula. El nombre se lee del join,
+    o con `lookup(pk)` (un catálogo en memoria) para no unir la tabla.
+    """
+
+    def __init__(self, fk, name_field="name", lookup=None):
+        self.lookup = lookup
+        self.columns = (fk,) if lookup else (fk, f"{fk}__{name_field}")
+
+    def getter(self, context):
+        if self.lookup:
+            id_column, lookup = self.columns[0], self.lookup
+
+            def get(row):
+                pk = row[id_column]
+                return {"id": pk, "name": lookup(pk)} if pk is not None else None
+            return get
+
+        id_column, name_column = self.columns
+
+        def get(row):
+            pk = row[id_column]
+            return {"id": pk, "name": row[name_column]} if pk is not None else None
+        return get
+
+
+class Nested:
+    """Objeto anidado descrito por otra Projection sobre la FK `fk`; None si es nula"""
+
+    def __init__(self, fk, projection):
+        self.fk = fk
+        self.projection = projection
+        self.columns = (fk,) + tuple(f"{fk}__{c}" for c in projection.columns(keys=()))
+
+    def getter(self, context):
+        fk = self.fk
+        prefix = f"{fk}__"
+        inner = self.projection.compile(**context)
+        columns = self.columns[1:]
+        # La proyección interna lee sus columnas sin el prefijo de la FK
+        renames = [(c, c[len(prefix):]) for c in columns]
+
+        def get(row):
+            if row[fk] is None:
+                return None
+            return inner({short: row[full] for full, short in renames})
+        return get
+
+
+class Computed:
+    """Valor calculado a partir de varias columnas: func(fila, **contexto)"""
+
+    def __init__(self, columns, func):
+        self.columns = tuple(columns)
+        self.func = func
+
+    def getter(self, context):
+        return partial(self.func, **context) if context else self.func
+
+
+class Projection:
+
+    def __init__(self, **spec):
+        # El orden de declaración es el orden de las claves en la respuesta
+        self.spec = spec
+        self._compiled = {}
+
+    def __iter__(self):
+        return iter(self.spec)
+
+    def __contains__(self, key):
+        return key in self.spec
+
+    def __len__(self):
+        return len(self.spec)
+
+    def columns(self, fields=None, keys=("id",)):
+        """Columnas para .values(): las de `fields` (todas si es None) más `keys`"""
+        columns = dict.fromkeys(keys)
+        for key in fields or self.spec:
+            columns.update(dict.fromkeys(self.spec[key].columns))
+        return list(columns)
+
+    def values(self, queryset, fields=None, keys=("id",)):
+        """
+        `queryset.values()` con las columnas de `fields`. `keys` agrega columnas
+        que no van en la respuesta pero se necesitan (claves de paginación).
+        """
+        return queryset.values(*self.columns(fields, keys))
+
+    def compile(self, fields=None, **context):
+        """
+        Función fila -> dict para `fields`; el contexto llega a los Computed.
+        Las claves salen en el orden declarado, no en el pedido: así cada
+        conjunto de campos se compila una sola vez (el orden de ?fields= no
+        agrega entradas a la caché).
+        """
+        selected = frozenset(fields) if fields else None
+        cache_key = (selected, tuple(sorted(context.items())))
+        to_dict = self._compiled.get(cache_key)
+        if to_dict is None:
+            keys = [key for key in self.spec if key in selected] if selected else list(self.spec)
+            getters = [(key, self.spec[key].getter(context)) for key in keys]
+
+            def to_dict(row):
+                return {key: get(row) for key, get in getters}
+            if len(self._compiled) >= MAX_COMPILED:
+                # Aun por conjunto las combinaciones son muchas: la caché no crece sin tope
+                self._compiled.clear()
+            self._compiled[cache_key] = to_dict
+        return to_dict
+
+
+class ProjectionListMixin:
+    """
+    Para ViewSets de DRF: list() responde con `projection` sobre filas .values(),
+    sin instanciar modelos ni pasar por el serializer. Respeta filtros y paginación.
+    """
+    projection = None
+
+    def get_projection_fields(self):
+        return None
+
+    def get_projection_context(self):
+        return {}
+
+    def list(self, request, *args, **kwargs):
+        fields = self.get_projection_fields()
+        rows = self.projection.values(self.filter_queryset(self.get_queryset()), fields)
+        to_dict = self.projection.compile(fields, **self.get_projection_context())
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response([to_dict(row) for row in page])
+        return Response([to_dict(row) for row in rows])
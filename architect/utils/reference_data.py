@@ -0,0 +1,122 @@
+"""
+Caché en memoria de los datos de referencia (catálogos que casi nunca cambian).
+
+Cada worker carga la tabla completa una sola vez. Las señales post_save /
+post_delete publican una nueva versión en la caché compartida (CACHES['default'])
+al confirmar la transacción; antes de servir, cada proceso compara su versión
+local con la compartida y recarga la tabla si otro proceso la modificó.
+
+Con LocMemCache la versión no se comparte entre procesos, por eso además cada
+tabla se recarga como máximo cada REFERENCE_DATA_TTL segundos.
+"""
+import threading
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+REFERENCE_MODELS = [
+    "app_types.DocumentType",
+    "app_types.PaymentType",
+    "app_types.PaymentStatus",
+    "architect.Role",
+    "ubi_geo.Country",
+    "ubi_geo.Region",
+    "ubi_geo.Province",
+    "ubi_geo.District",
+]
+
+VERSION_KEY = "refdata:version:{}"
+
+_lock = threading.Lock()
+# label -> (versión, cargado_en, {pk: instancia})
+_tables = {}
+
+# Valores derivados de varias tablas (ver derived); lock propio porque build()
+# puede volver a llamar a table()
+_derived_lock = threading.Lock()
+# clave -> (tablas usadas, valor)
+_derived = {}
+
+
+def _ttl():
+    return getattr(settings, "REFERENCE_DATA_TTL", 300)
+
+
+def _label(model):
+    return model._meta.label_lower
+
+
+def get_version(model):
+    """Versión compartida de la tabla; se inicializa si la caché no la tiene"""
+    key = VERSION_KEY.format(_label(model))
+    version = cache.get(key)
+    if version is None:
+        # add() no pisa la versión si otro proceso la creó primero
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(model):
+    """Publica una versión nueva: todos los procesos recargan la tabla en su próximo acceso"""
+    cache.set(VERSION_KEY.format(_label(model)), time.time_ns(), timeout=None)
+
+
+def table(model):
+    """Diccionario {pk: instancia} con todas las filas de la tabla"""
+    label = _label(model)
+    version = get_version(model)
+    entry = _tables.get(label)
+    if entry is None or entry[0] != version or time.monotonic() - entry[1] > _ttl():
+        with _lock:
+            entry = _tables.get(label)
+            if entry is None or entry[0] != version or time.monotonic() - entry[1] > _ttl():
+                rows = {obj.pk: obj for obj in model._default_manager.all()}
+                entry = (version, time.monotonic(), rows)
+                _tables[label] = entry
+    return entry[2]
+
+
+def _same_tables(a, b):
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+def derived(key, models, build):
+    """
+    Valor calculado con build(*tablas) a partir de las tablas de `models`.
+    Se guarda por proceso y se recalcula solo cuando alguna de esas tablas se
+    recarga (table() entrega un diccionario nuevo en cada recarga).
+    """
+    tables = tuple(table(model) for model in models)
+    entry = _derived.get(key)
+    if entry is None or not _same_tables(entry[0], tables):
+        with _derived_lock:
+            entry = _derived.get(key)
+            if entry is None or not _same_tables(entry[0], tables):
+                entry = (tables, build(*tables))
+                _derived[key] = entry
+    return entry[1]
+
+
+def get(model, pk):
+    """Instancia con ese pk o None (también si el pk no es un entero válido)"""
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        return None
+    return table(model).get(pk)
+
+
+def _on_change(sender, **kwargs):
+    transaction.on_commit(lambda: bump_version(sender))
+
+
+def connect_signals():
+    for label in REFERENCE_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(_on_change, sender=model, dispatch_uid=f"refdata_save_{label}")
+        post_delete.connect(_on_change, sender=model, dispatch_uid=f"refdata_delete_{label}")
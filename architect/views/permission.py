@@ -4,24 +4,36 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from ..serializers.permission import PermissionSerializer, RoleSerializer
 from ..models.permission import Permission, Role
+from ..utils.pagination import InvalidCursor, paginate, wants_page
+
+
+def _list_response(request, queryset, serializer_class):
+    """
+    Lista completa, o con ?cursor=/?limit= una página keyset por id:
+    {"results": [...], "next_cursor": ..., "has_more": ...}
+    """
+    if not wants_page(request.query_params):
+        return Response(serializer_class(queryset, many=True).data, status=status.HTTP_200_OK)
+    try:
+        items, page = paginate(request.query_params, queryset)
+    except InvalidCursor as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    data = serializer_class(items, many=True).data
+    return Response({"results": data, **page}, status=status.HTTP_200_OK)
 
 
 class PermissionView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        permissions = Permission.objects.all()
-        serializer = PermissionSerializer(permissions, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return _list_response(request, Permission.objects.all(), PermissionSerializer)
 
 
 class RoleView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        roles = Role.objects.all()
-        serializer = RoleSerializer(roles, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return _list_response(request, Role.objects.all(), RoleSerializer)
 
     def post(self, request):
         serializer = RoleSerializer(data=request.data)
@@ -6,6 +6,7 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
 from ..serializers.user import UserSerializer
+from ..utils.xlsx_export import Column, export_filename, xlsx_response
 
 User = get_user_model()
 
@@ -185,6 +186,36 @@ class UserView(APIView):
 
 
 
+class UserExportView(APIView):
+    """
+    Exporta los usuarios a XLSX (mismas filas que el listado de UserView).
+    No incluye contraseñas ni tokens.
+    """
+    permission_classes = [IsAuthenticated]
+
+    columns = [
+        Column("ID", lambda u: u.id, 8),
+        Column("Nombres", lambda u: u.name, 20),
+        Column("Apellido Paterno", lambda u: u.paternal_lastname, 20),
+        Column("Apellido Materno", lambda u: u.maternal_lastname, 20),
+        Column("Usuario", lambda u: u.user_name, 18),
+        Column("Correo", lambda u: u.email, 30),
+        Column("Tipo de Documento", lambda u: u.document_type.name if u.document_type else None, 18),
+        Column("Número de Documento", lambda u: u.document_number, 18),
+        Column("Sexo", lambda u: u.get_sex_display() if u.sex else None, 12),
+        Column("Teléfono", lambda u: u.phone, 15),
+        Column("País", lambda u: u.country.name if u.country else None, 15),
+        Column("Estado", lambda u: u.get_account_statement_display() if u.account_statement else None, 10),
+        Column("Activo", lambda u: u.is_active, 8),
+        Column("Último Acceso", lambda u: u.last_login, 18),
+        Column("Fecha de Creación", lambda u: u.created_at, 18),
+    ]
+
+    def get(self, request):
+        users = User.objects.select_related("document_type", "country")
+        return xlsx_response(users, self.columns, export_filename("usuarios"), sheet_name="Usuarios")
+
+
 class UserPhotoUploadView(APIView):
     """
     Vista para subir fotos de perfil de usuarios.
@@ -258,17 +289,19 @@ class UserPhotoUploadView(APIView):
             if image.size > 5 * 1024 * 1024:
                 return Response({'error': 'La imagen no puede ser mayor a 5MB'}, status=status.HTTP_400_BAD_REQUEST)
             
-            # Eliminar foto anterior si existe
-            if user.photo_url:
-                try:
-                    user.photo_url.delete(save=False)
-                except:
-                    pass  # Si no se puede eliminar, continuar
+            old_name = user.photo_url.name
             
             # Guardar la nueva imagen
             user.photo_url = image
             user.save(update_fields=['photo_url'])
             
+            # Eliminar foto anterior si ya nadie la usa (el storage deduplica por contenido)
+            if old_name and old_name != user.photo_url.name:
+                try:
+                    user.photo_url.storage.delete(old_name)
+                except OSError:
+                    pass  # Si no se puede eliminar, continuar
+            
             return Response({
                 'message': 'Foto de perfil actualizada exitosamente',
                 'id': user.id,
@@ -304,10 +337,11 @@ class UserPhotoUploadView(APIView):
             if not user.photo_url:
                 return Response({'error': 'El usuario no tiene foto de perfil'}, status=status.HTTP_404_NOT_FOUND)
             
-            # Eliminar la foto
-            user.photo_url.delete(save=False)
+            # Eliminar la foto (el archivo solo se borra si ningún otro registro lo usa)
+            storage, old_name = user.photo_url.storage, user.photo_url.name
             user.photo_url = None
             user.save(update_fields=['photo_url'])
+            storage.delete(old_name)
             
             return Response({
                 'message': 'Foto de perfil eliminada exitosamente',
@@ -2,11 +2,12 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
+from architect.utils.paginators import EstimatedCountAdminMixin
 from .models.employee import Employees
 
 
 @admin.register(Employees)
-class EmployeesAdmin(admin.ModelAdmin):
+class EmployeesAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = [
         'id',
         'get_full_name_display',
@@ -123,17 +124,13 @@ class EmployeesAdmin(admin.ModelAdmin):
     get_full_name_display.admin_order_field = 'name'
     
     def get_location_display(self, obj):
-        """Muestra la ubicación del empleado"""
-        location_parts = []
-        if obj.region:
-            location_parts.append(obj.region.name)
-        if obj.province:
-            location_parts.append(obj.province.name)
+        """Muestra la ubicación del empleado (full_path del nivel más específico)"""
         if obj.district:
-            location_parts.append(obj.district.name)
-        
-        if location_parts:
-            return " → ".join(location_parts)
+            return obj.district.full_path or obj.district.name
+        if obj.province:
+            return obj.province.full_path or obj.province.name
+        if obj.region:
+            return obj.region.name
         return "Sin ubicación"
     get_location_display.short_description = "Ubicación"
     get_location_display.admin_order_field = 'region__name'
@@ -0,0 +1,268 @@
+"""
+Indicadores de personal sobre una instantánea columnar (NumPy) de employees.
+
+Cada proceso mantiene un arreglo por columna (id, región, provincia, rol, sexo,
+fecha de nacimiento, salario numérico). Los indicadores se calculan con
+operaciones vectorizadas sobre esos arreglos, sin instanciar modelos.
+
+La instantánea se actualiza de forma incremental: en cada acceso se consulta
+max(updated_at) de employees y max(deleted_at) de employee_tombstones (ambos por
+índice); si avanzaron, solo se leen las filas cambiadas y las eliminaciones
+nuevas. Cada SNAPSHOT_TTL segundos se reconstruye completa.
+"""
+import threading
+import time
+
+import numpy as np
+from django.db.models import Max
+from django.utils import timezone
+
+from architect.models.permission import Role
+from architect.utils import reference_data
+from ubi_geo.models import Region, Province
+from .models import Employees, EmployeeTombstone
+from .services.sync_service import SYNC_LAG
+
+SNAPSHOT_TTL = 300
+CHUNK_SIZE = 5000
+
+GENDER_CODES = {"M": 1, "F": 2, "O": 3}
+# código -> (valor de Employees.gender, etiqueta)
+GENDER_LABELS = {0: (None, "Sin dato"), 1: ("M", "Masculino"), 2: ("F", "Femenino"), 3: ("O", "Otro")}
+
+# Límites inferiores de cada tramo de edad
+AGE_BANDS = (0, 25, 35, 45, 55, 65)
+AGE_BAND_LABELS = ("<25", "25-34", "35-44", "45-54", "55-64", "65+")
+PERCENTILES = (10, 25, 50, 75, 90)
+
+_COLUMNS = ("id", "region_id", "province_id", "rol_id", "gender", "birth_date", "salary_amount")
+
+
+class EmployeeSnapshot:
+    """Arreglos paralelos ordenados por id"""
+
+    def __init__(self):
+        self.ids = np.empty(0, dtype=np.int64)
+        self.region = np.empty(0, dtype=np.int64)
+        self.province = np.empty(0, dtype=np.int64)
+        self.rol = np.empty(0, dtype=np.int64)
+        self.gender = np.empty(0, dtype=np.int8)
+        # Fecha de nacimiento como año y mes*100+día (0 = sin dato)
+        self.birth_year = np.empty(0, dtype=np.int32)
+        self.birth_mmdd = np.empty(0, dtype=np.int32)
+        self.salary = np.empty(0, dtype=np.float64)  # NaN = sin dato
+        self.updated_mark = None
+        self.deleted_mark = None
+        self.built_at = 0.0
+
+    def __len__(self):
+        return len(self.ids)
+
+    @staticmethod
+    def _to_arrays(rows):
+        n = len(rows)
+        ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=n)
+        region = np.fromiter((r[1] or 0 for r in rows), dtype=np.int64, count=n)
+        province = np.fromiter((r[2] or 0 for r in rows), dtype=np.int64, count=n)
+        rol = np.fromiter((r[3] or 0 for r in rows), dtype=np.int64, count=n)
+        gender = np.fromiter((GENDER_CODES.get(r[4], 0) for r in rows), dtype=np.int8, count=n)
+        birth_year = np.fromiter((r[5].year if r[5] else 0 for r in rows), dtype=np.int32, count=n)
+        birth_mmdd = np.fromiter(
+            (r[5].month * 100 + r[5].day if r[5] else 0 for r in rows), dtype=np.int32, count=n
+        )
+        salary = np.fromiter(
+            (float(r[6]) if r[6] is not None else np.nan for r in rows), dtype=np.float64, count=n
+        )
+        return ids, region, province, rol, gender, birth_year, birth_mmdd, salary
+
+    def _columns(self):
+        return [self.ids, self.region, self.province, self.rol, self.gender,
+                self.birth_year, self.birth_mmdd, self.salary]
+
+    def _set_columns(self, columns):
+        (self.ids, self.region, self.province, self.rol, self.gender,
+         self.birth_year, self.birth_mmdd, self.salary) = columns
+
+    def rebuild(self):
+        """Carga completa, por bloques keyset para acotar la memoria del driver"""
+        marks = _current_marks()
+        parts = []
+        last_id = 0
+        qs = Employees.objects.order_by("id").values_list(*_COLUMNS)
+        while True:
+            rows = list(qs.filter(id__gt=last_id)[:CHUNK_SIZE])
+            if not rows:
+                break
+            parts.append(self._to_arrays(rows))
+            last_id = rows[-1][0]
+            if len(rows) < CHUNK_SIZE:
+                break
+        if parts:
+            self._set_columns([np.concatenate(col) for col in zip(*parts)])
+        else:
+            self._set_columns([col[:0] for col in self._columns()])
+        self.updated_mark, self.deleted_mark = marks
+        self.built_at = time.monotonic()
+
+    def _upsert(self, rows):
+        if not rows:
+            return
+        new = self._to_arrays(rows)
+        columns = self._columns()
+        positions = np.searchsorted(self.ids, new[0])
+        found = np.zeros(len(new[0]), dtype=bool)
+        if len(self.ids):
+            in_range = positions < len(self.ids)
+            found[in_range] = self.ids[positions[in_range]] == new[0][in_range]
+
+        # Filas existentes: se sobrescriben en su posición
+        for col, values in zip(columns, new):
+            col[positions[found]] = values[found]
+
+        # Filas nuevas: se insertan manteniendo el orden por id
+        if (~found).any():
+            merged = [np.concatenate([col, values[~found]]) for col, values in zip(columns, new)]
+            order = np.argsort(merged[0], kind="stable")
+            columns = [col[order] for col in merged]
+        self._set_columns(columns)
+
+    def _remove(self, ids):
+        if not ids or not len(self.ids):
+            return
+        keep = ~np.isin(self.ids, np.asarray(ids, dtype=np.int64))
+        self._set_columns([col[keep] for col in self._columns()])
+
+    def refresh(self):
+        """Aplica los cambios posteriores a las marcas; reconstruye si venció el TTL"""
+        expired = not self.built_at or time.monotonic() - self.built_at > SNAPSHOT_TTL
+        if expired or self.updated_mark is None:
+            self.rebuild()
+            return
+
+        updated_mark, deleted_mark = _current_marks()
+        if updated_mark != self.updated_mark:
+            # Margen hacia atrás: filas confirmadas tarde con un updated_at anterior
+            since = self.updated_mark - SYNC_LAG
+            rows = list(
+                Employees.objects.filter(updated_at__gte=since).order_by("id").values_list(*_COLUMNS)
+            )
+            self._upsert(rows)
+            self.updated_mark = updated_mark
+        if deleted_mark != self.deleted_mark:
+            qs = EmployeeTombstone.objects.all()
+            if self.deleted_mark is not None:
+                qs = qs.filter(deleted_at__gte=self.deleted_mark - SYNC_LAG)
+            self._remove(list(qs.values_list("employee_id", flat=True)))
+            self.deleted_mark = deleted_mark
+
+    def mask(self, region=None, province=None, rol=None, gender=None):
+        """Filtro booleano por ids de región/provincia/rol y código de sexo"""
+        mask = np.ones(len(self.ids), dtype=bool)
+        if region:
+            mask &= self.region == int(region)
+        if province:
+            mask &= self.province == int(province)
+        if rol:
+            mask &= self.rol == int(rol)
+        if gender:
+            mask &= self.gender == GENDER_CODES.get(gender, -1)
+        return mask
+
+    def ages(self, mask, today=None):
+        """Edad exacta en años de las filas con fecha de nacimiento"""
+        today = today or timezone.localdate()
+        has_birth = mask & (self.birth_year > 0)
+        years = today.year - self.birth_year[has_birth]
+        birthday_pending = self.birth_mmdd[has_birth] > today.month * 100 + today.day
+        return years - birthday_pending.astype(np.int32)
+
+
+def _current_marks():
+    return (
+        Employees.objects.aggregate(m=Max("updated_at"))["m"],
+        EmployeeTombstone.objects.aggregate(m=Max("deleted_at"))["m"],
+    )
+
+
+# Una instantánea por proceso; el lock cubre la actualización y el cálculo
+_lock = threading.Lock()
+_snapshot = EmployeeSnapshot()
+
+
+def _catalog_label(model):
+    catalog = reference_data.table(model)
+
+    def label(value):
+        obj = catalog.get(value)
+        return value or None, obj.name if obj is not None else None
+    return label
+
+
+def _counts_by(codes, label):
+    """[{id, name, count}] ordenado por cantidad descendente"""
+    values, counts = np.unique(codes, return_counts=True)
+    result = []
+    for value, count in zip(values.tolist(), counts.tolist()):
+        key, name = label(value)
+        result.append({"id": key, "name": name, "count": count})
+    result.sort(key=lambda item: -item["count"])
+    return result
+
+
+def _salary_stats(values):
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return {"count": 0}
+    quantiles = np.percentile(values, PERCENTILES)
+    return {
+        "count": int(len(values)),
+        "min": round(float(values.min()), 2),
+        "max": round(float(values.max()), 2),
+        "mean": round(float(values.mean()), 2),
+        "percentiles": {f"p{p}": round(float(q), 2) for p, q in zip(PERCENTILES, quantiles)},
+    }
+
+
+def workforce_summary(region=None, province=None, rol=None, gender=None):
+    """Dotación por región/provincia/rol/sexo, tramos de edad y percentiles de salario"""
+    with _lock:
+        _snapshot.refresh()
+        return _summarize(_snapshot, region, province, rol, gender)
+
+
+def _summarize(snapshot, region, province, rol, gender):
+    mask = snapshot.mask(region=region, province=province, rol=rol, gender=gender)
+
+    ages = snapshot.ages(mask)
+    band_index = np.digitize(ages, AGE_BANDS) - 1
+    band_counts = np.bincount(band_index[band_index >= 0], minlength=len(AGE_BANDS))
+
+    salary = snapshot.salary[mask]
+    roles = snapshot.rol[mask]
+    salary_by_rol = []
+    for rol_id in np.unique(roles).tolist():
+        obj = reference_data.get(Role, rol_id) if rol_id else None
+        stats = _salary_stats(salary[roles == rol_id])
+        if stats["count"]:
+            salary_by_rol.append({"id": rol_id or None, "name": obj.name if obj else None, **stats})
+
+    return {
+        "headcount": int(mask.sum()),
+        "by_region": _counts_by(snapshot.region[mask], _catalog_label(Region)),
+        "by_province": _counts_by(snapshot.province[mask], _catalog_label(Province)),
+        "by_rol": _counts_by(roles, _catalog_label(Role)),
+        "by_gender": _counts_by(snapshot.gender[mask], GENDER_LABELS.__getitem__),
+        "age_bands": {
+            "without_birth_date": int(mask.sum() - len(ages)),
+            "bands": [
+                {"band": label, "count": int(count)}
+                for label, count in zip(AGE_BAND_LABELS, band_counts.tolist())
+            ],
+        },
+        "salary": _salary_stats(salary),
+        "salary_by_rol": salary_by_rol,
+        "snapshot": {
+            "rows": len(snapshot),
+            "updated_at": snapshot.updated_mark.isoformat() if snapshot.updated_mark else None,
+        },
+    }
@@ -1,5 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, post_delete
 
 class EmployeesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'employees'
+
+    def ready(self):
+        from .search import ensure_fulltext_index
+        post_migrate.connect(ensure_fulltext_index, sender=self, dispatch_uid="employees_fulltext_index")
+
+        from .models import Employees
+        from .services.sync_service import record_deletion
+        post_delete.connect(record_deletion, sender=Employees, dispatch_uid="employees_tombstone")
+
+        from architect.storage import register_references
+        from .tasks import referenced_variant_names
+        register_references(referenced_variant_names)
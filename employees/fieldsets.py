@@ -0,0 +1,94 @@
+"""
+Selección de campos (?fields=) para las respuestas de empleados.
+
+Cada clave de la respuesta declara qué columnas necesita (para `.only()`) y qué
+relaciones (para `select_related`). Pedir `?fields=id,full_name` lee solo
+id/nombres de la tabla, sin joins, y el serializador solo arma esas claves.
+"""
+
+
+class InvalidFields(ValueError):
+    """?fields= contiene claves desconocidas."""
+
+
+_NAMES = ("name", "last_name_paternal", "last_name_maternal")
+
+
+def _catalog(name):
+    """Objeto {id, name}: basta la FK y el nombre del catálogo"""
+    return ((name, f"{name}__name"), (name,))
+
+
+# clave -> (columnas para only(), rutas para select_related)
+# Base de SERIALIZER_FIELDS; las vistas de función usan employees.projections
+EMPLOYEE_FIELDS = {
+    "id": (("id",), ()),
+    "name": (("name",), ()),
+    "last_name_paternal": (("last_name_paternal",), ()),
+    "last_name_maternal": (("last_name_maternal",), ()),
+    "full_name": (_NAMES, ()),
+    "document_type": _catalog("document_type"),
+    "document_number": (("document_number",), ()),
+    "email": (("email",), ()),
+    "gender": (("gender",), ()),
+    "phone": (("phone",), ()),
+    "birth_date": (("birth_date",), ()),
+    "region": _catalog("region"),
+    "province": _catalog("province"),
+    "district": _catalog("district"),
+    "rol": _catalog("rol"),
+    "salary": (("salary",), ()),
+    "address": (("address",), ()),
+    "photo_url": (("photo", "photo_variants"), ()),
+    "photo_original_url": (("photo",), ()),
+    "photo_variants": (("photo", "photo_variants"), ()),
+    "created_at": (("created_at",), ()),
+    "updated_at": (("updated_at",), ()),
+}
+
+# EmployeeSerializer: region/province/district usan los serializers completos de
+# ubi_geo; los nombres (también los de los padres) salen de ubi_geo.registry
+SERIALIZER_FIELDS = {
+    **EMPLOYEE_FIELDS,
+    "region": (("region",), ("region",)),
+    "province": (("province",), ("province",)),
+    "district": (("district",), ("district",)),
+    "region_name": (("region",), ()),
+    "province_name": (("province",), ()),
+    "district_name": (("district",), ()),
+}
+
+
+def parse_fields(value, spec):
+    """
+    Lista ordenada y sin duplicados de las claves pedidas, o None si no se pidió
+    ninguna (respuesta completa). Lanza InvalidFields con claves desconocidas.
+    """
+    if not value:
+        return None
+    fields = list(dict.fromkeys(f.strip() for f in value.split(",") if f.strip()))
+    if not fields:
+        return None
+    unknown = [f for f in fields if f not in spec]
+    if unknown:
+        raise InvalidFields(
+            f"Campos no válidos: {', '.join(unknown)}. Disponibles: {', '.join(spec)}"
+        )
+    return fields
+
+
+def apply_fields(queryset, fields, spec):
+    """Restringe columnas y joins del queryset a lo que necesitan `fields`"""
+    if not fields:
+        return queryset
+    columns = {"id"}
+    related = set()
+    for field in fields:
+        field_columns, field_related = spec[field]
+        columns.update(field_columns)
+        related.update(field_related)
+
+    queryset = queryset.select_related(None)
+    if related:
+        queryset = queryset.select_related(*sorted(related))
+    return queryset.only(*sorted(columns))
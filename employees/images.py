@@ -0,0 +1,57 @@
+"""
+Normalización de fotos de empleados con Pillow.
+
+A partir del original se generan variantes de tamaño fijo en WebP y JPEG:
+orientadas según EXIF (auto-orient) y guardadas sin metadatos, de modo que la
+ubicación GPS u otros datos de la cámara no se publican.
+"""
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+# variante -> (ancho, alto, recortar al tamaño exacto)
+PHOTO_VARIANTS = {
+    "thumb": (160, 160, True),
+    "medium": (640, 640, False),
+}
+
+# formato -> (extensión, formato de Pillow, opciones de guardado)
+PHOTO_FORMATS = {
+    "webp": ("webp", "WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("jpg", "JPEG", {"quality": 85, "optimize": True, "progressive": True}),
+}
+
+
+def _to_rgb(img):
+    """Convierte a RGB aplanando la transparencia sobre fondo blanco"""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        return background
+    return img.convert("RGB")
+
+
+def render_variants(fileobj):
+    """
+    Devuelve {variante: {formato: bytes}} para todas las variantes y formatos.
+    Lanza PIL.UnidentifiedImageError / OSError si el archivo no es una imagen válida.
+    """
+    with Image.open(fileobj) as original:
+        img = _to_rgb(ImageOps.exif_transpose(original))
+
+    rendered = {}
+    for variant, (width, height, crop) in PHOTO_VARIANTS.items():
+        if crop:
+            resized = ImageOps.fit(img, (width, height), Image.LANCZOS)
+        else:
+            resized = img.copy()
+            resized.thumbnail((width, height), Image.LANCZOS)
+
+        rendered[variant] = {}
+        for fmt, (_, pil_format, options) in PHOTO_FORMATS.items():
+            buffer = BytesIO()
+            # Sin exif=...: el archivo resultante no lleva metadatos
+            resized.save(buffer, pil_format, **options)
+            rendered[variant][fmt] = buffer.getvalue()
+    return rendered
@@ -0,0 +1,189 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from employees.models import Employees
+from employees.models.employee import DERIVED_FIELDS
+from employees.services import import_service, sync_service
+from employees.services.bulk_service import FK_FIELDS, load_lookup_maps
+
+REQUIRED_COLUMNS = ("email",) + tuple(FK_FIELDS)
+# Columnas de la fila existente que se combinan con los datos del archivo
+EXISTING_COLUMNS = [
+    f.attname for f in Employees._meta.concrete_fields
+    if f.attname not in ("id", "created_at", "updated_at") + DERIVED_FIELDS
+]
+
+
+def _key(value):
+    # email / document_number se comparan sin distinguir mayúsculas, como la collation de MySQL
+    return str(value).strip().lower()
+
+
+def _same(old, new):
+    return old == new or (old in (None, "") and new in (None, ""))
+
+
+def _chunks(rows, size):
+    chunk = []
+    for item in rows:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class Command(BaseCommand):
+    help = ("Importa empleados desde un CSV (';') o XLSX. Inserta o actualiza según "
+            "email / document_number; --dry-run muestra el resultado sin escribir.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", type=str, required=True,
+                            help="Archivo .csv o .xlsx (encabezados: name, email, document_type, region, ...)")
+        parser.add_argument("--delimiter", type=str, default=";",
+                            help="Delimitador del CSV (por defecto: ';')")
+        parser.add_argument("--chunk-size", type=int, default=2000,
+                            help="Filas por bloque de validación y escritura (por defecto: 2000)")
+        parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                            help="Procesos para validar (0 = validar en este proceso)")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="No escribe: informa altas, cambios y errores")
+        parser.add_argument("--show", type=int, default=20,
+                            help="Máximo de errores / diferencias a mostrar (por defecto: 20)")
+
+    def handle(self, *args, **opt):
+        path = Path(opt["path"]).resolve()
+        if not path.exists():
+            raise CommandError(f"No se encontró el archivo: {path}")
+        if opt["chunk_size"] < 1:
+            raise CommandError("--chunk-size debe ser mayor que 0")
+
+        rows = import_service.read_rows(path, delimiter=opt["delimiter"])
+        columns = next(rows, [])
+        missing = [c for c in REQUIRED_COLUMNS if c not in columns]
+        if missing:
+            raise CommandError(f"Faltan columnas obligatorias: {', '.join(missing)}")
+
+        self.dry_run = opt["dry_run"]
+        self.show = opt["show"]
+        self.shown = 0
+        # Solo se sobrescriben las columnas presentes en el archivo
+        self.update_fields = sorted(
+            {FK_FIELDS.get(c, c) for c in columns} | set(DERIVED_FIELDS) | {"updated_at"}
+        )
+        self.seen = {field: {} for field in import_service.UNIQUE_FIELDS}
+        self.totals = dict.fromkeys(("created", "updated", "unchanged", "invalid"), 0)
+
+        self.stdout.write(f"{'Simulando' if self.dry_run else 'Importando'} empleados desde {path}…")
+        start = time.monotonic()
+        maps = load_lookup_maps()
+        chunks = _chunks(rows, opt["chunk_size"])
+
+        if opt["workers"] > 0:
+            with ProcessPoolExecutor(max_workers=opt["workers"], initializer=import_service.init_worker,
+                                     initargs=(maps,)) as pool:
+                # Los bloques se procesan en el orden del archivo, con a lo sumo 2 en vuelo por proceso
+                pending = []
+                for chunk in chunks:
+                    pending.append(pool.submit(import_service.validate_chunk, chunk))
+                    if len(pending) >= opt["workers"] * 2:
+                        self._process(pending.pop(0).result())
+                for future in pending:
+                    self._process(future.result())
+        else:
+            for chunk in chunks:
+                self._process(import_service.validate_chunk(chunk, maps))
+
+        t = self.totals
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Simulación' if self.dry_run else 'Importación'} completada en {time.monotonic() - start:.1f}s ✔  "
+            f"Nuevos: {t['created']} | Actualizados: {t['updated']} | "
+            f"Sin cambios: {t['unchanged']} | Con errores: {t['invalid']}"
+        ))
+
+    def _report(self, message, style=None):
+        if self.shown < self.show:
+            self.stdout.write(style(message) if style else message)
+        self.shown += 1
+
+    def _process(self, validated):
+        """Revisa unicidad, calcula la diferencia y escribe un bloque validado"""
+        valid = []
+        for line, data, errors in validated:
+            # Duplicados dentro del archivo
+            for field, first_line in self.seen.items():
+                value = _key(data[field]) if data.get(field) else None
+                if not value:
+                    continue
+                if value in first_line:
+                    errors.setdefault(field, []).append(f"Valor repetido en la línea {first_line[value]}.")
+                else:
+                    first_line[value] = line
+            if errors:
+                self._invalid(line, errors)
+            else:
+                valid.append((line, data))
+        if not valid:
+            return
+
+        # Filas existentes que coinciden por email o document_number
+        existing = {}
+        match = {field: {} for field in import_service.UNIQUE_FIELDS}
+        for field in import_service.UNIQUE_FIELDS:
+            values = [data[field] for _, data in valid if data.get(field)]
+            if not values:
+                continue
+            for row in Employees.objects.filter(**{f"{field}__in": values}).values("id", *EXISTING_COLUMNS):
+                existing[row["id"]] = row
+                match[field][_key(row[field])] = row["id"]
+
+        to_write = []
+        for line, data in valid:
+            ids = {match[f].get(_key(data[f])) for f in import_service.UNIQUE_FIELDS if data.get(f)} - {None}
+            if len(ids) > 1:
+                self._invalid(line, {"non_field_errors": [
+                    "El email y el número de documento pertenecen a empleados distintos."
+                ]})
+                continue
+            if not ids:
+                self.totals["created"] += 1
+                to_write.append(Employees(**data))
+                continue
+
+            current = existing[ids.pop()]
+            changes = {k: (current[k], v) for k, v in data.items() if not _same(current.get(k), v)}
+            if not changes:
+                self.totals["unchanged"] += 1
+                continue
+            self.totals["updated"] += 1
+            if self.dry_run:
+                detail = ", ".join(f"{k}: {old!r} → {new!r}" for k, (old, new) in changes.items())
+                self._report(f"  línea {line} (id {current['id']}): {detail}")
+            merged = {k: v for k, v in current.items() if k != "id"}
+            merged.update(data)
+            to_write.append(Employees(**merged))
+
+        if self.dry_run or not to_write:
+            return
+
+        # bulk_create no pasa por save()
+        for obj in to_write:
+            obj.refresh_derived_fields()
+        options = {"update_conflicts": True, "update_fields": self.update_fields}
+        if connection.features.supports_update_conflicts_with_target:
+            options["unique_fields"] = ["email"]
+        with transaction.atomic():
+            Employees.objects.bulk_create(to_write, batch_size=len(to_write), **options)
+            # updated_at se fijó antes del COMMIT (ver sync_service)
+            sync_service.touch_after_commit(obj.email for obj in to_write)
+
+    def _invalid(self, line, errors):
+        self.totals["invalid"] += 1
+        detail = "; ".join(f"{field}: {' '.join(messages)}" for field, messages in errors.items())
+        self._report(f"  línea {line}: {detail}", self.style.WARNING)
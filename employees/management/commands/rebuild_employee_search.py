@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from architect.utils.pagination import iter_keyset
+from employees.models import Employees
+from employees.models.employee import DERIVED_FIELDS
+from employees.search import ensure_fulltext_index
+
+
+class Command(BaseCommand):
+    help = ("Recalcula los campos derivados de Employees: search_document y salary_amount "
+            "(p. ej. tras renombrar regiones, provincias o distritos).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Filas por bulk_update (por defecto: 1000)")
+
+    def handle(self, *args, **opt):
+        batch_size = opt["batch_size"]
+        ensure_fulltext_index()
+
+        total = 0
+        batch = []
+        for employee in iter_keyset(Employees.objects.all(), chunk_size=batch_size):
+            employee.refresh_derived_fields()
+            batch.append(employee)
+            if len(batch) >= batch_size:
+                Employees.objects.bulk_update(batch, DERIVED_FIELDS)
+                total += len(batch)
+                batch = []
+        if batch:
+            Employees.objects.bulk_update(batch, DERIVED_FIELDS)
+            total += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Campos derivados actualizados ✔  Empleados: {total}"))
@@ -1 +1,2 @@
-from .employee import Employees
\ No newline at end of file
+from .employee import Employees
+from .tombstone import EmployeeTombstone
@@ -1,9 +1,73 @@
+import re
+from decimal import Decimal, InvalidOperation
+
 from django.db import models
 from django.utils import timezone
 from django.conf import settings
 from app_types.models.document_type import DocumentType
 from ubi_geo.models import Region, Province, District
 from architect.models.permission import Role
+from architect.storage import get_content_storage
+
+# Campos propios y FKs de ubicación cuyo contenido entra en search_document
+SEARCH_SOURCE_FIELDS = (
+    'name', 'last_name_paternal', 'last_name_maternal', 'document_number',
+    'email', 'phone', 'address', 'region', 'province', 'district',
+    'region_id', 'province_id', 'district_id',
+)
+# Columnas que mantiene refresh_derived_fields() -> campos de los que dependen
+DERIVED_SOURCES = {
+    'search_document': SEARCH_SOURCE_FIELDS,
+    'salary_amount': ('salary',),
+}
+DERIVED_FIELDS = tuple(DERIVED_SOURCES)
+
+_SALARY_NOISE_RE = re.compile(r"[^\d.,-]")
+
+
+def parse_salary(value):
+    """
+    Convierte el texto de salary a Decimal ("S/ 1,500.50", "1.500,50", "2500").
+    El último separador seguido de 1-2 dígitos se toma como decimal; el resto,
+    como separador de miles. None si no hay un número reconocible.
+    """
+    if not value:
+        return None
+    text = _SALARY_NOISE_RE.sub("", str(value))
+    last_sep = max(text.rfind(","), text.rfind("."))
+    if last_sep != -1 and 1 <= len(text) - last_sep - 1 <= 2:
+        integer, decimals = text[:last_sep], text[last_sep + 1:]
+    else:
+        integer, decimals = text, ""
+    integer = integer.replace(",", "").replace(".", "")
+    try:
+        amount = Decimal(f"{integer}.{decimals}" if decimals else integer)
+    except InvalidOperation:
+        return None
+    if not amount.is_finite() or abs(amount) >= Decimal("1e10"):
+        return None
+    return amount.quantize(Decimal("0.01"))
+
+
+def photo_url(storage, name, variants, variant=None, fmt="jpeg"):
+    """URL de la foto `name` en la variante pedida; el original si la variante aún no existe"""
+    if not name:
+        return None
+    if variant:
+        variant_name = ((variants or {}).get(variant) or {}).get(fmt)
+        if variant_name:
+            return storage.url(variant_name)
+    return storage.url(name)
+
+
+def photo_variant_urls(storage, name, variants):
+    """{variante: {formato: url}} de las versiones procesadas, None si aún no existen"""
+    if not name or not variants:
+        return None
+    return {
+        variant: {fmt: storage.url(variant_name) for fmt, variant_name in formats.items()}
+        for variant, formats in variants.items()
+    }
 
 class Employees(models.Model):
     name = models.CharField(
@@ -114,11 +178,39 @@ class Employees(models.Model):
 
     photo = models.ImageField(
         upload_to='employee_photos/',
+        storage=get_content_storage,
         blank=True,
         null=True,
         verbose_name="Foto"
     )
 
+    # Salario numérico derivado de `salary` (ver refresh_derived_fields)
+    salary_amount = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name="Salario (monto)"
+    )
+
+    # Variantes generadas por employees.tasks.process_employee_photo:
+    # {"thumb": {"webp": nombre, "jpeg": nombre}, "medium": {...}}
+    photo_variants = models.JSONField(
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name="Variantes de la foto"
+    )
+
+    # Texto desnormalizado para el índice FULLTEXT (ver refresh_derived_fields)
+    search_document = models.TextField(
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name="Documento de búsqueda"
+    )
+
     # Campos de auditoría
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de creación")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Fecha de actualización")
@@ -131,15 +223,61 @@ class Employees(models.Model):
         verbose_name = "Empleado"
         verbose_name_plural = "Empleados"
         ordering = ['name', 'last_name_paternal', 'last_name_maternal']
+        indexes = [
+            # Sincronización incremental: WHERE (updated_at, id) > (...) ORDER BY updated_at, id
+            models.Index(fields=['updated_at', 'id'], name='employees_updated_at_id_idx'),
+        ]
 
     def get_full_name(self):
         return f"{self.name} {self.last_name_paternal} {self.last_name_maternal}"
 
-    def get_photo_url(self):
-        """Retorna la URL de la foto si existe, None si no hay foto"""
-        if self.photo and hasattr(self.photo, 'url'):
-            return self.photo.url
-        return None
+    def build_search_document(self):
+        """Nombres, documento, contacto y nombres de ubicación en un solo texto"""
+        # Los nombres de ubicación salen de la caché de catálogos, sin consultas
+        from architect.utils import reference_data
+
+        parts = [
+            self.name, self.last_name_paternal, self.last_name_maternal,
+            self.document_number, self.email, self.phone, self.address,
+        ]
+        for model, pk in ((Region, self.region_id), (Province, self.province_id), (District, self.district_id)):
+            location = reference_data.get(model, pk) if pk else None
+            if location is not None:
+                parts.append(location.name)
+        return " ".join(p for p in parts if p)
+
+    def refresh_derived_fields(self):
+        """
+        Recalcula los campos derivados. save() lo hace automáticamente; las
+        escrituras con bulk_create/bulk_update deben llamarlo antes.
+        """
+        self.search_document = self.build_search_document()
+        self.salary_amount = parse_salary(self.salary)
+
+    def save(self, *args, **kwargs):
+        self.refresh_derived_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            derived = {field for field, sources in DERIVED_SOURCES.items() if set(update_fields) & set(sources)}
+            if derived:
+                kwargs['update_fields'] = set(update_fields) | derived
+        super().save(*args, **kwargs)
+
+    def get_photo_url(self, variant=None, fmt="jpeg"):
+        """
+        Retorna la URL de la foto si existe, None si no hay foto.
+        Con `variant` ('thumb' | 'medium') devuelve la versión procesada y,
+        mientras no exista, el original.
+        """
+        if not self.photo:
+            return None
+        return photo_url(self.photo.storage, self.photo.name, self.photo_variants, variant, fmt)
+
+    def get_photo_variant_urls(self):
+        """{variante: {formato: url}} de las versiones procesadas, None si aún no existen"""
+        if not self.photo:
+            return None
+        return photo_variant_urls(self.photo.storage, self.photo.name, self.photo_variants)
 
     def __str__(self):
         return self.get_full_name()
\ No newline at end of file
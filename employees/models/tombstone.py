@@ -0,0 +1,25 @@
+from django.db import models
+from django.utils import timezone
+
+class EmployeeTombstone(models.Model):
+    """Registro mínimo de un empleado eliminado, para la sincronización incremental"""
+
+    employee_id = models.BigIntegerField(
+        verbose_name="ID del empleado"
+    )
+
+    deleted_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Fecha de eliminación"
+    )
+
+    def __str__(self):
+        return f"Empleado {self.employee_id} eliminado el {self.deleted_at:%Y-%m-%d %H:%M}"
+
+    class Meta:
+        db_table = "employee_tombstones"
+        verbose_name = "Empleado eliminado"
+        verbose_name_plural = "Empleados eliminados"
+        indexes = [
+            models.Index(fields=["deleted_at", "id"], name="employee_tombstones_sync_idx"),
+        ]
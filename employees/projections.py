@@ -0,0 +1,130 @@
+"""
+Proyecciones de empleados (ver architect.utils.projection).
+
+- EMPLOYEE: representación de las vistas de función (lista, detalle,
+  streaming y sincronización); catálogos como {id, name}.
+- EMPLOYEE_API: misma salida que EmployeeSerializer, para el list() del
+  EmployeeViewSet (región/provincia/distrito con los serializers de ubi_geo).
+
+Los campos de foto reciben por contexto `photo_variant` ('thumb' | 'medium').
+"""
+from architect.utils.projection import (
+    Column, Computed, Nested, Projection, Related, drf_datetime, isoformat,
+)
+from ubi_geo import registry
+from .models import Employees
+from .models.employee import photo_url, photo_variant_urls
+
+_NAMES = ("name", "last_name_paternal", "last_name_maternal")
+_PHOTO_COLUMNS = ("photo", "photo_variants")
+
+
+def _photo_storage():
+    return Employees._meta.get_field("photo").storage
+
+
+def _photo_url(row, photo_variant=None, **context):
+    return photo_url(_photo_storage(), row["photo"], row["photo_variants"], photo_variant)
+
+
+def _photo_original_url(row, **context):
+    return photo_url(_photo_storage(), row["photo"], None)
+
+
+def _photo_variants(row, **context):
+    return photo_variant_urls(_photo_storage(), row["photo"], row["photo_variants"])
+
+
+def _location_name(column, lookup):
+    # Nombre desde ubi_geo.registry, sin unir la tabla
+    def get(row, **context):
+        pk = row[column]
+        return lookup(pk) if pk is not None else None
+    return get
+
+
+def _province_region_name(pk):
+    return registry.region_name(registry.current().province.parent(pk))
+
+
+def _full_name(row, **context):
+    # Mismo texto que Employees.get_full_name
+    return f"{row['name']} {row['last_name_paternal']} {row['last_name_maternal']}"
+
+
+def _api_full_name(row, **context):
+    # Mismo texto que EmployeeSerializer.get_full_name
+    return " ".join(row[c] for c in _NAMES if row[c])
+
+
+EMPLOYEE = Projection(
+    id=Column("id"),
+    name=Column("name"),
+    last_name_paternal=Column("last_name_paternal"),
+    last_name_maternal=Column("last_name_maternal"),
+    full_name=Computed(_NAMES, _full_name),
+    document_type=Related("document_type"),
+    document_number=Column("document_number"),
+    email=Column("email"),
+    gender=Column("gender"),
+    phone=Column("phone"),
+    birth_date=Column("birth_date", isoformat),
+    region=Related("region", lookup=registry.region_name),
+    province=Related("province", lookup=registry.province_name),
+    district=Related("district", lookup=registry.district_name),
+    rol=Related("rol"),
+    salary=Column("salary"),
+    address=Column("address"),
+    photo_url=Computed(_PHOTO_COLUMNS, _photo_url),
+    photo_original_url=Computed(("photo",), _photo_original_url),
+    photo_variants=Computed(_PHOTO_COLUMNS, _photo_variants),
+    created_at=Column("created_at", isoformat),
+    updated_at=Column("updated_at", isoformat),
+)
+
+# ubi_geo.serializers: RegionSerializer, ProvinceSerializer, DistrictSerializer
+_AUDIT = {
+    "created_at": Column("created_at", drf_datetime),
+    "updated_at": Column("updated_at", drf_datetime),
+    "deleted_at": Column("deleted_at", drf_datetime),
+}
+_REGION_API = Projection(id=Column("id"), name=Column("name"), country=Column("country"), **_AUDIT)
+_PROVINCE_API = Projection(
+    id=Column("id"), name=Column("name"), region=Column("region"),
+    region_name=Computed(("region",), _location_name("region", registry.region_name)),
+    full_path=Column("full_path"), **_AUDIT,
+)
+_DISTRICT_API = Projection(
+    id=Column("id"), name=Column("name"), province=Column("province"),
+    province_name=Computed(("province",), _location_name("province", registry.province_name)),
+    region_name=Computed(("province",), _location_name("province", _province_region_name)),
+    full_path=Column("full_path"), **_AUDIT,
+)
+
+EMPLOYEE_API = Projection(
+    id=Column("id"),
+    document_type=Related("document_type"),
+    rol=Related("rol"),
+    name=Column("name"),
+    last_name_paternal=Column("last_name_paternal"),
+    last_name_maternal=Column("last_name_maternal"),
+    document_number=Column("document_number"),
+    email=Column("email"),
+    gender=Column("gender"),
+    phone=Column("phone"),
+    birth_date=Column("birth_date", isoformat),
+    region=Nested("region", _REGION_API),
+    province=Nested("province", _PROVINCE_API),
+    district=Nested("district", _DISTRICT_API),
+    salary=Column("salary"),
+    address=Column("address"),
+    full_name=Computed(_NAMES, _api_full_name),
+    photo_url=Computed(_PHOTO_COLUMNS, _photo_url),
+    photo_original_url=Computed(("photo",), _photo_original_url),
+    photo_variants=Computed(_PHOTO_COLUMNS, _photo_variants),
+    created_at=Column("created_at", drf_datetime),
+    updated_at=Column("updated_at", drf_datetime),
+    region_name=Computed(("region",), _location_name("region", registry.region_name)),
+    province_name=Computed(("province",), _location_name("province", registry.province_name)),
+    district_name=Computed(("district",), _location_name("district", registry.district_name)),
+)
@@ -0,0 +1,93 @@
+"""
+Búsqueda de empleados sobre un índice FULLTEXT.
+
+`Employees.search_document` concentra nombres, documento, contacto y nombres de
+ubicación (se recalcula en cada save()). En MySQL la búsqueda usa
+MATCH ... AGAINST sobre ese índice y ordena por relevancia, sin joins ni
+escaneos completos; en otros motores se recurre a icontains.
+"""
+import re
+
+from django.db import connections
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+
+FULLTEXT_INDEX_NAME = "employees_search_document_ft"
+
+# innodb_ft_min_token_size por defecto: palabras más cortas no se indexan
+MIN_TOKEN_LENGTH = 3
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def ensure_fulltext_index(using="default", **kwargs):
+    """
+    Crea el índice FULLTEXT si falta (receptor de post_migrate).
+    Los índices FULLTEXT no se pueden declarar en Meta.indexes para MySQL.
+    """
+    connection = connections[using]
+    if connection.vendor != "mysql":
+        return
+
+    from .models import Employees
+    table = Employees._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = 'search_document'",
+            [table],
+        )
+        if not cursor.fetchone()[0]:
+            return  # La columna aún no existe (migración pendiente)
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s",
+            [table, FULLTEXT_INDEX_NAME],
+        )
+        if cursor.fetchone()[0]:
+            return
+        qn = connection.ops.quote_name
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ADD FULLTEXT INDEX {qn(FULLTEXT_INDEX_NAME)} ({qn('search_document')})"
+        )
+
+
+def search_employees(queryset, text):
+    """
+    Filtra y ordena por relevancia (anotación `search_rank`).
+    Las palabras cortas, que InnoDB no indexa, se filtran con icontains sobre
+    la misma columna.
+    """
+    words = _WORD_RE.findall(text or "")
+    if not words:
+        return queryset
+
+    long_words = [w for w in words if len(w) >= MIN_TOKEN_LENGTH]
+    short_words = [w for w in words if len(w) < MIN_TOKEN_LENGTH]
+
+    connection = connections[queryset.db]
+    if connection.vendor != "mysql" or not long_words:
+        for word in words:
+            queryset = queryset.filter(search_document__icontains=word)
+        return queryset.order_by("id")
+
+    qn = connection.ops.quote_name
+    column = f"{qn(queryset.model._meta.db_table)}.{qn('search_document')}"
+    # +palabra* -> todas las palabras son obligatorias y cuentan como prefijo
+    against = " ".join(f"+{w}*" for w in long_words)
+    rank = RawSQL(f"MATCH ({column}) AGAINST (%s IN BOOLEAN MODE)", (against,))
+
+    queryset = queryset.annotate(search_rank=rank).filter(search_rank__gt=0)
+    for word in short_words:
+        queryset = queryset.filter(search_document__icontains=word)
+    return queryset.order_by("-search_rank", "id")
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """SearchFilter (?search=) respaldado por el índice FULLTEXT de search_document"""
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return search_employees(queryset, " ".join(terms))
@@ -6,6 +6,76 @@ from app_types.models import DocumentType
 from architect.models.permission import Role
 from ubi_geo.models import Region, Province, District
 from ubi_geo.serializers import RegionSerializer, ProvinceSerializer, DistrictSerializer
+from architect.serializers.fields import CachedPrimaryKeyRelatedField
+from architect.utils import reference_data
+from ubi_geo.registry import validate_hierarchy
+from ubi_geo.serializers.fields import LocationNameField
+
+
+def check_document_number(value, doc_type_name):
+    """
+    Reglas de formato del número de documento según el nombre del tipo (en mayúsculas).
+    Compartidas por EmployeeSerializer y la carga masiva de empleados.
+    """
+    if doc_type_name == "DNI":
+        if not value.isdigit():
+            raise serializers.ValidationError("El DNI debe contener solo números.")
+        if not (8 <= len(value) <= 9):
+            raise serializers.ValidationError(
+                "El DNI debe tener entre 8 y 9 dígitos."
+            )
+
+    elif doc_type_name == "CE" or "CARNE DE EXTRANJERIA" in doc_type_name:
+        if not value.isdigit():
+            raise serializers.ValidationError(
+                "El Carné de Extranjería debe contener solo números."
+            )
+        if len(value) > 12:
+            raise serializers.ValidationError(
+                "El Carné de Extranjería debe tener máximo 12 dígitos."
+            )
+
+    elif doc_type_name == "PTP":
+        if not value.isdigit():
+            raise serializers.ValidationError("El PTP debe contener solo números.")
+        if len(value) != 9:
+            raise serializers.ValidationError(
+                "El PTP debe tener exactamente 9 dígitos."
+            )
+
+    elif doc_type_name == "CR" or "CARNE DE REFUGIADO" in doc_type_name:
+        if not re.match(r"^[A-Za-z0-9]+$", value):
+            raise serializers.ValidationError(
+                "El Carné de Refugiado debe contener solo letras y números."
+            )
+
+    elif doc_type_name == "PAS" or "PASAPORTE" in doc_type_name:
+        if not re.match(r"^[A-Za-z0-9]+$", value):
+            raise serializers.ValidationError(
+                "El Pasaporte debe contener solo letras y números."
+            )
+
+
+def check_birth_date(value):
+    """La fecha de nacimiento no puede ser futura y el empleado debe ser mayor de edad"""
+    if not value:
+        return
+
+    # No permitir fechas futuras
+    if hasattr(value, 'date'):
+        birth_date = value.date()
+    else:
+        birth_date = value
+
+    today = date.today()
+    if birth_date > today:
+        raise serializers.ValidationError("La fecha de nacimiento no puede ser futura.")
+
+    # Calcular edad
+    age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+    if age < 18:
+        raise serializers.ValidationError("El empleado debe tener al menos 18 años.")
+
 
 class EmployeeSerializer(serializers.ModelSerializer):
     region = RegionSerializer(read_only=True)
@@ -13,31 +83,33 @@ class EmployeeSerializer(serializers.ModelSerializer):
     district = DistrictSerializer(read_only=True)
     full_name = serializers.SerializerMethodField()
     photo_url = serializers.SerializerMethodField()
+    photo_original_url = serializers.SerializerMethodField()
+    photo_variants = serializers.SerializerMethodField()
     
     # Campos personalizados para mostrar objetos con id y name
     document_type = serializers.SerializerMethodField()
     rol = serializers.SerializerMethodField()
 
-    region_name = serializers.CharField(source='region.name', read_only=True)
-    province_name = serializers.CharField(source='province.name', read_only=True)
-    district_name = serializers.CharField(source='district.name', read_only=True)
+    region_name = LocationNameField("region", "region_id")
+    province_name = LocationNameField("province", "province_id")
+    district_name = LocationNameField("district", "district_id")
 
-    region_id = serializers.PrimaryKeyRelatedField(
+    region_id = CachedPrimaryKeyRelatedField(
         queryset=Region.objects.all(), 
         source='region', 
         write_only=True
     )
-    province_id = serializers.PrimaryKeyRelatedField(
+    province_id = CachedPrimaryKeyRelatedField(
         queryset=Province.objects.all(), 
         source='province', 
         write_only=True
     )
-    district_id = serializers.PrimaryKeyRelatedField(
+    district_id = CachedPrimaryKeyRelatedField(
         queryset=District.objects.all(), 
         source='district', 
         write_only=True
     )
-    document_type_id = serializers.PrimaryKeyRelatedField(
+    document_type_id = CachedPrimaryKeyRelatedField(
         queryset=DocumentType.objects.all(),
         source='document_type',
         write_only=True,
@@ -45,7 +117,7 @@ class EmployeeSerializer(serializers.ModelSerializer):
             'does_not_exist': 'El tipo de documento seleccionado no existe.'
         }
     )
-    rol_id = serializers.PrimaryKeyRelatedField(
+    rol_id = CachedPrimaryKeyRelatedField(
         queryset=Role.objects.all(),
         source='rol',
         write_only=True,
@@ -54,6 +126,14 @@ class EmployeeSerializer(serializers.ModelSerializer):
         }
     )
 
+    def __init__(self, *args, **kwargs):
+        # fields=[...] limita la salida a esas claves (?fields= en las vistas)
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
     class Meta:
         model = Employees
         fields = [
@@ -61,7 +141,7 @@ class EmployeeSerializer(serializers.ModelSerializer):
             'name', 'last_name_paternal', 'last_name_maternal', 'document_number',
             'email', 'gender', 'phone', 'birth_date', 'region', 'region_id', 'province',
             'province_id', 'district', 'district_id', 'salary', 'address', 'full_name', 
-            'photo_url', 'created_at', 'updated_at', 'region_name', 'province_name', 'district_name'
+            'photo_url', 'photo_original_url', 'photo_variants', 'created_at', 'updated_at', 'region_name', 'province_name', 'district_name'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
         
@@ -71,18 +151,9 @@ class EmployeeSerializer(serializers.ModelSerializer):
         province debe pertenecer a region
         district debe pertenecer a province
         """
-        region = attrs.get("region") or getattr(self.instance, "region", None)
-        province = attrs.get("province") or getattr(self.instance, "province", None)
-        district = attrs.get("district") or getattr(self.instance, "district", None)
-
-        if province and region and province.region_id != region.id:
-            raise serializers.ValidationError(
-                "La provincia seleccionada no pertenece a la región."
-            )
-        if district and province and district.province_id != province.id:
-            raise serializers.ValidationError(
-                "El distrito seleccionado no pertenece a la provincia."
-            )
+        error = validate_hierarchy(attrs, self.instance)
+        if error:
+            raise serializers.ValidationError(error)
         return attrs
     
     def validate_document_number(self, value):
@@ -97,72 +168,17 @@ class EmployeeSerializer(serializers.ModelSerializer):
             return value  # No podemos validar sin tipo de documento
         
         # Obtener el nombre del tipo de documento para las validaciones
-        try:
-            document_type = DocumentType.objects.get(id=doc_type_id)
-            doc_type_name = document_type.name.upper()
-        except DocumentType.DoesNotExist:
+        document_type = reference_data.get(DocumentType, doc_type_id)
+        if document_type is None:
             # La validación de existencia se hará en document_type_id field
             return value
+        doc_type_name = (document_type.name or "").upper()
 
-        # Validaciones según el tipo de documento
-        if doc_type_name == "DNI":
-            if not value.isdigit():
-                raise serializers.ValidationError("El DNI debe contener solo números.")
-            if not (8 <= len(value) <= 9):
-                raise serializers.ValidationError(
-                    "El DNI debe tener entre 8 y 9 dígitos."
-                )
-
-        elif doc_type_name == "CE" or "CARNE DE EXTRANJERIA" in doc_type_name:
-            if not value.isdigit():
-                raise serializers.ValidationError(
-                    "El Carné de Extranjería debe contener solo números."
-                )
-            if len(value) > 12:
-                raise serializers.ValidationError(
-                    "El Carné de Extranjería debe tener máximo 12 dígitos."
-                )
-
-        elif doc_type_name == "PTP":
-            if not value.isdigit():
-                raise serializers.ValidationError("El PTP debe contener solo números.")
-            if len(value) != 9:
-                raise serializers.ValidationError(
-                    "El PTP debe tener exactamente 9 dígitos."
-                )
-
-        elif doc_type_name == "CR" or "CARNE DE REFUGIADO" in doc_type_name:
-            if not re.match(r"^[A-Za-z0-9]+$", value):
-                raise serializers.ValidationError(
-                    "El Carné de Refugiado debe contener solo letras y números."
-                )
-
-        elif doc_type_name == "PAS" or "PASAPORTE" in doc_type_name:
-            if not re.match(r"^[A-Za-z0-9]+$", value):
-                raise serializers.ValidationError(
-                    "El Pasaporte debe contener solo letras y números."
-                )
-
+        check_document_number(value, doc_type_name)
         return value
     
     def validate_birth_date(self, value):
-        if value:
-            today = date.today()
-
-            # No permitir fechas futuras
-            if hasattr(value, 'date'):
-                birth_date = value.date()
-            else:
-                birth_date = value
-                
-            if birth_date > today:
-                raise serializers.ValidationError("La fecha de nacimiento no puede ser futura.")
-
-            # Calcular edad
-            age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
-            if age < 18:
-                raise serializers.ValidationError("El empleado debe tener al menos 18 años.")
-
+        check_birth_date(value)
         return value
         
     def get_full_name(self, obj):
@@ -179,8 +195,19 @@ class EmployeeSerializer(serializers.ModelSerializer):
         return ' '.join(full_name_parts) if full_name_parts else ''
 
     def get_photo_url(self, obj):
-        """Retorna la URL de la foto del empleado"""
+        """
+        Retorna la URL de la foto del empleado en la variante del contexto
+        ('photo_variant', por defecto 'medium'); el original si aún no se procesó
+        """
+        return obj.get_photo_url(self.context.get('photo_variant', 'medium'))
+
+    def get_photo_original_url(self, obj):
+        """Retorna la URL de la foto original"""
         return obj.get_photo_url()
+
+    def get_photo_variants(self, obj):
+        """Retorna las URLs de todas las variantes procesadas"""
+        return obj.get_photo_variant_urls()
     
     def get_document_type(self, obj):
         """Retorna el tipo de documento con id y name"""
@@ -193,9 +220,3 @@ class EmployeeSerializer(serializers.ModelSerializer):
         if obj.rol:
             return {"id": obj.rol.id, "name": obj.rol.name}
         return None
-    
-    def create(self, validated_data):
-        """Override create para asegurar que se carguen las relaciones"""
-        employee = super().create(validated_data)
-        # Recargar con select_related para obtener las relaciones
-        return Employees.objects.select_related('document_type', 'rol', 'region', 'province', 'district').get(pk=employee.pk)
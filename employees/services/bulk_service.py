@@ -0,0 +1,292 @@
+"""
+Alta y actualización masiva de empleados.
+
+En lugar de pasar cada fila por EmployeeSerializer, las FKs se resuelven contra
+mapas en memoria (caché de datos de referencia), se valida con las mismas reglas
+y se escribe con bulk_create/bulk_update en una sola transacción.
+"""
+from datetime import date
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from app_types.models import DocumentType
+from architect.models.permission import Role
+from architect.utils import reference_data
+from ubi_geo.registry import get_registry
+from ..models.employee import Employees, DERIVED_FIELDS
+from ..serializers.employee import check_document_number, check_birth_date
+from . import sync_service
+
+MAX_BULK_ROWS = 1000
+BATCH_SIZE = 200
+
+# Campo del payload -> campo del modelo (mismas claves que employee_create)
+CHAR_FIELDS = [
+    'name', 'last_name_paternal', 'last_name_maternal', 'document_number',
+    'email', 'gender', 'phone', 'salary', 'address',
+]
+FK_FIELDS = {
+    'document_type': 'document_type_id',
+    'region': 'region_id',
+    'province': 'province_id',
+    'district': 'district_id',
+    'rol': 'rol_id',
+}
+FK_NOT_FOUND = {
+    'document_type': 'El tipo de documento seleccionado no existe.',
+    'region': 'La región seleccionada no existe.',
+    'province': 'La provincia seleccionada no existe.',
+    'district': 'El distrito seleccionado no existe.',
+    'rol': 'El rol seleccionado no existe.',
+}
+GENDERS = {choice for choice, _ in Employees._meta.get_field('gender').choices}
+
+
+def _to_id(value):
+    if value in (None, ""):
+        return None
+    if isinstance(value, bool):
+        raise ValueError(value)
+    return int(value)
+
+
+def load_lookup_maps():
+    """
+    Mapas de las FKs válidas, construidos desde la caché de datos de referencia
+    y ubi_geo.registry (sin consultas si ya están cargados). Son diccionarios simples,
+    serializables con pickle:
+      document_type: id -> nombre en mayúsculas
+      rol / region:  id -> None
+      province:      id -> region_id
+      district:      id -> province_id
+    """
+    geo = get_registry()
+    return {
+        'document_type': {
+            pk: (obj.name or '').upper() for pk, obj in reference_data.table(DocumentType).items()
+        },
+        'rol': dict.fromkeys(reference_data.table(Role)),
+        'region': dict.fromkeys(geo.region.ids),
+        'province': geo.province.parent_map(),
+        'district': geo.district.parent_map(),
+    }
+
+
+def _add(errors, field, message):
+    errors.setdefault(field, []).append(str(message))
+
+
+def validate_row(row, maps, current=None):
+    """
+    Valida una fila contra los mapas precargados, sin tocar la base de datos.
+
+    `current` son los valores actuales (campos del modelo) cuando la fila es una
+    actualización; en ese caso los campos ausentes no son obligatorios.
+    Devuelve (datos_limpios, errores) con claves de campos del modelo.
+    """
+    partial = current is not None
+    current = current or {}
+    data = {}
+    errors = {}
+
+    for field in CHAR_FIELDS:
+        if field not in row:
+            continue
+        value = row[field]
+        if value is not None and not isinstance(value, str):
+            value = str(value)
+        if value == "" and field in ('document_number', 'gender'):
+            value = None
+        max_length = Employees._meta.get_field(field).max_length
+        if value is not None and max_length and len(value) > max_length:
+            _add(errors, field, f"Asegúrese de que este campo no tenga más de {max_length} caracteres.")
+            continue
+        data[field] = value
+
+    email = data.get('email', current.get('email'))
+    if not email:
+        if not partial or 'email' in row:
+            _add(errors, 'email', "Este campo es requerido.")
+    elif 'email' in data:
+        try:
+            validate_email(email)
+        except DjangoValidationError:
+            _add(errors, 'email', "Introduzca una dirección de correo electrónico válida.")
+
+    if data.get('gender') and data['gender'] not in GENDERS:
+        _add(errors, 'gender', f'"{data["gender"]}" no es una elección válida.')
+
+    if 'birth_date' in row:
+        value = row['birth_date']
+        if value in (None, ""):
+            data['birth_date'] = None
+        else:
+            try:
+                data['birth_date'] = date.fromisoformat(str(value))
+                check_birth_date(data['birth_date'])
+            except ValueError:
+                _add(errors, 'birth_date', "Formato de fecha inválido. Usa AAAA-MM-DD.")
+            except serializers.ValidationError as e:
+                for message in e.detail:
+                    _add(errors, 'birth_date', message)
+
+    for field, column in FK_FIELDS.items():
+        if field not in row:
+            if not partial:
+                _add(errors, field, "Este campo es requerido.")
+            continue
+        try:
+            pk = _to_id(row[field])
+        except (TypeError, ValueError):
+            _add(errors, field, "Debe ser un id válido.")
+            continue
+        if pk is None:
+            _add(errors, field, "Este campo no puede ser nulo.")
+        elif pk not in maps[field]:
+            _add(errors, field, FK_NOT_FOUND[field])
+        else:
+            data[column] = pk
+
+    def value_of(column):
+        return data[column] if column in data else current.get(column)
+
+    # Coherencia jerárquica (igual que EmployeeSerializer.validate)
+    region_id = value_of('region_id')
+    province_id = value_of('province_id')
+    district_id = value_of('district_id')
+    if province_id and region_id and province_id in maps['province'] \
+            and maps['province'][province_id] != region_id:
+        _add(errors, 'non_field_errors', "La provincia seleccionada no pertenece a la región.")
+    if district_id and province_id and district_id in maps['district'] \
+            and maps['district'][district_id] != province_id:
+        _add(errors, 'non_field_errors', "El distrito seleccionado no pertenece a la provincia.")
+
+    document_number = data.get('document_number')
+    doc_type_name = maps['document_type'].get(value_of('document_type_id'))
+    if document_number and doc_type_name:
+        try:
+            check_document_number(document_number, doc_type_name)
+        except serializers.ValidationError as e:
+            for message in e.detail:
+                _add(errors, 'document_number', message)
+
+    return data, errors
+
+
+def bulk_upsert(rows):
+    """
+    Crea (filas sin "id") o actualiza (filas con "id") empleados en bloque.
+
+    Si alguna fila es inválida no se escribe nada y se devuelve la lista de
+    errores por fila: {"errors": [{"index": i, "errors": {...}}]}.
+    """
+    errors = []
+    update_ids = {}
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            errors.append({"index": index, "errors": {"non_field_errors": ["Se esperaba un objeto."]}})
+            continue
+        if row.get("id") not in (None, ""):
+            try:
+                update_ids[index] = _to_id(row["id"])
+            except (TypeError, ValueError):
+                errors.append({"index": index, "errors": {"id": ["Debe ser un id válido."]}})
+    if errors:
+        return {"errors": errors}
+
+    maps = load_lookup_maps()
+    instances = Employees.objects.in_bulk(set(update_ids.values()))
+    column_names = [f.attname for f in Employees._meta.concrete_fields]
+
+    to_create = []
+    to_update = []
+    update_fields = set()
+    seen = {'email': {}, 'document_number': {}}
+
+    for index, row in enumerate(rows):
+        instance = None
+        current = None
+        if index in update_ids:
+            instance = instances.get(update_ids[index])
+            if instance is None:
+                errors.append({"index": index, "errors": {"id": ["Empleado no encontrado."]}})
+                continue
+            current = {name: getattr(instance, name) for name in column_names}
+
+        data, row_errors = validate_row(row, maps, current)
+
+        # Duplicados dentro del mismo lote
+        for field, first_index in seen.items():
+            value = data.get(field)
+            if not value:
+                continue
+            if value in first_index:
+                _add(row_errors, field, f"Valor repetido en la fila {first_index[value]}.")
+            else:
+                first_index[value] = index
+
+        if row_errors:
+            errors.append({"index": index, "errors": row_errors})
+        elif instance is None:
+            to_create.append((index, Employees(**data)))
+        else:
+            for column, value in data.items():
+                setattr(instance, column, value)
+            update_fields.update(data)
+            to_update.append((index, instance))
+
+    # Unicidad contra la base de datos: una consulta por campo único
+    taken = {}
+    for field in seen:
+        values = list(seen[field])
+        if values:
+            taken[field] = dict(
+                Employees.objects.filter(**{f"{field}__in": values}).values_list(field, 'id')
+            )
+    for index, obj in to_create + to_update:
+        row_errors = {}
+        for field, existing in taken.items():
+            value = getattr(obj, field)
+            if value and value in existing and existing[value] != obj.pk:
+                _add(row_errors, field, f"Ya existe un empleado con este {field}.")
+        if row_errors:
+            errors.append({"index": index, "errors": row_errors})
+
+    if errors:
+        errors.sort(key=lambda e: e["index"])
+        return {"errors": errors}
+
+    # bulk_create/bulk_update no pasan por save()
+    for _, obj in to_create + to_update:
+        obj.refresh_derived_fields()
+    update_fields.update(DERIVED_FIELDS)
+
+    with transaction.atomic():
+        if to_create:
+            Employees.objects.bulk_create([obj for _, obj in to_create], batch_size=BATCH_SIZE)
+        if to_update:
+            # bulk_update no aplica auto_now
+            now = timezone.now()
+            for _, obj in to_update:
+                obj.updated_at = now
+            Employees.objects.bulk_update(
+                [obj for _, obj in to_update],
+                fields=sorted(update_fields | {'updated_at'}),
+                batch_size=BATCH_SIZE,
+            )
+        # La transacción puede durar más que SYNC_LAG (ver sync_service)
+        sync_service.touch_after_commit(obj.email for _, obj in to_create + to_update)
+
+    # MySQL no devuelve los ids de bulk_create: se leen por email (único)
+    created_ids = dict(
+        Employees.objects.filter(email__in=[obj.email for _, obj in to_create]).values_list('email', 'id')
+    ) if to_create else {}
+
+    results = [{"index": i, "id": created_ids.get(obj.email), "action": "created"} for i, obj in to_create]
+    results += [{"index": i, "id": obj.pk, "action": "updated"} for i, obj in to_update]
+    results.sort(key=lambda r: r["index"])
+    return {"created": len(to_create), "updated": len(to_update), "results": results}
@@ -16,3 +16,30 @@ def soft_delete(instance: Employees):
     instance.soft_delete()
     return instance
 
+
+
+ID_FILTERS = ("region", "province", "district", "rol")
+
+
+class InvalidFilter(ValueError):
+    """Filtro por id con un valor que no es un entero positivo."""
+
+
+def parse_id_filters(params):
+    """{filtro: id entero} de los filtros presentes; lanza InvalidFilter si alguno no es válido"""
+    ids = {}
+    for param in ID_FILTERS:
+        value = params.get(param)
+        if value in (None, ""):
+            continue
+        if isinstance(value, bool) or not str(value).strip().isdigit():
+            raise InvalidFilter(f"El filtro '{param}' debe ser un id numérico")
+        ids[param] = int(str(value).strip())
+    return ids
+
+
+def filter_employees(qs, params):
+    """Filtros opcionales por IDs de region/province/district/rol (ver parse_id_filters)"""
+    for param, pk in parse_id_filters(params).items():
+        qs = qs.filter(**{f"{param}_id": pk})
+    return qs
@@ -0,0 +1,108 @@
+"""
+Carga de empleados desde CSV/XLSX (comando import_employees).
+
+- Lectura en streaming: csv.DictReader o openpyxl en modo read_only.
+- Validación por bloques con las reglas de bulk_service.validate_row contra
+  mapas precargados; los bloques pueden validarse en un pool de procesos.
+- Escritura por bloques con bulk_create(update_conflicts=True): las claves
+  únicas (email / document_number) deciden si la fila se inserta o actualiza.
+
+Este módulo no importa modelos al cargarse: los procesos del pool lo importan
+antes de inicializar Django (ver init_worker).
+"""
+import csv
+import os
+from datetime import date, datetime
+
+# Columnas reconocidas (mismas claves que el alta masiva por API)
+COLUMNS = (
+    'name', 'last_name_paternal', 'last_name_maternal', 'document_type', 'document_number',
+    'email', 'gender', 'phone', 'birth_date', 'region', 'province', 'district', 'rol',
+    'salary', 'address',
+)
+UNIQUE_FIELDS = ('email', 'document_number')
+
+_worker_maps = None
+
+
+def _normalize_header(value):
+    return str(value or "").strip().lstrip("﻿").lower()
+
+
+def _clean_cell(value):
+    """Valores de XLSX/CSV al mismo formato de texto que espera validate_row"""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def _to_row(header, values):
+    row = {}
+    for key, value in zip(header, values):
+        if key in COLUMNS:
+            row[key] = _clean_cell(value)
+    return row
+
+
+def read_rows(path, delimiter=";"):
+    """
+    Genera (número de línea, fila) con solo las columnas reconocidas.
+    Devuelve primero la lista de columnas presentes en el encabezado.
+    """
+    if str(path).lower().endswith((".xlsx", ".xlsm")):
+        yield from _read_xlsx(path)
+    else:
+        yield from _read_csv(path, delimiter)
+
+
+def _read_csv(path, delimiter):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = [_normalize_header(h) for h in next(reader, [])]
+        yield [h for h in header if h in COLUMNS]
+        for values in reader:
+            if any(v.strip() for v in values):
+                yield reader.line_num, _to_row(header, values)
+
+
+def _read_xlsx(path):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [_normalize_header(h) for h in next(rows, ())]
+        yield [h for h in header if h in COLUMNS]
+        for line, values in enumerate(rows, start=2):
+            if any(v not in (None, "") for v in values):
+                yield line, _to_row(header, values)
+    finally:
+        workbook.close()
+
+
+def init_worker(maps):
+    """Inicializador del pool: configura Django (si hace falta) y guarda los mapas"""
+    global _worker_maps
+    from django.apps import apps
+    if not apps.ready:
+        import django
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings.settings")
+        django.setup()
+    _worker_maps = maps
+
+
+def validate_chunk(chunk, maps=None):
+    """
+    [(línea, fila)] -> [(línea, datos, errores)].
+    Solo reglas de fila; la unicidad se revisa después contra la base.
+    """
+    from .bulk_service import validate_row
+
+    maps = maps if maps is not None else _worker_maps
+    return [(line, *validate_row(row, maps)) for line, row in chunk]
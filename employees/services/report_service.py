@@ -0,0 +1,207 @@
+"""
+Reporte PDF de empleados (nómina agrupada por región y rol, con fotos).
+
+El PDF se genera con ReportLab en un worker de Celery (cola `reports`) y se
+guarda en MEDIA_ROOT/reports/employees/. El nombre del archivo es un hash de
+los filtros, el máximo updated_at y la cantidad de filas: mientras los datos no
+cambien, la misma solicitud reutiliza el archivo ya generado.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db.models import Count, Max
+from django.utils import timezone
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from ..models.employee import Employees
+from ..search import search_employees
+from .employee_service import filter_employees, parse_id_filters
+
+REPORTS_DIR = "reports/employees"
+# Horas que se conserva un PDF generado (ver prune_reports)
+DEFAULT_REPORT_RETENTION_HOURS = 24
+REPORT_FILTERS = ("region", "province", "district", "rol", "search")
+# Cambiar al modificar el diseño del PDF para invalidar los archivos previos
+LAYOUT_VERSION = 1
+
+PHOTO_SIZE = 14 * mm
+
+
+def normalize_filters(params):
+    """
+    Solo los filtros conocidos y no vacíos, como texto (forma estable para el
+    hash). Lanza InvalidFilter si un filtro por id no es numérico.
+    """
+    ids = parse_id_filters(params)
+    filters = {name: str(pk) for name, pk in ids.items()}
+    for name in REPORT_FILTERS:
+        if name in ids:
+            continue
+        value = params.get(name)
+        if value not in (None, ""):
+            filters[name] = str(value).strip()
+    return filters
+
+
+def roster_queryset(filters):
+    qs = Employees.objects.select_related("document_type", "rol", "region", "province", "district")
+    qs = filter_employees(qs, filters)
+    if filters.get("search"):
+        qs = search_employees(qs, filters["search"])
+    return qs
+
+
+def report_id(filters):
+    """Identificador del reporte; cambia cuando cambian los datos filtrados"""
+    stats = roster_queryset(filters).order_by().aggregate(
+        last_updated=Max("updated_at"), total=Count("id")
+    )
+    last_updated = stats["last_updated"].isoformat() if stats["last_updated"] else None
+    payload = json.dumps(
+        [LAYOUT_VERSION, filters, last_updated, stats["total"]], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def report_path(rid):
+    return f"{REPORTS_DIR}/roster_{rid}.pdf"
+
+
+def is_valid_report_id(rid):
+    return len(rid) == 32 and all(c in "0123456789abcdef" for c in rid)
+
+
+def _photo_flowable(employee):
+    """Miniatura JPEG si ya se procesó, si no la foto original; None si no hay foto"""
+    if not employee.photo:
+        return None
+    name = ((employee.photo_variants or {}).get("thumb") or {}).get("jpeg") or employee.photo.name
+    try:
+        with employee.photo.storage.open(name, "rb") as f:
+            data = BytesIO(f.read())
+        return Image(data, width=PHOTO_SIZE, height=PHOTO_SIZE, kind="proportional")
+    except OSError:
+        return None
+
+
+def _group_table(rows):
+    header = ["Foto", "Nombre", "Documento", "Correo", "Teléfono"]
+    table = Table(
+        [header] + rows,
+        colWidths=[18 * mm, 55 * mm, 30 * mm, 55 * mm, 25 * mm],
+        repeatRows=1,
+    )
+    table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#D9E1F2")),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 8),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ]))
+    return table
+
+
+def build_roster_pdf(fileobj, filters):
+    """Escribe el PDF en `fileobj`; devuelve el número de empleados incluidos"""
+    styles = getSampleStyleSheet()
+    cell = styles["BodyText"].clone("cell", fontSize=8, leading=10)
+
+    qs = roster_queryset(filters).order_by(
+        "region__name", "rol__name", "last_name_paternal", "last_name_maternal", "name", "id"
+    )
+
+    story = [
+        Paragraph("Relación de empleados", styles["Title"]),
+        Paragraph(f"Generado: {timezone.localtime():%d/%m/%Y %H:%M}", styles["Normal"]),
+        Spacer(1, 6 * mm),
+    ]
+
+    total = 0
+    current_region = current_rol = object()
+    rows = []
+    for e in qs.iterator(chunk_size=500):
+        region = e.region.name if e.region else "Sin región"
+        rol = e.rol.name if e.rol else "Sin rol"
+        if (region, rol) != (current_region, current_rol):
+            if rows:
+                story += [_group_table(rows), Spacer(1, 5 * mm)]
+                rows = []
+            if region != current_region:
+                story.append(Paragraph(escape(region), styles["Heading2"]))
+            story.append(Paragraph(escape(rol), styles["Heading3"]))
+            current_region, current_rol = region, rol
+
+        full_name = " ".join(p for p in (e.last_name_paternal, e.last_name_maternal, e.name) if p)
+        document = " ".join(p for p in (e.document_type.name if e.document_type else None, e.document_number) if p)
+        # Paragraph interpreta marcado: el texto se escapa
+        rows.append([
+            _photo_flowable(e) or "",
+            Paragraph(escape(full_name), cell),
+            Paragraph(escape(document), cell),
+            Paragraph(escape(e.email or ""), cell),
+            Paragraph(escape(e.phone or ""), cell),
+        ])
+        total += 1
+
+    if rows:
+        story.append(_group_table(rows))
+    if not total:
+        story.append(Paragraph("No hay empleados para los filtros indicados.", styles["Normal"]))
+
+    doc = SimpleDocTemplate(
+        fileobj, pagesize=A4, title="Relación de empleados",
+        leftMargin=12 * mm, rightMargin=12 * mm, topMargin=12 * mm, bottomMargin=12 * mm,
+    )
+    doc.build(story)
+    return total
+
+
+def prune_reports(max_age_hours=None):
+    """
+    Borra los PDF generados hace más de `max_age_hours` (por defecto
+    EMPLOYEE_REPORT_RETENTION_HOURS); devuelve cuántos borró. Cada cambio de
+    datos genera un archivo nuevo, así que sin esto el directorio solo crece.
+    Un reporte borrado se vuelve a generar si se solicita otra vez.
+    """
+    if max_age_hours is None:
+        max_age_hours = getattr(settings, "EMPLOYEE_REPORT_RETENTION_HOURS", DEFAULT_REPORT_RETENTION_HOURS)
+    if not default_storage.exists(REPORTS_DIR):
+        return 0
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    removed = 0
+    _, files = default_storage.listdir(REPORTS_DIR)
+    for filename in files:
+        path = f"{REPORTS_DIR}/{filename}"
+        if filename.startswith("roster_") and default_storage.get_modified_time(path) < cutoff:
+            default_storage.delete(path)
+            removed += 1
+    return removed
+
+
+def render_report(filters, rid):
+    """Genera y guarda el PDF si aún no existe; devuelve la ruta en el storage"""
+    path = report_path(rid)
+    if default_storage.exists(path):
+        return path
+
+    with tempfile.TemporaryFile(suffix=".pdf") as tmp:
+        build_roster_pdf(tmp, filters)
+        tmp.seek(0)
+        saved = default_storage.save(path, File(tmp, name=os.path.basename(path)))
+
+    # Otro worker generó el mismo reporte en paralelo: se conserva el primero
+    if saved != path:
+        default_storage.delete(saved)
+    return path
@@ -0,0 +1,184 @@
+"""
+Sincronización incremental de empleados.
+
+El cliente guarda un token opaco con dos marcas (updated_at, id): una para las
+filas creadas/modificadas y otra para las eliminaciones (EmployeeTombstone),
+más el momento hasta el que quedó al día (`s`). Cada llamada devuelve solo lo
+que cambió después de esas marcas, ordenado por el índice (updated_at, id), y
+un token nuevo para la siguiente llamada. Cuando no queda nada pendiente las
+marcas avanzan hasta el momento de la consulta, haya o no cambios.
+
+El token expira (SyncExpired) solo si `s` es anterior a la retención de
+eliminaciones: las marcas pueden ser viejas si nada cambió, eso no importa.
+
+Límite: updated_at se fija antes del COMMIT. Una transacción que tarda más que
+SYNC_LAG en confirmar deja filas con una marca que un cliente ya pudo pasar, y
+ese cliente no las vería. Las escrituras masivas (employee_bulk,
+import_employees) llaman a touch_after_commit, que vuelve a marcar sus filas
+con una actualización corta después del COMMIT. Otras escrituras deben
+confirmar en menos de SYNC_LAG o hacer lo mismo.
+"""
+from datetime import timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from architect.utils.pagination import InvalidCursor, decode_cursor, encode_cursor
+from ..models import Employees, EmployeeTombstone
+
+# No se sirven cambios más recientes que esto: una transacción que aún no
+# confirma podría escribir un updated_at anterior a la marca ya entregada
+SYNC_LAG = timedelta(seconds=2)
+TOUCH_BATCH_SIZE = 1000
+
+
+class InvalidUpdatedSince(ValueError):
+    """?updated_since= no es una fecha ISO 8601."""
+
+
+class SyncExpired(Exception):
+    """El token es anterior a la retención de eliminaciones: hace falta resincronizar todo."""
+
+
+def retention_horizon():
+    days = getattr(settings, "EMPLOYEE_TOMBSTONE_RETENTION_DAYS", 90)
+    return timezone.now() - timedelta(days=days)
+
+
+def _parse_ts(value, error=None):
+    try:
+        ts = parse_datetime(value) if isinstance(value, str) else None
+    except ValueError:
+        ts = None
+    if ts is None:
+        raise error or InvalidCursor("Token de sincronización inválido")
+    if timezone.is_naive(ts):
+        ts = timezone.make_aware(ts, dt_timezone.utc)
+    return ts
+
+
+def _parse_mark(value):
+    if value is None:
+        return None
+    if not isinstance(value, list) or len(value) != 2 or not isinstance(value[1], int):
+        raise InvalidCursor("Token de sincronización inválido")
+    return _parse_ts(value[0]), value[1]
+
+
+def _encode_mark(mark):
+    return None if mark is None else [mark[0].isoformat(), mark[1]]
+
+
+def initial_marks(updated_since=None):
+    """
+    (marca de filas, marca de eliminaciones, sincronizado hasta) de inicio: sin
+    updated_since es la descarga inicial (todas las filas, ninguna eliminación
+    previa); con updated_since, los cambios desde esa fecha.
+    """
+    if updated_since:
+        since = _parse_ts(updated_since, InvalidUpdatedSince(
+            "El parámetro 'updated_since' debe ser una fecha ISO 8601 (p. ej. 2024-01-31T12:00:00Z)"
+        ))
+        return (since, 0), (since, 0), since
+    start = timezone.now() - SYNC_LAG
+    return None, (start, 0), start
+
+
+def decode_token(token):
+    """(marca de filas, marca de eliminaciones, sincronizado hasta)"""
+    data = decode_cursor(token)
+    if not isinstance(data, dict):
+        raise InvalidCursor("Token de sincronización inválido")
+    updated_mark, deleted_mark = _parse_mark(data.get("u")), _parse_mark(data.get("d"))
+    if data.get("s") is not None:
+        synced_at = _parse_ts(data["s"])
+    else:
+        # Tokens sin `s`: la marca de eliminaciones nunca es posterior a la sincronización
+        synced_at = deleted_mark[0] if deleted_mark else None
+    return updated_mark, deleted_mark, synced_at
+
+
+def _after(qs, field, mark):
+    if mark is None:
+        return qs
+    ts, pk = mark
+    return qs.filter(Q(**{f"{field}__gt": ts}) | Q(**{field: ts, "id__gt": pk}))
+
+
+def changes(updated_mark, deleted_mark, limit, queryset=None, synced_at=None):
+    """
+    Devuelve (filas, ids_eliminados, token, has_more).
+    `queryset` permite elegir columnas; puede ser de .values() (con id y updated_at).
+    `synced_at` es el momento hasta el que el cliente está al día (decode_token).
+    """
+    # Las eliminaciones posteriores a synced_at deben seguir guardadas
+    if synced_at is not None and synced_at < retention_horizon():
+        raise SyncExpired()
+
+    upper = timezone.now() - SYNC_LAG
+    qs = queryset if queryset is not None else Employees.objects.all()
+    qs = _after(qs.filter(updated_at__lt=upper), "updated_at", updated_mark)
+    rows = list(qs.order_by("updated_at", "id")[:limit + 1])
+
+    tombstones = EmployeeTombstone.objects.filter(deleted_at__lt=upper)
+    tombstones = _after(tombstones, "deleted_at", deleted_mark)
+    deleted = list(
+        tombstones.order_by("deleted_at", "id").values_list("id", "employee_id", "deleted_at")[:limit + 1]
+    )
+
+    rows_more, deleted_more = len(rows) > limit, len(deleted) > limit
+    has_more = rows_more or deleted_more
+    rows, deleted = rows[:limit], deleted[:limit]
+
+    # Sin más pendientes, la marca pasa a `upper` aunque no haya cambios: así
+    # una tabla quieta no deja la marca atrás
+    if rows_more:
+        last = rows[-1]
+        updated_mark = (last["updated_at"], last["id"]) if isinstance(last, dict) else (last.updated_at, last.id)
+    else:
+        updated_mark = (upper, 0)
+    if deleted_more:
+        deleted_mark = (deleted[-1][2], deleted[-1][0])
+    else:
+        deleted_mark = (upper, 0)
+    if not has_more:
+        synced_at = upper
+
+    token = encode_cursor({
+        "u": _encode_mark(updated_mark),
+        "d": _encode_mark(deleted_mark),
+        "s": synced_at.isoformat() if synced_at else None,
+    })
+    return rows, [employee_id for _, employee_id, _ in deleted], token, has_more
+
+
+def touch_after_commit(emails):
+    """
+    Registra, dentro de la transacción en curso, que al confirmar se vuelva a
+    marcar updated_at de esos empleados (por email, único). Cada UPDATE es
+    corto y confirma enseguida, así que las filas quedan después de cualquier
+    marca entregada mientras la transacción larga seguía abierta.
+    """
+    emails = [email for email in emails if email]
+
+    def touch():
+        now = timezone.now()
+        for start in range(0, len(emails), TOUCH_BATCH_SIZE):
+            Employees.objects.filter(email__in=emails[start:start + TOUCH_BATCH_SIZE]).update(updated_at=now)
+
+    if emails:
+        transaction.on_commit(touch)
+
+
+def record_deletion(sender, instance, **kwargs):
+    """Receptor de post_delete de Employees"""
+    EmployeeTombstone.objects.create(employee_id=instance.pk)
+
+
+def prune_tombstones():
+    """Elimina las marcas más antiguas que la retención; devuelve cuántas borró"""
+    deleted, _ = EmployeeTombstone.objects.filter(deleted_at__lt=retention_horizon()).delete()
+    return deleted
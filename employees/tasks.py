@@ -0,0 +1,118 @@
+import logging
+
+from celery import shared_task
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import UnidentifiedImageError
+
+from .images import PHOTO_FORMATS, render_variants
+from .models import Employees
+from .services import report_service, sync_service
+
+logger = logging.getLogger(__name__)
+
+VARIANTS_DIR = "employee_photos/variants"
+
+
+def delete_photo_variants(storage, variants):
+    """Borra los archivos de un diccionario photo_variants que ningún empleado use"""
+    for formats in (variants or {}).values():
+        for name in formats.values():
+            # Dos fotos distintas pueden producir la misma variante (mismo contenido)
+            if Employees.objects.filter(photo_variants__icontains=name).exists():
+                continue
+            try:
+                storage.delete(name)
+            except OSError:
+                logger.warning("No se pudo eliminar la variante %s", name)
+
+
+def release_photo(storage, name, variants):
+    """
+    Libera una foto reemplazada o eliminada. Con el storage por contenido el
+    archivo puede estar compartido: solo se borra (con sus variantes, que se
+    derivan del mismo contenido) si ningún registro lo usa.
+    """
+    if not name:
+        return
+    try:
+        deleted = storage.delete(name)
+    except OSError:
+        logger.warning("No se pudo eliminar la foto %s", name)
+        return
+    if deleted is not False:
+        delete_photo_variants(storage, variants)
+
+
+def referenced_variant_names():
+    """Nombres de variantes en uso (para prune_media)"""
+    names = set()
+    for variants in Employees.objects.exclude(photo_variants__isnull=True).values_list("photo_variants", flat=True):
+        for formats in (variants or {}).values():
+            names.update(formats.values())
+    return names
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=10)
+def process_employee_photo(self, employee_id, photo_name):
+    """
+    Genera las variantes (thumb/medium, WebP/JPEG) de la foto `photo_name`.
+    Si el empleado cambió de foto mientras tanto, no hace nada.
+    """
+    employee = Employees.objects.filter(pk=employee_id).only("id", "photo", "photo_variants").first()
+    if employee is None or employee.photo.name != photo_name:
+        return None
+
+    storage = employee.photo.storage
+    try:
+        with storage.open(photo_name, "rb") as f:
+            rendered = render_variants(f)
+    except (UnidentifiedImageError, OSError) as e:
+        if isinstance(e, UnidentifiedImageError) or not storage.exists(photo_name):
+            logger.warning("Foto inválida para el empleado %s: %s", employee_id, e)
+            return None
+        raise self.retry(exc=e)
+
+    variants = {}
+    for variant, formats in rendered.items():
+        variants[variant] = {}
+        for fmt, data in formats.items():
+            extension = PHOTO_FORMATS[fmt][0]
+            # El storage renombra por contenido: <VARIANTS_DIR>/ab/cd/<sha256>.<ext>
+            name = f"{VARIANTS_DIR}/{variant}.{extension}"
+            variants[variant][fmt] = storage.save(name, ContentFile(data))
+
+    # update() no pasa por save(): se actualiza updated_at a mano para que los
+    # clientes (ETag, sincronización) vean la nueva URL
+    updated = Employees.objects.filter(pk=employee_id, photo=photo_name).update(
+        photo_variants=variants, updated_at=timezone.now()
+    )
+    if not updated:
+        # La foto cambió mientras se procesaba (se conservan las variantes en uso)
+        delete_photo_variants(storage, variants)
+        return None
+
+    if employee.photo_variants and employee.photo_variants != variants:
+        delete_photo_variants(storage, employee.photo_variants)
+    return variants
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=30)
+def render_employee_roster(self, filters, rid):
+    """Genera el PDF de nómina (cola `reports`); devuelve la ruta del archivo"""
+    try:
+        return report_service.render_report(filters, rid)
+    except OSError as e:
+        raise self.retry(exc=e)
+
+
+@shared_task
+def prune_employee_reports():
+    """Tarea periódica (beat): borra los PDF de nómina fuera de la retención"""
+    return report_service.prune_reports()
+
+
+@shared_task
+def prune_employee_tombstones():
+    """Tarea periódica (beat): depura las eliminaciones fuera de la retención"""
+    return sync_service.prune_tombstones()
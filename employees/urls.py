@@ -1,16 +1,29 @@
 from django.urls import path
 from .views.employee import (
-    employee_list, employee_create, employee_delete, employee_update, employee_detail,
-    employee_photo_upload, employee_photo_update, employee_photo_delete
+    employee_list, employee_create, employee_bulk, employee_export, employee_sync, employee_delete, employee_update, employee_detail,
+    employee_photo_upload, employee_photo_update, employee_photo_delete,
+    EmployeeViewSet,
 )
+from .views.analytics import employee_analytics
+from .views.report import employee_report_create, employee_report_status, employee_report_download
 
 urlpatterns = [
     # Rutas de empleados
     path("employee/", employee_list, name="employee_list"),
     path("employee/create/", employee_create, name="employee_create"),
+    path("employee/bulk/", employee_bulk, name="employee_bulk"),
+    path("employee/export/", employee_export, name="employee_export"),
+    path("employee/analytics/", employee_analytics, name="employee_analytics"),
+    path("employee/sync/", employee_sync, name="employee_sync"),
+    path("employee/search/", EmployeeViewSet.as_view({"get": "list"}), name="employee_search"),
     path("employee/<int:pk>/", employee_detail, name="employee_detail"),
     path("employee/<int:pk>/edit/", employee_update, name="employee_update"),
     path("employee/<int:pk>/delete/", employee_delete, name="employee_delete"),
+
+    # Reportes PDF (generados en segundo plano)
+    path("employee/report/", employee_report_create, name="employee_report_create"),
+    path("employee/report/<str:report_id>/", employee_report_status, name="employee_report_status"),
+    path("employee/report/<str:report_id>/download/", employee_report_download, name="employee_report_download"),
     
     # Rutas de fotos de empleados
     path("employee/<int:pk>/photo/", employee_photo_upload, name="employee_photo_upload"),
@@ -0,0 +1,24 @@
+from django.http import JsonResponse, HttpResponseNotAllowed
+from django.views.decorators.csrf import csrf_exempt
+from ..analytics import workforce_summary
+
+
+@csrf_exempt
+def employee_analytics(request):
+    """
+    GET: indicadores de personal (dotación, tramos de edad, percentiles de salario).
+    Filtros opcionales: region, province, rol (IDs) y gender (M/F/O).
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    try:
+        data = workforce_summary(
+            region=request.GET.get("region"),
+            province=request.GET.get("province"),
+            rol=request.GET.get("rol"),
+            gender=request.GET.get("gender"),
+        )
+    except ValueError:
+        return JsonResponse({"error": "Los filtros region, province y rol deben ser IDs numéricos"}, status=400)
+    return JsonResponse(data)
@@ -1,19 +1,52 @@
+import hashlib
 import json
-import os
-from django.http import JsonResponse, HttpResponseNotAllowed
+import logging
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, HttpResponseNotAllowed, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
+from django.db.models import Count, Max
+from django.db import transaction
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
 from ..models.employee import Employees
 from ..serializers.employee import EmployeeSerializer
+from ..services import bulk_service
+from ..services.employee_service import InvalidFilter, filter_employees
+from ..services import sync_service
+from ..search import FullTextSearchFilter, search_employees
+from ..fieldsets import SERIALIZER_FIELDS, InvalidFields, apply_fields, parse_fields
+from .. import projections
+from ..tasks import process_employee_photo, release_photo
 from datetime import datetime
-from rest_framework import viewsets, filters, status
+from rest_framework import viewsets, status
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+from architect.utils.pagination import InvalidCursor, keyset_page, parse_limit, iter_keyset
+from architect.utils.projection import ProjectionListMixin
+from architect.utils.xlsx_export import Column, export_filename, xlsx_response
+from architect.utils import reference_data
+from architect.models.permission import Role
+from app_types.models.document_type import DocumentType
+from ubi_geo.models import Region, Province, District
 
-class EmployeeViewSet(viewsets.ModelViewSet):
+logger = logging.getLogger(__name__)
+
+# Filas por consulta (y por bloque enviado) en el modo streaming
+STREAM_CHUNK_SIZE = 500
+
+# Catálogos cuyos nombres aparecen en la representación del empleado: si
+# cambian, también cambia el ETag
+REPRESENTATION_MODELS = (DocumentType, Role, Region, Province, District)
+
+class EmployeeViewSet(ProjectionListMixin, viewsets.ModelViewSet):
 
     serializer_class = EmployeeSerializer
-    filter_backends = [filters.SearchFilter]
+    # list() arma la misma salida que EmployeeSerializer desde filas .values()
+    projection = projections.EMPLOYEE_API
+    # ?search= usa el índice FULLTEXT de search_document (ordenado por relevancia);
+    # search_fields queda como referencia de las columnas que lo componen
+    filter_backends = [FullTextSearchFilter]
     search_fields = [
         "name",
         "last_name_paternal",
@@ -33,74 +66,254 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         """
         - Usa select_related para evitar N+1 en las FKs de ubicación.
         - Filtra por activo/inactivo (param 'active').
-        - Filtra opcionalmente por IDs de region/province/district.
+        - Filtra opcionalmente por IDs de region/province/district/rol.
         """
         qs = (
-            Employees.objects.select_related("region", "province", "district")
+            Employees.objects.select_related("document_type", "rol", "region", "province", "district")
             .all()
         )
 
-        # filtros por ubicación (IDs)
-        region = self.request.query_params.get("region")
-        province = self.request.query_params.get("province")
-        district = self.request.query_params.get("district")
-        if region:
-            qs = qs.filter(region_id=region)
-        if province:
-            qs = qs.filter(province_id=province)
-        if district:
-            qs = qs.filter(district_id=district)
-
+        try:
+            qs = filter_employees(qs, self.request.query_params)
+        except InvalidFilter as e:
+            raise ValidationError({"error": str(e)})
+        if self.request.method == "GET":
+            qs = apply_fields(qs, self.requested_fields(), SERIALIZER_FIELDS)
         return qs
 
+    def requested_fields(self):
+        """Claves pedidas con ?fields= (solo lecturas); None = respuesta completa"""
+        if self.request.method != "GET":
+            return None
+        try:
+            return parse_fields(self.request.query_params.get("fields"), SERIALIZER_FIELDS)
+        except InvalidFields as e:
+            raise ValidationError({"fields": str(e)})
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.requested_fields()
+        if fields:
+            kwargs["fields"] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def get_projection_fields(self):
+        return self.requested_fields()
+
+    def get_projection_context(self):
+        # En listados basta la miniatura
+        return {"photo_variant": "thumb"}
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        # En listados basta la miniatura
+        if self.action == "list":
+            context["photo_variant"] = "thumb"
+        return context
+
+def _stream_employees(rows, to_dict):
+    """
+    Genera el mismo JSON que la lista completa, pero por bloques keyset:
+    la memoria del worker no depende del tamaño de la tabla.
+    """
+    def generate():
+        yield '{"employees": ['
+        buffer = []
+        first = True
+        for row in iter_keyset(rows, chunk_size=STREAM_CHUNK_SIZE):
+            buffer.append(json.dumps(to_dict(row), cls=DjangoJSONEncoder))
+            if len(buffer) >= STREAM_CHUNK_SIZE:
+                yield ("" if first else ",") + ",".join(buffer)
+                first = False
+                buffer = []
+        if buffer:
+            yield ("" if first else ",") + ",".join(buffer)
+        yield "]}"
+
+    return StreamingHttpResponse(generate(), content_type="application/json")
+
+
+def _etag(*parts):
+    versions = [reference_data.get_version(model) for model in REPRESENTATION_MODELS]
+    raw = json.dumps([parts, versions], cls=DjangoJSONEncoder)
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def _list_stats(request):
+    """max(updated_at) y count de la tabla; una sola consulta por petición"""
+    if not hasattr(request, "_employee_list_stats"):
+        request._employee_list_stats = Employees.objects.order_by().aggregate(
+            last_updated=Max("updated_at"), total=Count("id")
+        )
+    return request._employee_list_stats
+
+
+def _list_etag(request):
+    stats = _list_stats(request)
+    # Los parámetros (cursor, limit, stream) cambian el contenido de la respuesta
+    params = sorted(request.GET.lists())
+    return _etag("list", params, stats["last_updated"], stats["total"])
+
+
+def _list_last_modified(request):
+    return _list_stats(request)["last_updated"]
+
+
+def _detail_updated_at(request, pk):
+    if not hasattr(request, "_employee_updated_at"):
+        request._employee_updated_at = (
+            Employees.objects.filter(pk=pk).values_list("updated_at", flat=True).first()
+        )
+    return request._employee_updated_at
+
+
+def _detail_etag(request, pk):
+    updated_at = _detail_updated_at(request, pk)
+    if not updated_at:
+        return None
+    # ?fields= cambia la representación
+    return _etag("detail", pk, updated_at, sorted(request.GET.lists()))
+
+
+def _detail_last_modified(request, pk):
+    return _detail_updated_at(request, pk)
+
+
 @csrf_exempt
+@condition(etag_func=_list_etag, last_modified_func=_list_last_modified)
 def employee_list(request):
+    """
+    GET: lista de empleados.
+      - ?limit=<n>&cursor=<token>  -> página keyset ordenada por id
+      - ?stream=1                  -> lista completa en streaming
+      - sin parámetros             -> lista completa (comportamiento original)
+      - ?fields=id,full_name       -> solo esas claves (y solo esas columnas)
+    Responde 304 si el ETag (max(updated_at), count y parámetros) coincide.
+    """
     if request.method != "GET":
         return HttpResponseNotAllowed(["GET"])
     
-    qs = Employees.objects.select_related("document_type", "rol", "region", "province", "district")
-    data = []
-    for e in qs:
-        data.append({
-            "id": e.id,
-            "name": e.name,
-            "last_name_paternal": e.last_name_paternal,
-            "last_name_maternal": e.last_name_maternal,
-            "full_name": e.get_full_name(),
-            "document_type": (
-                {"id": e.document_type.id, "name": e.document_type.name}
-                if e.document_type else None
-            ),
-            "document_number": e.document_number,
-            "email": e.email,
-            "gender": e.gender,
-            "phone": e.phone,
-            "birth_date": e.birth_date.isoformat() if e.birth_date else None,
-            "region": (
-                {"id": e.region.id, "name": e.region.name}
-                if e.region else None
-            ),
-            "province": (
-                {"id": e.province.id, "name": e.province.name}
-                if e.province else None
-            ),
-            "district": (
-                {"id": e.district.id, "name": e.district.name}
-                if e.district else None
-            ),
-            "rol": (
-                {"id": e.rol.id, "name": e.rol.name}
-                if e.rol else None
-            ),
-            "salary": e.salary,
-            "address": e.address,
-            "photo_url": e.get_photo_url(),
-            "created_at": e.created_at.isoformat() if e.created_at else None,
-            "updated_at": e.updated_at.isoformat() if e.updated_at else None
+    try:
+        fields = parse_fields(request.GET.get("fields"), projections.EMPLOYEE)
+    except InvalidFields as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    # Solo las columnas de `fields`, con los nombres de catálogo por join
+    rows = projections.EMPLOYEE.values(Employees.objects.all(), fields)
+    to_dict = projections.EMPLOYEE.compile(fields, photo_variant="thumb")
+
+    if request.GET.get("stream") in ("1", "true"):
+        return _stream_employees(rows, to_dict)
+
+    if "cursor" in request.GET or "limit" in request.GET:
+        try:
+            limit = parse_limit(request.GET.get("limit"))
+            items, next_cursor, has_more = keyset_page(rows, request.GET.get("cursor"), limit)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        return JsonResponse({
+            "employees": [to_dict(row) for row in items],
+            "next_cursor": next_cursor,
+            "has_more": has_more,
         })
+
+    data = [to_dict(row) for row in rows]
     return JsonResponse({"employees": data})
 
 
+def _name_of(obj):
+    return obj.name if obj else None
+
+
+EMPLOYEE_EXPORT_COLUMNS = [
+    Column("ID", lambda e: e.id, 8),
+    Column("Nombre", lambda e: e.name, 20),
+    Column("Apellido Paterno", lambda e: e.last_name_paternal, 20),
+    Column("Apellido Materno", lambda e: e.last_name_maternal, 20),
+    Column("Tipo de Documento", lambda e: _name_of(e.document_type), 18),
+    Column("Número de Documento", lambda e: e.document_number, 18),
+    Column("Correo", lambda e: e.email, 30),
+    Column("Sexo", lambda e: e.get_gender_display() if e.gender else None, 12),
+    Column("Teléfono", lambda e: e.phone, 15),
+    Column("Fecha de Nacimiento", lambda e: e.birth_date, 18),
+    Column("Región", lambda e: _name_of(e.region), 18),
+    Column("Provincia", lambda e: _name_of(e.province), 18),
+    Column("Distrito", lambda e: _name_of(e.district), 18),
+    Column("Rol", lambda e: _name_of(e.rol), 15),
+    Column("Salario", lambda e: e.salary, 12),
+    Column("Dirección", lambda e: e.address, 35),
+    Column("Fecha de Creación", lambda e: e.created_at, 18),
+    Column("Fecha de Actualización", lambda e: e.updated_at, 18),
+]
+
+
+@csrf_exempt
+def employee_export(request):
+    """
+    GET: exporta los empleados a XLSX.
+    Acepta los mismos filtros que el listado: region, province, district, rol y search.
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    qs = Employees.objects.select_related("document_type", "rol", "region", "province", "district")
+    try:
+        qs = filter_employees(qs, request.GET)
+    except InvalidFilter as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    if request.GET.get("search"):
+        qs = search_employees(qs, request.GET["search"])
+
+    return xlsx_response(qs, EMPLOYEE_EXPORT_COLUMNS, export_filename("empleados"), sheet_name="Empleados")
+
+
+@csrf_exempt
+def employee_sync(request):
+    """
+    GET: sincronización incremental.
+      - sin parámetros               -> descarga inicial, por páginas
+      - ?updated_since=<ISO 8601>     -> cambios desde esa fecha
+      - ?token=<next_token>           -> continúa desde la respuesta anterior
+    Acepta ?limit= y ?fields=. Responde {"employees", "deleted", "next_token",
+    "has_more"}; con has_more=false el token se guarda para la próxima
+    sincronización. 410 si el token es más antiguo que la retención de
+    eliminaciones (hay que descargar todo de nuevo).
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    try:
+        fields = parse_fields(request.GET.get("fields"), projections.EMPLOYEE)
+    except InvalidFields as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    qs = projections.EMPLOYEE.values(Employees.objects.all(), fields, keys=("id", "updated_at"))
+    to_dict = projections.EMPLOYEE.compile(fields, photo_variant="thumb")
+
+    try:
+        limit = parse_limit(request.GET.get("limit"))
+        if request.GET.get("token"):
+            updated_mark, deleted_mark, synced_at = sync_service.decode_token(request.GET["token"])
+        else:
+            updated_mark, deleted_mark, synced_at = sync_service.initial_marks(request.GET.get("updated_since"))
+        rows, deleted, token, has_more = sync_service.changes(
+            updated_mark, deleted_mark, limit, qs, synced_at=synced_at
+        )
+    except (InvalidCursor, sync_service.InvalidUpdatedSince) as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    except sync_service.SyncExpired:
+        return JsonResponse({
+            "error": "El token de sincronización expiró; descargue la lista completa",
+            "full_resync": True,
+        }, status=410)
+
+    return JsonResponse({
+        "employees": [to_dict(row) for row in rows],
+        "deleted": deleted,
+        "next_token": token,
+        "has_more": has_more,
+    })
+
+
 @csrf_exempt
 def employee_create(request):
     if request.method != "POST":
@@ -160,6 +373,54 @@ def employee_create(request):
         return JsonResponse({"error": f"Error al crear al empleado: {str(e)}"}, status=500)
 
 
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def _parse_bulk_rows(request):
+    """Acepta un arreglo JSON, {"employees": [...]} o NDJSON (un objeto por línea)"""
+    body = request.body.decode('utf-8')
+    if request.content_type in NDJSON_CONTENT_TYPES:
+        return [json.loads(line) for line in body.splitlines() if line.strip()]
+    payload = json.loads(body)
+    if isinstance(payload, dict):
+        payload = payload.get("employees")
+    if not isinstance(payload, list):
+        raise ValueError("Se esperaba un arreglo de empleados")
+    return payload
+
+
+@csrf_exempt
+def employee_bulk(request):
+    """POST: crea (filas sin "id") o actualiza (filas con "id") empleados en bloque"""
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+
+    try:
+        rows = _parse_bulk_rows(request)
+    except (ValueError, UnicodeDecodeError) as e:
+        return JsonResponse({"error": f"Error al procesar JSON: {str(e)}"}, status=400)
+
+    if not rows:
+        return JsonResponse({"error": "No se enviaron empleados"}, status=400)
+    if len(rows) > bulk_service.MAX_BULK_ROWS:
+        return JsonResponse(
+            {"error": f"Máximo {bulk_service.MAX_BULK_ROWS} empleados por petición"}, status=400
+        )
+
+    try:
+        result = bulk_service.bulk_upsert(rows)
+    except Exception as e:
+        return JsonResponse({"error": f"Error en la carga masiva: {str(e)}"}, status=500)
+
+    if "errors" in result:
+        return JsonResponse(result, status=400)
+
+    return JsonResponse({
+        "message": "Carga masiva completada exitosamente",
+        **result,
+    }, status=201 if result["created"] else 200)
+
+
 @csrf_exempt
 def employee_update(request, pk):
     if request.method not in ["PUT", "PATCH"]:
@@ -243,52 +504,34 @@ def employee_delete(request, pk):
 
 
 @csrf_exempt
+@condition(etag_func=_detail_etag, last_modified_func=_detail_last_modified)
 def employee_detail(request, pk):
     if request.method != "GET":
         return HttpResponseNotAllowed(["GET"])
     
     try:
-        employee = Employees.objects.select_related("document_type", "rol", "region", "province", "district").get(pk=pk)
-        data = {
-            "id": employee.id,
-            "name": employee.name,
-            "last_name_paternal": employee.last_name_paternal,
-            "last_name_maternal": employee.last_name_maternal,
-            "full_name": employee.get_full_name(),
-            "document_type": (
-                {"id": employee.document_type.id, "name": employee.document_type.name}
-                if employee.document_type else None
-            ),
-            "document_number": employee.document_number,
-            "email": employee.email,
-            "gender": employee.gender,
-            "phone": employee.phone,
-            "birth_date": employee.birth_date.isoformat() if employee.birth_date else None,
-            "region": (
-                {"id": employee.region.id, "name": employee.region.name}
-                if employee.region else None
-            ),
-            "province": (
-                {"id": employee.province.id, "name": employee.province.name}
-                if employee.province else None
-            ),
-            "district": (
-                {"id": employee.district.id, "name": employee.district.name}
-                if employee.district else None
-            ),
-            "rol": (
-                {"id": employee.rol.id, "name": employee.rol.name}
-                if employee.rol else None
-            ),
-            "salary": employee.salary,
-            "address": employee.address,
-            "photo_url": employee.get_photo_url(),
-            "created_at": employee.created_at.isoformat() if employee.created_at else None,
-            "updated_at": employee.updated_at.isoformat() if employee.updated_at else None
-        }
-        return JsonResponse(data)
-    except Employees.DoesNotExist:
+        fields = parse_fields(request.GET.get("fields"), projections.EMPLOYEE)
+    except InvalidFields as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    row = projections.EMPLOYEE.values(Employees.objects.filter(pk=pk), fields).first()
+    if row is None:
         return JsonResponse({"error": "Empleado no encontrado"}, status=404)
+    return JsonResponse(projections.EMPLOYEE.compile(fields, photo_variant="medium")(row))
+
+def _enqueue_photo_processing(employee):
+    """Encola la generación de variantes al confirmar la transacción"""
+    employee_id, photo_name = employee.pk, employee.photo.name
+
+    def enqueue():
+        try:
+            process_employee_photo.delay(employee_id, photo_name)
+        except Exception:
+            # Sin broker la foto original sigue sirviéndose; no se pierde la subida
+            logger.exception("No se pudo encolar el procesamiento de la foto del empleado %s", employee_id)
+
+    transaction.on_commit(enqueue)
+
 
 @csrf_exempt
 def employee_photo_upload(request, pk):
@@ -316,18 +559,22 @@ def employee_photo_upload(request, pk):
         return JsonResponse({"error": "El archivo es demasiado grande. Máximo 5MB"}, status=400)
     
     try:
-        # Eliminar foto anterior si existe
-        if employee.photo:
-            if os.path.isfile(employee.photo.path):
-                os.remove(employee.photo.path)
+        old_name, old_variants = employee.photo.name, employee.photo_variants
         
-        # Guardar nueva foto
+        # Guardar nueva foto; las variantes se generan en segundo plano
         employee.photo = photo_file
+        employee.photo_variants = None
         employee.save()
+        _enqueue_photo_processing(employee)
+        
+        # Liberar la foto anterior (y sus variantes) si ya nadie la usa
+        if old_name and old_name != employee.photo.name:
+            release_photo(employee.photo.storage, old_name, old_variants)
         
         return JsonResponse({
             "message": "Foto subida exitosamente",
-            "photo_url": employee.get_photo_url()
+            "photo_url": employee.get_photo_url(),
+            "processing": True
         }, status=200)
         
     except Exception as e:
@@ -368,14 +615,17 @@ def employee_photo_delete(request, pk):
         return JsonResponse({"error": "El empleado no tiene foto para eliminar"}, status=400)
     
     try:
-        # Eliminar archivo físico si existe
-        if os.path.isfile(employee.photo.path):
-            os.remove(employee.photo.path)
+        storage = employee.photo.storage
+        old_name, old_variants = employee.photo.name, employee.photo_variants
         
         # Limpiar campo en la base de datos
         employee.photo = None
+        employee.photo_variants = None
         employee.save()
         
+        # El archivo puede estar compartido: solo se borra si ya nadie lo usa
+        release_photo(storage, old_name, old_variants)
+        
         return JsonResponse({
             "message": "Foto eliminada exitosamente"
         }, status=200)
@@ -0,0 +1,111 @@
+import json
+from celery.result import AsyncResult
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.http import FileResponse, JsonResponse, HttpResponseNotAllowed
+from django.urls import reverse
+from django.views.decorators.csrf import csrf_exempt
+from ..services import report_service
+from ..services.employee_service import InvalidFilter
+from ..tasks import render_employee_roster
+
+# Evita encolar el mismo reporte varias veces mientras se genera
+QUEUED_KEY = "employee_report:queued:{}"
+QUEUED_TIMEOUT = 10 * 60
+
+
+def _task_id(rid):
+    # id determinista: cualquier proceso puede consultar el estado en el backend de resultados
+    return f"employee-roster-{rid}"
+
+
+def _report_payload(request, rid, status, **extra):
+    data = {
+        "report_id": rid,
+        "status": status,
+        "status_url": request.build_absolute_uri(reverse("employee_report_status", args=[rid])),
+    }
+    if status == "ready":
+        data["download_url"] = request.build_absolute_uri(reverse("employee_report_download", args=[rid]))
+    data.update(extra)
+    return data
+
+
+@csrf_exempt
+def employee_report_create(request):
+    """
+    POST: solicita el PDF de nómina. Filtros (JSON o query string):
+    region, province, district, rol, search.
+      - 200 si ya existe un PDF para los mismos filtros y datos
+      - 202 si se encoló la generación; consultar status_url
+    """
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+
+    params = request.GET.dict()
+    if request.body:
+        try:
+            body = json.loads(request.body.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return JsonResponse({"error": f"Error al procesar JSON: {str(e)}"}, status=400)
+        if not isinstance(body, dict):
+            return JsonResponse({"error": "Se esperaba un objeto JSON con los filtros"}, status=400)
+        params.update(body)
+
+    try:
+        filters = report_service.normalize_filters(params)
+    except InvalidFilter as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    rid = report_service.report_id(filters)
+
+    if default_storage.exists(report_service.report_path(rid)):
+        return JsonResponse(_report_payload(request, rid, "ready", cached=True), status=200)
+
+    queued_key = QUEUED_KEY.format(rid)
+    if AsyncResult(_task_id(rid)).state == "FAILURE":
+        cache.delete(queued_key)
+    if cache.add(queued_key, True, timeout=QUEUED_TIMEOUT):
+        try:
+            render_employee_roster.apply_async(args=[filters, rid], task_id=_task_id(rid))
+        except Exception as e:
+            cache.delete(queued_key)
+            return JsonResponse({"error": f"No se pudo encolar el reporte: {str(e)}"}, status=503)
+
+    return JsonResponse(_report_payload(request, rid, "pending"), status=202)
+
+
+@csrf_exempt
+def employee_report_status(request, report_id):
+    """GET: estado del reporte (pending | ready | failed)"""
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+    if not report_service.is_valid_report_id(report_id):
+        return JsonResponse({"error": "Reporte no encontrado"}, status=404)
+
+    if default_storage.exists(report_service.report_path(report_id)):
+        return JsonResponse(_report_payload(request, report_id, "ready"))
+
+    result = AsyncResult(_task_id(report_id))
+    if result.state == "FAILURE":
+        return JsonResponse(_report_payload(request, report_id, "failed", error=str(result.result)))
+    return JsonResponse(_report_payload(request, report_id, "pending"))
+
+
+@csrf_exempt
+def employee_report_download(request, report_id):
+    """GET: descarga el PDF generado"""
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+    if not report_service.is_valid_report_id(report_id):
+        return JsonResponse({"error": "Reporte no encontrado"}, status=404)
+
+    path = report_service.report_path(report_id)
+    if not default_storage.exists(path):
+        return JsonResponse({"error": "El reporte aún no está disponible"}, status=404)
+
+    return FileResponse(
+        default_storage.open(path, "rb"),
+        as_attachment=True,
+        filename=f"empleados_{report_id[:8]}.pdf",
+        content_type="application/pdf",
+    )
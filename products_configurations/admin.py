@@ -16,6 +16,8 @@ class CategoryAdmin(admin.ModelAdmin):
 class SupplierAdmin(admin.ModelAdmin):
     list_display = ('id', 'ruc','company_name', 'business_name', 'representative', 'phone',
             'email', 'address', 'account_number', 'region', 'province', 'district')
+    # Province/District.__str__ usan full_path: basta el join directo
+    list_select_related = ('region', 'province', 'district')
     search_fields = ('ruc', 'company_name', 'business_name', 'representative')
     ordering = ('company_name', 'ruc', 'representative', 'business_name')
     readonly_fields = ('created_at', 'updated_at')
@@ -1,5 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save, post_delete
 
 class ProductsConfigurationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'products_configurations'
+
+    def ready(self):
+        # La búsqueda por RUC/email/cuenta se cachea: se invalida al cambiar un proveedor
+        from .models.supplier import Supplier
+        from .services.supplier_lookup_service import invalidate
+        post_save.connect(invalidate, sender=Supplier, dispatch_uid="supplier_lookup_save")
+        post_delete.connect(invalidate, sender=Supplier, dispatch_uid="supplier_lookup_delete")
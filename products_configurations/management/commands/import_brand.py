@@ -1,7 +1,9 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
 from pathlib import Path
 import csv
+import time
 
 from products_configurations.models import Brand
 from ubi_geo.models import Country
@@ -17,8 +19,19 @@ def getv(row, *cands):
     return ""
 
 
+def name_key(name):
+    """
+    Clave de comparación de nombres: la colación de MySQL no distingue
+    mayúsculas, así que "Samsung" y "SAMSUNG" son la misma marca.
+    """
+    return (name or "").strip().casefold()
+
+
 class Command(BaseCommand):
-    help = "Importa marcas (Brand) desde un archivo CSV delimitado por ';'."
+    help = (
+        "Importa marcas (Brand) desde un archivo CSV delimitado por ';'. "
+        "Compara el archivo con la base en memoria y escribe con bulk_create/bulk_update."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -32,25 +45,58 @@ class Command(BaseCommand):
             action="store_true",
             help="Borra todas las marcas antes de importar.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Filas por INSERT/UPDATE (por defecto: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Muestra el resumen de cambios sin escribir en la base.",
+        )
 
     def handle(self, *args, **opt):
         csv_path = Path(opt["path"]).resolve()
+        batch_size = opt["batch_size"]
 
         if not csv_path.exists():
             raise CommandError(f"No se encontró el archivo: {csv_path}")
+        if batch_size < 1:
+            raise CommandError("--batch-size debe ser mayor que 0")
 
-        if opt["truncate"]:
-            self.stdout.write(self.style.WARNING("Eliminando todas las marcas existentes..."))
-            Brand.objects.all().delete()
-
+        start = time.monotonic()
         self.stdout.write(f"Importando marcas desde {csv_path}…")
 
-        with csv_path.open(encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter=";")
-            created = updated = skipped = 0
-
-            with transaction.atomic():
-                for row in reader:
+        with transaction.atomic():
+            if opt["truncate"] and not opt["dry_run"]:
+                self.stdout.write(self.style.WARNING("Eliminando todas las marcas existentes..."))
+                Brand.objects.all().delete()
+
+            # Una consulta por tabla: países por id y marcas existentes por nombre
+            country_ids = set(Country.objects.values_list("id", flat=True))
+            existing = {}
+            duplicated = 0
+            for pk, name, description, country_id in (
+                Brand.objects.order_by("id").values_list("id", "name", "description", "country_id")
+            ):
+                key = name_key(name)
+                if not key:
+                    continue
+                if key in existing:
+                    # Nombres repetidos en la base: se actualiza la marca más antigua
+                    duplicated += 1
+                    continue
+                existing[key] = (pk, description, country_id)
+
+            to_create, to_update = {}, {}
+            seen = set()
+            skipped = repeated = 0
+            missing_countries = {}
+
+            with csv_path.open(encoding="utf-8", newline="") as f:
+                for row in csv.DictReader(f, delimiter=";"):
                     name = getv(row, "name", "Name")
                     description = getv(row, "description", "Description")
                     country_id = getv(row, "country_id", "Country_id", "country")
@@ -58,27 +104,51 @@ class Command(BaseCommand):
                     if not name or not country_id:
                         skipped += 1
                         continue
-
                     try:
-                        country = Country.objects.get(id=country_id)
-                    except Country.DoesNotExist:
-                        self.stdout.write(self.style.WARNING(f"País con id={country_id} no encontrado, omitiendo {name}"))
+                        country_id = int(country_id)
+                    except ValueError:
+                        country_id = None
+                    if country_id not in country_ids:
+                        missing_countries[country_id] = missing_countries.get(country_id, 0) + 1
                         skipped += 1
                         continue
 
-                    obj, created_flag = Brand.objects.update_or_create(
-                        name=name,
-                        defaults={
-                            "description": description,
-                            "country": country,
-                        },
-                    )
-
-                    if created_flag:
-                        created += 1
+                    # Nombre repetido en el CSV: la última fila gana, como con update_or_create
+                    # La marca existente conserva su nombre, como con update_or_create
+                    key = name_key(name)
+                    if key in seen:
+                        repeated += 1
+                    seen.add(key)
+                    current = existing.get(key)
+                    if current is None:
+                        to_create[key] = Brand(name=name, description=description, country_id=country_id)
+                    elif (current[1], current[2]) != (description, country_id):
+                        to_update[key] = Brand(pk=current[0], description=description, country_id=country_id)
                     else:
-                        updated += 1
-
+                        to_update.pop(key, None)
+            same = len(seen) - len(to_create) - len(to_update)
+
+            if not opt["dry_run"]:
+                Brand.objects.bulk_create(to_create.values(), batch_size=batch_size)
+                # bulk_update no pasa por auto_now
+                now = timezone.now()
+                for obj in to_update.values():
+                    obj.updated_at = now
+                Brand.objects.bulk_update(
+                    to_update.values(), ["description", "country_id", "updated_at"], batch_size=batch_size
+                )
+
+        for country_id, count in sorted(missing_countries.items(), key=lambda item: str(item[0])):
+            self.stdout.write(self.style.WARNING(f"País con id={country_id} no encontrado: {count} filas omitidas"))
+        if repeated:
+            self.stdout.write(self.style.WARNING(f"Nombres repetidos en el CSV: {repeated} (se usó la última fila)"))
+        if duplicated:
+            self.stdout.write(self.style.WARNING(
+                f"Marcas con nombre repetido en la base: {duplicated} (solo se actualizó la más antigua)"
+            ))
+
+        prefix = "Simulación (--dry-run)" if opt["dry_run"] else "Importación completada ✔"
         self.stdout.write(self.style.SUCCESS(
-            f"Importación completada ✔  Nuevas: {created} | Actualizadas: {updated} | Omitidas: {skipped}"
+            f"{prefix}  Nuevas: {len(to_create)} | Actualizadas: {len(to_update)} | "
+            f"Sin cambios: {same} | Omitidas: {skipped} ({time.monotonic() - start:.2f}s)"
         ))
@@ -0,0 +1,39 @@
+"""Proyecciones de proveedores y marcas (ver architect.utils.projection)"""
+from architect.utils.projection import Column, Projection, Related, isoformat
+from ubi_geo import registry
+
+SUPPLIER = Projection(
+    id=Column("id"),
+    ruc=Column("ruc"),
+    company_name=Column("company_name"),
+    business_name=Column("business_name"),
+    representative=Column("representative"),
+    phone=Column("phone"),
+    email=Column("email"),
+    address=Column("address"),
+    account_number=Column("account_number"),
+    region=Related("region", lookup=registry.region_name),
+    province=Related("province", lookup=registry.province_name),
+    district=Related("district", lookup=registry.district_name),
+    created_at=Column("created_at", isoformat),
+    updated_at=Column("updated_at", isoformat),
+)
+
+# Datos clave para conciliar facturas (services.supplier_lookup_service)
+SUPPLIER_LOOKUP = Projection(
+    id=Column("id"),
+    ruc=Column("ruc"),
+    company_name=Column("company_name"),
+    business_name=Column("business_name"),
+    email=Column("email"),
+    account_number=Column("account_number"),
+)
+
+BRAND = Projection(
+    id=Column("id"),
+    name=Column("name"),
+    description=Column("description"),
+    country=Related("country"),
+    created_at=Column("created_at", isoformat),
+    updated_at=Column("updated_at", isoformat),
+)
@@ -4,6 +4,9 @@ import re
 from datetime import date
 from ubi_geo.models import Region, Province, District
 from ubi_geo.serializers import RegionSerializer, ProvinceSerializer, DistrictSerializer
+from architect.serializers.fields import CachedPrimaryKeyRelatedField
+from ubi_geo.registry import validate_hierarchy
+from ubi_geo.serializers.fields import LocationNameField
 
 class SupplierSerializer(serializers.ModelSerializer):
     # Serializadores anidados para mostrar datos completos
@@ -12,26 +15,26 @@ class SupplierSerializer(serializers.ModelSerializer):
     district = DistrictSerializer(read_only=True)
     
     # Campos de nombres para mostrar en lugar de IDs
-    region_name = serializers.CharField(source='region.name', read_only=True)
-    province_name = serializers.CharField(source='province.name', read_only=True)
-    district_name = serializers.CharField(source='district.name', read_only=True)
+    region_name = LocationNameField("region", "region_id")
+    province_name = LocationNameField("province", "province_id")
+    district_name = LocationNameField("district", "district_id")
     
     # Campos para escritura (crear/actualizar)
-    region_id = serializers.PrimaryKeyRelatedField(
+    region_id = CachedPrimaryKeyRelatedField(
         queryset=Region.objects.all(), 
         source='region', 
         write_only=True,
         required=False,
         allow_null=True
     )
-    province_id = serializers.PrimaryKeyRelatedField(
+    province_id = CachedPrimaryKeyRelatedField(
         queryset=Province.objects.all(), 
         source='province', 
         write_only=True,
         required=False,
         allow_null=True
     )
-    district_id = serializers.PrimaryKeyRelatedField(
+    district_id = CachedPrimaryKeyRelatedField(
         queryset=District.objects.all(), 
         source='district', 
         write_only=True,
@@ -55,16 +58,7 @@ class SupplierSerializer(serializers.ModelSerializer):
         province debe pertenecer a region
         district debe pertenecer a province
         """
-        region = attrs.get("region") or getattr(self.instance, "region", None)
-        province = attrs.get("province") or getattr(self.instance, "province", None)
-        district = attrs.get("district") or getattr(self.instance, "district", None)
-
-        if province and region and province.region_id != region.id:
-            raise serializers.ValidationError(
-                "La provincia seleccionada no pertenece a la región."
-            )
-        if district and province and district.province_id != province.id:
-            raise serializers.ValidationError(
-                "El distrito seleccionado no pertenece a la provincia."
-            )
+        error = validate_hierarchy(attrs, self.instance)
+        if error:
+            raise serializers.ValidationError(error)
         return attrs
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Búsqueda de proveedores por RUC, email o número de cuenta en lote.
+
+Los tres campos son únicos (con índice), así que cada lote es un solo
+`WHERE campo IN (...)`. Cada valor se guarda en la caché por LOOKUP_CACHE_TTL
+segundos, también los que no existen, para que conciliar varias veces las
+mismas facturas no vuelva a la base. Las claves llevan una generación que se
+incrementa al guardar o borrar un proveedor (ver apps.py).
+
+La generación vive en CACHES['default']. Con LocMemCache (la configuración
+actual) es propia de cada proceso: el proceso que guardó ve el cambio de
+inmediato, pero los demás pueden responder con datos (o ausencias) de hasta
+LOOKUP_CACHE_TTL segundos de antigüedad. Con una caché compartida (Redis,
+Memcached) el cambio llega a todos los procesos.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ..models.supplier import Supplier
+from ..projections import SUPPLIER_LOOKUP
+
+LOOKUP_FIELDS = ("ruc", "email", "account_number")
+MAX_LOOKUP_VALUES = 1000
+LOOKUP_CACHE_TTL = 60
+
+GENERATION_KEY = "supplier:lookup:generation"
+
+
+def _generation():
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def invalidate(**kwargs):
+    """Receptor de post_save/post_delete de Supplier (alcance: ver el docstring del módulo)"""
+    transaction.on_commit(lambda: cache.set(GENERATION_KEY, time.time_ns(), timeout=None))
+
+
+def _normalize(value):
+    # MySQL compara sin distinguir mayúsculas: la clave de caché tampoco
+    return str(value).strip().casefold()
+
+
+def lookup(field, values):
+    """
+    {valor recibido: datos clave del proveedor o None}. Solo consulta la base
+    por los valores que no están en la caché.
+    """
+    if field not in LOOKUP_FIELDS:
+        raise ValueError(f"Campo de búsqueda no válido: {field}")
+
+    wanted = {}
+    for value in values:
+        normalized = _normalize(value)
+        if normalized:
+            wanted.setdefault(normalized, []).append(value)
+
+    prefix = f"supplier:lookup:{_generation()}:{field}:"
+    cached = cache.get_many([prefix + key for key in wanted])
+    found = {key[len(prefix):]: entry["supplier"] for key, entry in cached.items()}
+
+    missing = [key for key in wanted if key not in found]
+    if missing:
+        to_dict = SUPPLIER_LOOKUP.compile()
+        rows = SUPPLIER_LOOKUP.values(Supplier.objects.filter(**{f"{field}__in": missing}))
+        fetched = dict.fromkeys(missing)
+        for row in rows:
+            fetched[_normalize(row[field])] = to_dict(row)
+        found.update(fetched)
+        cache.set_many(
+            {prefix + key: {"supplier": data} for key, data in fetched.items()},
+            timeout=LOOKUP_CACHE_TTL,
+        )
+
+    result = {str(value): None for value in values}
+    for key, originals in wanted.items():
+        for value in originals:
+            result[str(value)] = found.get(key)
+    return result
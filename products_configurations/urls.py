@@ -1,7 +1,7 @@
 from django.urls import path
 from .views.category import category_list, category_create, category_delete, category_edit, category_detail
-from .views.supplier import supplier_list, supplier_create, supplier_delete, supplier_update, supplier_detail
-from .views.brand import brand_list, brand_create, brand_update, brand_delete, brand_detail
+from .views.supplier import supplier_list, supplier_export, supplier_lookup, supplier_create, supplier_delete, supplier_update, supplier_detail
+from .views.brand import brand_list, brand_export, brand_create, brand_update, brand_delete, brand_detail
 
 urlpatterns = [
     # Category
@@ -13,6 +13,8 @@ urlpatterns = [
 
     # Proveedor
     path("supplier/", supplier_list, name="supplier_list"),
+    path("supplier/export/", supplier_export, name="supplier_export"),
+    path("supplier/lookup/", supplier_lookup, name="supplier_lookup"),
     path("supplier/create/", supplier_create, name="supplier_create"),
     path("supplier/<int:pk>/edit/", supplier_update, name="supplier_update"),
     path("supplier/<int:pk>/delete/", supplier_delete, name="supplier_delete"),
@@ -20,6 +22,7 @@ urlpatterns = [
     
     # Marca
     path("brand/", brand_list, name="brand_list"),
+    path("brand/export/", brand_export, name="brand_export"),
     path("brand/create/", brand_create, name="brand_create"),
     path("brand/<int:pk>/edit/", brand_update, name="brand_update"),
     path("brand/<int:pk>/delete/", brand_delete, name="brand_delete"),
@@ -3,27 +3,45 @@ from django.http import JsonResponse, HttpResponseNotAllowed
 from django.views.decorators.csrf import csrf_exempt
 from django.db import transaction
 from ..models.brand import Brand
+from ..projections import BRAND
+from architect.utils.pagination import InvalidCursor, paginate, wants_page
+from architect.utils.xlsx_export import Column, export_filename, xlsx_response
 
 @csrf_exempt
 def brand_list(request):
     if request.method != "GET":
         return HttpResponseNotAllowed(["GET"])
 
+    to_dict = BRAND.compile()
+    rows = BRAND.values(Brand.objects.all())
+    page = {}
+    if wants_page(request.GET):
+        try:
+            rows, page = paginate(request.GET, rows)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
+    data = [to_dict(row) for row in rows]
+    return JsonResponse({"brands": data, **page})
+
+
+BRAND_EXPORT_COLUMNS = [
+    Column("ID", lambda b: b.id, 8),
+    Column("Nombre", lambda b: b.name, 25),
+    Column("Descripción", lambda b: b.description, 40),
+    Column("País", lambda b: b.country.name if b.country else None, 18),
+    Column("Fecha de Creación", lambda b: b.created_at, 18),
+    Column("Fecha de Actualización", lambda b: b.updated_at, 18),
+]
+
+
+@csrf_exempt
+def brand_export(request):
+    """GET: exporta las marcas a XLSX (mismas filas que brand_list)"""
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
     qs = Brand.objects.select_related("country")
-    data = []
-    for b in qs:
-        data.append({
-            "id": b.id,
-            "name": b.name,
-            "description": b.description,
-            "country": (
-                {"id": b.country_id, "name": b.country.name}
-                if b.country else None
-            ),
-            "created_at": b.created_at.isoformat() if b.created_at else None,
-            "updated_at": b.updated_at.isoformat() if b.updated_at else None
-        })
-    return JsonResponse({"brands": data})
+    return xlsx_response(qs, BRAND_EXPORT_COLUMNS, export_filename("marcas"), sheet_name="Marcas")
 
 @csrf_exempt
 def brand_create(request):
@@ -5,42 +5,106 @@ from django.views.decorators.csrf import csrf_exempt
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
 from ..models.supplier import Supplier
+from ..projections import SUPPLIER
+from ..services.supplier_lookup_service import LOOKUP_FIELDS, MAX_LOOKUP_VALUES, lookup
 from datetime import datetime
+from architect.utils.pagination import InvalidCursor, paginate, wants_page
+from architect.utils.xlsx_export import Column, export_filename, xlsx_response
 
 @csrf_exempt
 def supplier_list(request):
     if request.method != "GET":
         return HttpResponseNotAllowed(["GET"])
     
+    to_dict = SUPPLIER.compile()
+    rows = SUPPLIER.values(Supplier.objects.all())
+    page = {}
+    if wants_page(request.GET):
+        try:
+            rows, page = paginate(request.GET, rows)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
+    data = [to_dict(row) for row in rows]
+    return JsonResponse({"suppliers": data, **page})
+
+
+@csrf_exempt
+def supplier_lookup(request):
+    """
+    Busca proveedores por RUC, email o número de cuenta en lote (uno de los tres).
+
+    GET  /api/products/supplier/lookup/?ruc=20100047218,20512345678
+    POST /api/products/supplier/lookup/  {"ruc": ["20100047218", ...]}   (o "email" / "account_number")
+
+    Responde {"field", "results": {valor: {"id", "ruc", "company_name",
+    "business_name", "email", "account_number"} | null}, "found", "missing"}.
+    """
+    if request.method == "GET":
+        source = {
+            f: [v for v in request.GET[f].split(",") if v.strip()]
+            for f in LOOKUP_FIELDS if f in request.GET
+        }
+    elif request.method == "POST":
+        try:
+            payload = json.loads(request.body.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return JsonResponse({"error": f"Error al procesar JSON: {str(e)}"}, status=400)
+        if not isinstance(payload, dict):
+            return JsonResponse({"error": "Se esperaba un objeto JSON"}, status=400)
+        source = {f: payload[f] for f in LOOKUP_FIELDS if f in payload}
+    else:
+        return HttpResponseNotAllowed(["GET", "POST"])
+
+    if len(source) != 1:
+        return JsonResponse({"error": f"Envíe exactamente uno de: {', '.join(LOOKUP_FIELDS)}"}, status=400)
+    field, values = next(iter(source.items()))
+    if not isinstance(values, list) or not all(isinstance(v, (str, int)) and not isinstance(v, bool) for v in values):
+        return JsonResponse({"error": f"Se esperaba una lista de valores en '{field}'"}, status=400)
+    if not values:
+        return JsonResponse({"error": "No se enviaron valores"}, status=400)
+    if len(values) > MAX_LOOKUP_VALUES:
+        return JsonResponse({"error": f"Máximo {MAX_LOOKUP_VALUES} valores por petición"}, status=400)
+
+    results = lookup(field, values)
+    missing = [value for value, supplier in results.items() if supplier is None]
+    return JsonResponse({
+        "field": field,
+        "results": results,
+        "found": len(results) - len(missing),
+        "missing": missing,
+    })
+
+
+def _name_of(obj):
+    return obj.name if obj else None
+
+
+SUPPLIER_EXPORT_COLUMNS = [
+    Column("ID", lambda s: s.id, 8),
+    Column("RUC", lambda s: s.ruc, 14),
+    Column("Razón Social", lambda s: s.company_name, 30),
+    Column("Nombre Comercial", lambda s: s.business_name, 30),
+    Column("Representante", lambda s: s.representative, 25),
+    Column("Teléfono", lambda s: s.phone, 15),
+    Column("Correo", lambda s: s.email, 30),
+    Column("Dirección", lambda s: s.address, 35),
+    Column("Número de Cuenta", lambda s: s.account_number, 22),
+    Column("Región", lambda s: _name_of(s.region), 18),
+    Column("Provincia", lambda s: _name_of(s.province), 18),
+    Column("Distrito", lambda s: _name_of(s.district), 18),
+    Column("Fecha de Creación", lambda s: s.created_at, 18),
+    Column("Fecha de Actualización", lambda s: s.updated_at, 18),
+]
+
+
+@csrf_exempt
+def supplier_export(request):
+    """GET: exporta los proveedores a XLSX (mismas filas que supplier_list)"""
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
     qs = Supplier.objects.select_related("region", "province", "district")
-    data = []
-    for s in qs:
-        data.append({
-            "id": s.id,
-            "ruc": s.ruc,
-            "company_name": s.company_name,
-            "business_name": s.business_name,
-            "representative": s.representative,
-            "phone": s.phone,
-            "email": s.email,
-            "address": s.address,
-            "account_number": s.account_number,
-            "region": (
-                {"id": s.region.id, "name": s.region.name}
-                if s.region else None
-            ),
-            "province": (
-                {"id": s.province.id, "name": s.province.name}
-                if s.province else None
-            ),
-            "district": (
-                {"id": s.district.id, "name": s.district.name}
-                if s.district else None
-            ),
-            "created_at": s.created_at.isoformat() if s.created_at else None,
-            "updated_at": s.updated_at.isoformat() if s.updated_at else None
-        })
-    return JsonResponse({"suppliers": data})
+    return xlsx_response(qs, SUPPLIER_EXPORT_COLUMNS, export_filename("proveedores"), sheet_name="Proveedores")
 
 
 @csrf_exempt
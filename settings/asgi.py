@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings.settings')
 
 application = get_asgi_application()
+
+# Catálogos servidos desde memoria: se arman antes de la primera petición
+from ubi_geo.countries import warm  # noqa: E402
+
+warm()
@@ -44,6 +44,7 @@ app.conf.update(
     task_routes={
         'appointments_status.tasks.*': {'queue': 'appointments'},
         'company_reports.tasks.*': {'queue': 'reports'},
+        'employees.tasks.render_employee_roster': {'queue': 'reports'},
         'therapists.tasks.*': {'queue': 'therapists'},
     },
     
@@ -142,7 +142,7 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'architect.utils.paginators.EstimatedCountPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
@@ -165,12 +165,36 @@ CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
 CELERY_RESULT_EXPIRES = 3600  # 1 hora
 
+# Tareas periódicas: DatabaseScheduler las copia a django_celery_beat al iniciar beat
+CELERY_BEAT_SCHEDULE = {
+    'prune-employee-reports': {
+        'task': 'employees.tasks.prune_employee_reports',
+        'schedule': 60 * 60,  # cada hora
+    },
+    'prune-employee-tombstones': {
+        'task': 'employees.tasks.prune_employee_tombstones',
+        'schedule': 24 * 60 * 60,  # una vez al día
+    },
+}
+
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
+# Catálogos en memoria (architect.utils.reference_data): segundos máximos antes de
+# recargar una tabla aunque no llegue una versión nueva por la caché compartida
+REFERENCE_DATA_TTL = 300
+
+# Días que se conservan los registros de empleados eliminados para la
+# sincronización incremental; un cliente con un token más antiguo debe
+# descargar la lista completa
+EMPLOYEE_TOMBSTONE_RETENTION_DAYS = 90
+
+# Horas que se conserva cada PDF de nómina generado (tarea prune_employee_reports)
+EMPLOYEE_REPORT_RETENTION_HOURS = 24
+
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
 SESSION_CACHE_ALIAS = 'default'
 
@@ -3,6 +3,9 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.http import JsonResponse
+from django.views.static import serve
+
+from architect.storage import IMMUTABLE_CACHE_CONTROL, is_content_name
 
 def health_check(request):
     """Endpoint de health check para Docker"""
@@ -28,5 +31,12 @@ urlpatterns = [
     ])),
 ]
 
+def serve_media(request, path, document_root=None):
+    """Media en desarrollo; los archivos con nombre por contenido nunca cambian"""
+    response = serve(request, path, document_root=document_root)
+    if is_content_name(path):
+        response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    return response
+
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    urlpatterns += static(settings.MEDIA_URL, view=serve_media, document_root=settings.MEDIA_ROOT)
@@ -12,14 +12,14 @@ class RegionAdmin(admin.ModelAdmin):
 
 @admin.register(Province)
 class ProvinceAdmin(admin.ModelAdmin):
-    list_display = ("id", "name", "region", "created_at")
+    list_display = ("id", "name", "full_path", "code", "created_at")
     list_filter = ("region", "created_at", "deleted_at")
-    search_fields = ("name", "region__name")
-    readonly_fields = ("created_at", "updated_at", "deleted_at")
+    search_fields = ("name", "full_path", "code")
+    readonly_fields = ("full_path", "created_at", "updated_at", "deleted_at")
 
 @admin.register(District)
 class DistrictAdmin(admin.ModelAdmin):
-    list_display = ("id", "name", "province", "created_at")
+    list_display = ("id", "name", "full_path", "code", "created_at")
     list_filter = ("province__region", "province", "created_at", "deleted_at")
-    search_fields = ("name", "province__name", "province__region__name")
-    readonly_fields = ("created_at", "updated_at", "deleted_at")
\ No newline at end of file
+    search_fields = ("name", "full_path", "code")
+    readonly_fields = ("full_path", "created_at", "updated_at", "deleted_at")
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Autocompletado de ubicaciones sin distinguir tildes ni mayúsculas.
+
+Índice en memoria por proceso: cada palabra de cada nombre (región, provincia,
+distrito) normalizada con `fold` ("Áncash" -> "ancash") en una lista ordenada.
+Un prefijo se resuelve con bisect sobre esa lista; las demás palabras de la
+consulta se comprueban contra el nombre y los nombres de sus padres
+("miraflores lima"). El índice se rearma cuando reference_data recarga los
+catálogos.
+"""
+import heapq
+import unicodedata
+from bisect import bisect_left
+
+from architect.utils import reference_data
+from .models import Region, Province, District
+
+LEVEL_ORDER = {"region": 0, "province": 1, "district": 2}
+INDEX_MODELS = (Region, Province, District)
+
+
+def fold(text):
+    """Minúsculas, sin tildes y solo letras/dígitos separados por un espacio"""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    plain = "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+    return " ".join("".join(c if c.isalnum() else " " for c in plain).split())
+
+
+class LocationEntry:
+    __slots__ = ("level", "id", "name", "code", "path", "folded", "words", "context_words", "rank")
+
+    def __init__(self, level, obj, ancestors):
+        self.level = level
+        self.id = obj.pk
+        self.name = obj.name
+        self.code = obj.code
+        # [{level, id, name}] desde la región hasta esta ubicación
+        self.path = [*ancestors, {"level": level, "id": obj.pk, "name": obj.name}]
+        self.folded = fold(obj.name)
+        self.words = self.folded.split()
+        self.context_words = fold(" ".join(a["name"] for a in ancestors)).split()
+        # Desempate: regiones antes que provincias y distritos, nombres cortos primero
+        self.rank = (LEVEL_ORDER[level], len(self.name), self.folded)
+
+    def as_dict(self):
+        return {
+            "level": self.level,
+            "id": self.id,
+            "name": self.name,
+            "code": self.code,
+            "path": self.path,
+            "label": ", ".join(p["name"] for p in reversed(self.path)),
+        }
+
+
+class LocationIndex:
+
+    def __init__(self, regions, provinces, districts):
+        self.entries = []
+        region_path = {}
+        province_path = {}
+        for obj in regions.values():
+            if obj.deleted_at is None:
+                self._add("region", obj, [])
+                region_path[obj.pk] = self.entries[-1].path
+        for obj in provinces.values():
+            if obj.deleted_at is None and obj.region_id in region_path:
+                self._add("province", obj, region_path[obj.region_id])
+                province_path[obj.pk] = self.entries[-1].path
+        for obj in districts.values():
+            if obj.deleted_at is None and obj.province_id in province_path:
+                self._add("district", obj, province_path[obj.province_id])
+
+        pairs = sorted(
+            (word, position)
+            for position, entry in enumerate(self.entries)
+            for word in set(entry.words)
+        )
+        self.keys = [word for word, _ in pairs]
+        self.positions = [position for _, position in pairs]
+
+    def _add(self, level, obj, ancestors):
+        self.entries.append(LocationEntry(level, obj, ancestors))
+
+    def _prefixed(self, prefix):
+        """Posiciones de las entradas con alguna palabra que empieza con `prefix`"""
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + "\U0010ffff", lo=start)
+        return set(self.positions[start:end])
+
+    def search(self, query, limit=10, level=None):
+        folded = fold(query)
+        tokens = folded.split()
+        if not tokens:
+            return []
+
+        rest = tokens[1:]
+        ranked = []
+        # La primera palabra debe estar en el nombre; las demás, en el nombre o en sus padres
+        for position in self._prefixed(tokens[0]):
+            entry = self.entries[position]
+            if level and entry.level != level:
+                continue
+            in_name = True
+            if rest:
+                in_name = all(any(w.startswith(t) for w in entry.words) for t in rest)
+                if not in_name and not all(
+                    any(w.startswith(t) for w in entry.words + entry.context_words) for t in rest
+                ):
+                    continue
+            if entry.folded == folded:
+                match = 0
+            elif entry.folded.startswith(folded):
+                match = 1
+            else:
+                match = 2
+            ranked.append((not in_name, match, entry.rank, position))
+
+        return [self.entries[item[-1]].as_dict() for item in heapq.nsmallest(limit, ranked)]
+
+
+def get_index():
+    return reference_data.derived("ubi_geo.autocomplete", INDEX_MODELS, LocationIndex)
+
+
+def autocomplete(query, limit=10, level=None):
+    return get_index().search(query, limit=limit, level=level)
@@ -0,0 +1,97 @@
+"""
+Códigos ubigeo (INEI) y resolución por lotes.
+
+Se guardan con ceros a la izquierda: región "01", provincia "0101", distrito
+"010101". Al resolver se aceptan también las formas sin ceros ("10101", como
+vienen en db/*.csv) y las de 6 dígitos con ceros de relleno ("010000" región,
+"010100" provincia).
+"""
+from .models import Region, Province, District
+
+CODE_LENGTHS = {"region": 2, "province": 4, "district": 6}
+MAX_RESOLVE_CODES = 1000
+
+
+def normalize_code(value, length):
+    """Código con ceros a la izquierda, o None si no es numérico o es más largo"""
+    value = str(value or "").strip()
+    if not value.isdigit() or len(value) > length:
+        return None
+    return value.zfill(length)
+
+
+def classify_code(value):
+    """(nivel, código normalizado) de un código recibido, o None si no es válido"""
+    value = str(value or "").strip()
+    if not value.isdigit() or len(value) > 6:
+        return None
+    if len(value) == 6 and value.endswith("0000"):
+        return "region", value[:2]
+    if len(value) == 6 and value.endswith("00"):
+        return "province", value[:4]
+    if len(value) <= 2:
+        return "region", value.zfill(2)
+    if len(value) <= 4:
+        return "province", value.zfill(4)
+    return "district", value.zfill(6)
+
+
+def _ref(pk, name, code):
+    return {"id": pk, "name": name, "code": code} if pk is not None else None
+
+
+def _regions(codes):
+    rows = Region.objects.filter(code__in=codes, deleted_at__isnull=True).values_list("id", "name", "code")
+    return {code: {"level": "region", **_ref(pk, name, code)} for pk, name, code in rows}
+
+
+def _provinces(codes):
+    rows = Province.objects.filter(code__in=codes, deleted_at__isnull=True).values_list(
+        "id", "name", "code", "region_id", "region__name", "region__code",
+    )
+    return {
+        code: {"level": "province", **_ref(pk, name, code), "region": _ref(r_id, r_name, r_code)}
+        for pk, name, code, r_id, r_name, r_code in rows
+    }
+
+
+def _districts(codes):
+    rows = District.objects.filter(code__in=codes, deleted_at__isnull=True).values_list(
+        "id", "name", "code",
+        "province_id", "province__name", "province__code",
+        "province__region_id", "province__region__name", "province__region__code",
+    )
+    return {
+        code: {
+            "level": "district", **_ref(pk, name, code),
+            "province": _ref(p_id, p_name, p_code),
+            "region": _ref(r_id, r_name, r_code),
+        }
+        for pk, name, code, p_id, p_name, p_code, r_id, r_name, r_code in rows
+    }
+
+
+_RESOLVERS = {"region": _regions, "province": _provinces, "district": _districts}
+
+
+def resolve_codes(values):
+    """
+    {código recibido: resultado o None}. Una consulta por nivel (sobre el índice
+    único de `code`), con los padres por join.
+    """
+    wanted = {}
+    for value in values:
+        classified = classify_code(value)
+        if classified:
+            level, code = classified
+            wanted.setdefault(level, set()).add(code)
+
+    found = {}
+    for level, codes in wanted.items():
+        found[level] = _RESOLVERS[level](codes)
+
+    result = {}
+    for value in values:
+        classified = classify_code(value)
+        result[str(value)] = found.get(classified[0], {}).get(classified[1]) if classified else None
+    return result
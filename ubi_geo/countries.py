@@ -0,0 +1,72 @@
+"""
+Catálogo de países servido desde memoria.
+
+Se arma desde reference_data (se recarga con las mismas señales de Country) y
+guarda la lista ya serializada y comprimida, más los índices por id y por ISO2.
+La versión sale del `updated_at` más reciente y del número de filas, así que
+cambia con cualquier alta, edición o baja (también las lógicas, que tocan
+updated_at). `warm()` lo arma al arrancar el servidor (settings/wsgi.py, asgi.py).
+"""
+import json
+import logging
+
+from django.db import DatabaseError
+
+from architect.utils import reference_data
+from architect.utils.precompressed import PrecompressedDocument
+from .models import Country
+
+logger = logging.getLogger(__name__)
+
+
+def _as_dict(country):
+    return {
+        "id": country.pk,
+        "name": country.name,
+        "phone_code": country.phone_code,
+        "iso2": country.ISO2,
+    }
+
+
+def catalog_version(countries):
+    """Versión de la tabla: microsegundos del updated_at más reciente y filas"""
+    latest = max((c.updated_at for c in countries if c.updated_at), default=None)
+    micros = int(latest.timestamp() * 1_000_000) if latest else 0
+    return f"{micros}.{len(countries)}"
+
+
+class CountryCatalog(PrecompressedDocument):
+
+    def __init__(self, countries):
+        alive = sorted(
+            (c for c in countries.values() if c.deleted_at is None),
+            key=lambda c: (c.name, c.pk),
+        )
+        version = catalog_version(list(countries.values()))
+        self.items = [_as_dict(c) for c in alive]
+        self.by_id = {item["id"]: item for item in self.items}
+        self.by_iso2 = {item["iso2"].upper(): item for item in self.items if item["iso2"]}
+        body = json.dumps(
+            {"version": version, "count": len(self.items), "results": self.items},
+            ensure_ascii=False, separators=(",", ":"),
+        )
+        super().__init__(body.encode("utf-8"), version)
+
+    def lookup(self, key):
+        """País por id numérico o por ISO2 (sin distinguir mayúsculas); None si no existe"""
+        key = str(key).strip()
+        if key.isdigit():
+            return self.by_id.get(int(key))
+        return self.by_iso2.get(key.upper())
+
+
+def get_catalog():
+    return reference_data.derived("ubi_geo.countries", (Country,), CountryCatalog)
+
+
+def warm():
+    """Arma el catálogo por adelantado; sin base de datos lista se arma en la primera petición"""
+    try:
+        get_catalog()
+    except DatabaseError:
+        logger.warning("No se pudo precargar el catálogo de países", exc_info=True)
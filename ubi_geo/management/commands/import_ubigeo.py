@@ -1,9 +1,14 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
 from pathlib import Path
 import csv
+import time
 
+from architect.utils import reference_data
+from ubi_geo.codes import CODE_LENGTHS, normalize_code
 from ubi_geo.models import Country, Region, Province, District
+from ubi_geo.models.province import location_path
 
 def getv(row, *cands):
     for k in cands:
@@ -23,6 +28,10 @@ class Command(BaseCommand):
                             help="ISO2 del país a usar para todas las regiones (ej: PE)")
         parser.add_argument("--truncate", action="store_true",
                             help="Borra Region/Province/District antes de importar")
+        parser.add_argument("--bulk", action="store_true",
+                            help="Modo por conjuntos: compara cada CSV con la base y escribe con bulk_create/bulk_update")
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Filas por INSERT/UPDATE en modo --bulk (por defecto: 1000)")
 
     def handle(self, *args, **opt):
         base = Path(opt["path"]).resolve()
@@ -44,6 +53,12 @@ class Command(BaseCommand):
             Province.objects.all().delete()
             Region.objects.all().delete()
 
+        if opt["bulk"]:
+            if opt["batch_size"] < 1:
+                raise CommandError("--batch-size debe ser mayor que 0")
+            self._import_bulk(files, iso2, opt["batch_size"])
+            return
+
         with transaction.atomic():
             # COUNTRIES
             self.stdout.write("Importando countries…")
@@ -84,8 +99,9 @@ class Command(BaseCommand):
                     name = getv(row, "name", "Nombre")
                     if not name:
                         s += 1; continue
+                    ubigeo = normalize_code(code, CODE_LENGTHS["region"])
                     obj, created = Region.objects.update_or_create(
-                        name=name, country=country, defaults={}
+                        name=name, country=country, defaults={"code": ubigeo} if ubigeo else {}
                     )
                     if code:
                         code_to_region[code] = obj
@@ -105,8 +121,9 @@ class Command(BaseCommand):
                     region = code_to_region.get(region_ref)
                     if not (name and region):
                         s += 1; continue
+                    ubigeo = normalize_code(code, CODE_LENGTHS["province"])
                     obj, created = Province.objects.update_or_create(
-                        name=name, region=region, defaults={}
+                        name=name, region=region, defaults={"code": ubigeo} if ubigeo else {}
                     )
                     if code:
                         code_to_province[code] = obj
@@ -124,10 +141,161 @@ class Command(BaseCommand):
                     province = code_to_province.get(prov_ref)
                     if not (name and province):
                         s += 1; continue
+                    ubigeo = normalize_code(getv(row, "code", "ubigeo_code"), CODE_LENGTHS["district"])
                     _, created = District.objects.update_or_create(
-                        name=name, province=province, defaults={}
+                        name=name, province=province, defaults={"code": ubigeo} if ubigeo else {}
                     )
                     n += int(created); u += int(not created)
             self.stdout.write(f"Districts: +{n} upd:{u} skip:{s}")
 
         self.stdout.write(self.style.SUCCESS("Importación completada ✔"))
+
+    # ===== Modo por conjuntos (--bulk) =====
+
+    def _read(self, path):
+        with path.open(encoding="utf-8", newline="") as f:
+            return list(csv.DictReader(f, delimiter=";"))
+
+    def _stage(self, label, start, new, upd, skip, same=None):
+        same_txt = f" sin cambios:{same}" if same is not None else ""
+        self.stdout.write(f"{label}: +{new} upd:{upd}{same_txt} skip:{skip} ({time.monotonic() - start:.2f}s)")
+
+    def _import_bulk(self, files, iso2, batch_size):
+        total = time.monotonic()
+        with transaction.atomic():
+            country = self._bulk_countries(files["countries"], iso2, batch_size)
+
+            start = time.monotonic()
+            rows = []
+            skip = 0
+            for row in self._read(files["regions"]):
+                name = getv(row, "name", "Nombre")
+                if not name:
+                    skip += 1; continue
+                rows.append((getv(row, "code", "ubigeo_code"), name, country.pk))
+            code_to_region, region_paths, new, upd, same = self._bulk_level(Region, "country_id", rows, batch_size)
+            self._stage("Regions", start, new, upd, skip, same)
+
+            start = time.monotonic()
+            rows = []
+            skip = 0
+            for row in self._read(files["provinces"]):
+                name = getv(row, "name", "Nombre")
+                region_id = code_to_region.get(getv(row, "region_code", "region_id"))
+                if not (name and region_id):
+                    skip += 1; continue
+                rows.append((getv(row, "code", "ubigeo_code"), name, region_id))
+            code_to_province, province_paths, new, upd, same = self._bulk_level(
+                Province, "region_id", rows, batch_size, parent_paths=region_paths
+            )
+            self._stage("Provinces", start, new, upd, skip, same)
+
+            start = time.monotonic()
+            rows = []
+            skip = 0
+            for row in self._read(files["districts"]):
+                name = getv(row, "name", "Nombre")
+                province_id = code_to_province.get(getv(row, "province_code", "province_id"))
+                if not (name and province_id):
+                    skip += 1; continue
+                rows.append((getv(row, "code", "ubigeo_code"), name, province_id))
+            _, _, new, upd, same = self._bulk_level(
+                District, "province_id", rows, batch_size, parent_paths=province_paths
+            )
+            self._stage("Districts", start, new, upd, skip, same)
+
+            # bulk_create/bulk_update no envían post_save: se invalida la caché de catálogos
+            for model in (Country, Region, Province, District):
+                transaction.on_commit(lambda model=model: reference_data.bump_version(model))
+
+        self.stdout.write(self.style.SUCCESS(f"Importación completada en {time.monotonic() - total:.2f}s ✔"))
+
+    def _bulk_countries(self, path, iso2, batch_size):
+        start = time.monotonic()
+        existing = list(Country.objects.all())
+        by_iso2 = {c.ISO2.upper(): c for c in existing if c.ISO2}
+        by_name = {c.name: c for c in existing}
+
+        to_create, to_update = {}, {}
+        same = skip = 0
+        for row in self._read(path):
+            name = getv(row, "name", "Name")
+            phone_code = getv(row, "phone_code", "PhoneCode") or None
+            ISO2 = getv(row, "ISO2", "iso2").upper()
+            if not name:
+                skip += 1
+                continue
+            obj = by_iso2.get(ISO2) if ISO2 else by_name.get(name)
+            if obj is None:
+                # La última fila repetida gana, como con update_or_create
+                to_create[ISO2 or name] = Country(name=name, phone_code=phone_code, ISO2=ISO2 or None)
+            elif (obj.name, obj.phone_code, obj.ISO2) != (name, phone_code, ISO2 or None):
+                obj.name, obj.phone_code, obj.ISO2 = name, phone_code, ISO2 or None
+                to_update[obj.pk] = obj
+            else:
+                same += 1
+
+        Country.objects.bulk_create(to_create.values(), batch_size=batch_size)
+        # bulk_update no pasa por auto_now
+        now = timezone.now()
+        for obj in to_update.values():
+            obj.updated_at = now
+        Country.objects.bulk_update(
+            to_update.values(), ["name", "phone_code", "ISO2", "updated_at"], batch_size=batch_size
+        )
+        self._stage("Countries", start, len(to_create), len(to_update), skip, same)
+
+        country = Country.objects.filter(ISO2=iso2).first()
+        if country is None:
+            raise CommandError(f"No existe Country ISO2={iso2}")
+        return country
+
+    def _bulk_level(self, model, parent_field, rows, batch_size, parent_paths=None):
+        """
+        rows: [(código del CSV, nombre, id del padre)]. Crea las filas cuyo
+        (nombre, padre) no existe, guarda el código ubigeo (y full_path, si se
+        pasan las rutas de los padres) de las existentes si cambió y devuelve
+        ({código del CSV: pk}, {pk: ruta}, creadas, actualizadas, sin cambios).
+        """
+        length = CODE_LENGTHS[model._meta.model_name]
+        parent_ids = {parent_id for _, _, parent_id in rows}
+        # bulk_create/bulk_update no pasan por save(): full_path se arma aquí
+        with_path = parent_paths is not None
+        columns = ["pk", "name", parent_field, "code"] + (["full_path"] if with_path else [])
+
+        def load():
+            return {
+                (row[1], row[2]): (row[0], row[3], row[4] if with_path else None)
+                for row in model.objects.filter(**{f"{parent_field}__in": parent_ids}).values_list(*columns)
+            }
+
+        def path_of(name, parent_id):
+            return location_path(parent_paths[parent_id], name) if with_path else name
+
+        existing = load()
+        to_create, to_update = {}, {}
+        for raw_code, name, parent_id in rows:
+            ubigeo = normalize_code(raw_code, length)
+            path = path_of(name, parent_id)
+            extra = {"full_path": path} if with_path else {}
+            current = existing.get((name, parent_id))
+            if current is None:
+                to_create[(name, parent_id)] = model(name=name, code=ubigeo, **{parent_field: parent_id}, **extra)
+            elif (ubigeo and current[1] != ubigeo) or (with_path and current[2] != path):
+                to_update[current[0]] = model(pk=current[0], code=ubigeo or current[1], **extra)
+
+        model.objects.bulk_create(to_create.values(), batch_size=batch_size)
+        # bulk_update no pasa por auto_now
+        now = timezone.now()
+        for obj in to_update.values():
+            obj.updated_at = now
+        fields = ["code", "updated_at"] + (["full_path"] if with_path else [])
+        model.objects.bulk_update(to_update.values(), fields, batch_size=batch_size)
+
+        # MySQL no devuelve los ids de bulk_create: se vuelven a leer
+        if to_create:
+            existing = load()
+        code_to_pk = {code: existing[(name, parent_id)][0] for code, name, parent_id in rows if code}
+        paths = {existing[(name, parent_id)][0]: path_of(name, parent_id) for _, name, parent_id in rows}
+        same = len(rows) - len(to_create) - len(to_update)
+        return code_to_pk, paths, len(to_create), len(to_update), same
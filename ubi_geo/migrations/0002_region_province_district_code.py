@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ubi_geo", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="region",
+            name="code",
+            field=models.CharField(
+                blank=True, max_length=2, null=True, unique=True, verbose_name="Código ubigeo"
+            ),
+        ),
+        migrations.AddField(
+            model_name="province",
+            name="code",
+            field=models.CharField(
+                blank=True, max_length=4, null=True, unique=True, verbose_name="Código ubigeo"
+            ),
+        ),
+        migrations.AddField(
+            model_name="district",
+            name="code",
+            field=models.CharField(
+                blank=True, max_length=6, null=True, unique=True, verbose_name="Código ubigeo"
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Concat
+
+PATH_SEPARATOR = " › "
+
+
+def fill_full_path(apps, schema_editor):
+    Region = apps.get_model("ubi_geo", "Region")
+    Province = apps.get_model("ubi_geo", "Province")
+    District = apps.get_model("ubi_geo", "District")
+
+    region_name = Region.objects.filter(pk=OuterRef("region_id")).values("name")[:1]
+    Province.objects.update(full_path=Concat(Subquery(region_name), Value(PATH_SEPARATOR), F("name")))
+
+    province_path = Province.objects.filter(pk=OuterRef("province_id")).values("full_path")[:1]
+    District.objects.update(full_path=Concat(Subquery(province_path), Value(PATH_SEPARATOR), F("name")))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ubi_geo", "0002_region_province_district_code"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="province",
+            name="full_path",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=520, verbose_name="Ruta"
+            ),
+        ),
+        migrations.AddField(
+            model_name="district",
+            name="full_path",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=780, verbose_name="Ruta"
+            ),
+        ),
+        migrations.RunPython(fill_full_path, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,16 @@
 from django.db import models
-from .province import Province
+from .province import Province, location_path
 
 class District(models.Model):
     name = models.CharField(max_length=255, verbose_name="Nombre")
     province = models.ForeignKey(Province, on_delete=models.CASCADE, verbose_name="Provincia")
     
+    # Código ubigeo INEI del distrito (6 dígitos, ver ubi_geo.codes)
+    code = models.CharField(max_length=6, unique=True, blank=True, null=True, verbose_name="Código ubigeo")
+
+    # "Región › Provincia › Distrito", se mantiene al guardar (ver Province.save)
+    full_path = models.CharField(max_length=780, blank=True, default="", editable=False, verbose_name="Ruta")
+    
     # Campos de auditoría
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de creación")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Fecha de actualización")
@@ -17,4 +23,11 @@ class District(models.Model):
         ordering = ["name"]
 
     def __str__(self):
-        return f"{self.name} ({self.province.name})"
+        return self.full_path or self.name
+
+    def save(self, *args, **kwargs):
+        self.full_path = location_path(self.province.full_path, self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "full_path"}
+        super().save(*args, **kwargs)
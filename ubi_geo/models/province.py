@@ -1,10 +1,28 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Concat
+from django.utils import timezone
+
 from .region import Region
 
+PATH_SEPARATOR = " › "
+
+
+def location_path(*names):
+    """Ruta legible de una ubicación, p. ej. Lima › Lima › Miraflores"""
+    return PATH_SEPARATOR.join(names)
+
+
 class Province(models.Model):
     name = models.CharField(max_length=255, verbose_name="Nombre")
     region = models.ForeignKey(Region, on_delete=models.CASCADE, verbose_name="Región")
     
+    # Código ubigeo INEI de la provincia (4 dígitos, ver ubi_geo.codes)
+    code = models.CharField(max_length=4, unique=True, blank=True, null=True, verbose_name="Código ubigeo")
+
+    # "Región › Provincia", se mantiene al guardar: __str__ no consulta la región
+    full_path = models.CharField(max_length=520, blank=True, default="", editable=False, verbose_name="Ruta")
+    
     # Campos de auditoría
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de creación")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Fecha de actualización")
@@ -17,4 +35,30 @@ class Province(models.Model):
         ordering = ["name"]
 
     def __str__(self):
-        return f"{self.name} ({self.region.name})"
+        return self.full_path or self.name
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_path = instance.__dict__.get("full_path")
+        return instance
+
+    def save(self, *args, **kwargs):
+        self.full_path = location_path(self.region.name, self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "full_path"}
+        moved = self.pk is not None and getattr(self, "_loaded_path", None) != self.full_path
+        super().save(*args, **kwargs)
+        self._loaded_path = self.full_path
+        if moved:
+            # Los distritos guardan la ruta de la provincia como prefijo. update()
+            # no envía post_save ni pasa por auto_now: se marca updated_at y se
+            # invalida a mano la caché de catálogos (registro, ETags, sync)
+            from architect.utils import reference_data
+            from .district import District
+            District.objects.filter(province_id=self.pk).update(
+                full_path=Concat(Value(self.full_path + PATH_SEPARATOR), F("name")),
+                updated_at=timezone.now(),
+            )
+            transaction.on_commit(lambda: reference_data.bump_version(District))
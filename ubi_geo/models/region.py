@@ -1,9 +1,12 @@
-from django.db import models
+from django.db import models, transaction
 
 class Region(models.Model):
     name = models.CharField(max_length=255, verbose_name="Nombre")
     country = models.ForeignKey('Country', on_delete=models.CASCADE, verbose_name="País")
     
+    # Código ubigeo INEI de la región (2 dígitos, ver ubi_geo.codes)
+    code = models.CharField(max_length=2, unique=True, blank=True, null=True, verbose_name="Código ubigeo")
+    
     # Campos de auditoría
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de creación")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Fecha de actualización")
@@ -17,3 +20,23 @@ class Region(models.Model):
 
     def __str__(self):
         return self.name
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_name = instance.__dict__.get("name")
+        return instance
+
+    def save(self, *args, **kwargs):
+        renamed = self.pk is not None and getattr(self, "_loaded_name", None) != self.name
+        super().save(*args, **kwargs)
+        self._loaded_name = self.name
+        if renamed:
+            # La región es el primer tramo de full_path de sus provincias y distritos;
+            # Province.save actualiza y marca sus distritos
+            from architect.utils import reference_data
+            from .province import Province
+            for province in Province.objects.filter(region_id=self.pk).only("id", "name", "region_id"):
+                province.region = self
+                province.save(update_fields=["full_path", "updated_at"])
+            transaction.on_commit(lambda: reference_data.bump_version(Province))
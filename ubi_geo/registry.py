@@ -0,0 +1,120 @@
+"""
+Registro en memoria de la jerarquía Región → Provincia → Distrito.
+
+Por nivel guarda arreglos paralelos compactos (ids ordenados, id del padre,
+nombre y código) y la posición de cada id. Validar la jerarquía o poner
+nombres de ubicación en una respuesta son búsquedas en diccionario, sin SQL.
+
+Se arma desde reference_data, así que se invalida con las mismas señales de
+los modelos de ubi_geo. `get_registry()` comprueba si los catálogos cambiaron;
+`current()` (pensado para llamarse por fila) lo comprueba a lo sumo una vez
+por CHECK_INTERVAL segundos.
+"""
+import time
+from array import array
+
+from architect.utils import reference_data
+from .models import Region, Province, District
+
+REGISTRY_MODELS = (Region, Province, District)
+
+PROVINCE_NOT_IN_REGION = "La provincia seleccionada no pertenece a la región."
+DISTRICT_NOT_IN_PROVINCE = "El distrito seleccionado no pertenece a la provincia."
+
+CHECK_INTERVAL = 1.0
+
+_current = None
+_checked_at = 0.0
+
+
+class GeoLevel:
+    """Filas de un nivel como arreglos paralelos ordenados por id"""
+
+    __slots__ = ("ids", "parents", "names", "codes", "positions")
+
+    def __init__(self, rows, parent_attr=None):
+        rows = sorted(rows.values(), key=lambda obj: obj.pk)
+        self.ids = array("q", (obj.pk for obj in rows))
+        self.parents = array("q", (getattr(obj, parent_attr) if parent_attr else 0 for obj in rows))
+        self.names = [obj.name for obj in rows]
+        self.codes = [obj.code for obj in rows]
+        self.positions = {pk: i for i, pk in enumerate(self.ids)}
+
+    def __contains__(self, pk):
+        return pk in self.positions
+
+    def name(self, pk):
+        i = self.positions.get(pk)
+        return self.names[i] if i is not None else None
+
+    def parent(self, pk):
+        i = self.positions.get(pk)
+        return self.parents[i] if i is not None else None
+
+    def parent_map(self):
+        """{id: id del padre}, p. ej. para enviar a otros procesos"""
+        return dict(zip(self.ids, self.parents))
+
+
+class GeoRegistry:
+
+    def __init__(self, regions, provinces, districts):
+        self.region = GeoLevel(regions)
+        self.province = GeoLevel(provinces, "region_id")
+        self.district = GeoLevel(districts, "province_id")
+
+    def hierarchy_error(self, region_id=None, province_id=None, district_id=None):
+        """Mensaje si la provincia no es de la región o el distrito no es de la provincia"""
+        if region_id and province_id and province_id in self.province \
+                and self.province.parent(province_id) != region_id:
+            return PROVINCE_NOT_IN_REGION
+        if province_id and district_id and district_id in self.district \
+                and self.district.parent(district_id) != province_id:
+            return DISTRICT_NOT_IN_PROVINCE
+        return None
+
+
+def _location_id(attrs, instance, field):
+    obj = attrs.get(field)
+    if obj is not None:
+        return obj.pk
+    # Solo el id de la instancia: no se carga la relación
+    return getattr(instance, f"{field}_id", None)
+
+
+def validate_hierarchy(attrs, instance=None):
+    """
+    Mensaje de error de jerarquía para los datos validados de un serializer
+    (region, province, district), completando con la instancia si es edición.
+    """
+    return get_registry().hierarchy_error(
+        _location_id(attrs, instance, "region"),
+        _location_id(attrs, instance, "province"),
+        _location_id(attrs, instance, "district"),
+    )
+
+
+def get_registry():
+    """Registro de los catálogos actuales; se rearma solo si reference_data los recargó"""
+    global _current, _checked_at
+    _current = reference_data.derived("ubi_geo.registry", REGISTRY_MODELS, GeoRegistry)
+    _checked_at = time.monotonic()
+    return _current
+
+
+def current():
+    if _current is None or time.monotonic() - _checked_at > CHECK_INTERVAL:
+        return get_registry()
+    return _current
+
+
+def region_name(pk):
+    return current().region.name(pk)
+
+
+def province_name(pk):
+    return current().province.name(pk)
+
+
+def district_name(pk):
+    return current().district.name(pk)
@@ -1,17 +1,18 @@
 from rest_framework import serializers
 from ubi_geo.models.district import District
+from .fields import LocationNameField
 
 
 class DistrictSerializer(serializers.ModelSerializer):
     """Serializer para el modelo District"""
     
-    province_name = serializers.CharField(source='province.name', read_only=True)
-    region_name = serializers.CharField(source='province.region.name', read_only=True)
+    province_name = LocationNameField("province", "province_id")
+    region_name = LocationNameField("region", "province_id", through="province")
     
     class Meta:
         model = District
-        fields = ['id', 'name', 'province', 'province_name', 'region_name', 'created_at', 'updated_at', 'deleted_at']
-        read_only_fields = ['id', 'province_name', 'region_name', 'created_at', 'updated_at', 'deleted_at']
+        fields = ['id', 'name', 'province', 'province_name', 'region_name', 'full_path', 'created_at', 'updated_at', 'deleted_at']
+        read_only_fields = ['id', 'province_name', 'region_name', 'full_path', 'created_at', 'updated_at', 'deleted_at']
     
     def validate_name(self, value):
         """Validar que el nombre no esté vacío"""
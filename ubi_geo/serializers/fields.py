@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from ubi_geo import registry
+
+
+class LocationNameField(serializers.Field):
+    """
+    Nombre de una ubicación leído de ubi_geo.registry a partir del id de la FK,
+    sin cargar la relación. `through` sube un nivel: el nombre de la región de
+    un distrito es LocationNameField("region", "province_id", through="province").
+    """
+
+    def __init__(self, level, id_attr, through=None, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+        self.level = level
+        self.id_attr = id_attr
+        self.through = through
+
+    def to_representation(self, instance):
+        current = registry.current()
+        pk = getattr(instance, self.id_attr, None)
+        if pk is not None and self.through:
+            pk = getattr(current, self.through).parent(pk)
+        if pk is None:
+            return None
+        return getattr(current, self.level).name(pk)
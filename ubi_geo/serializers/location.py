@@ -13,11 +13,11 @@ class ProvinceSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Province
-        fields = ("id", "name", "region", "created_at", "updated_at", "deleted_at")
+        fields = ("id", "name", "region", "full_path", "created_at", "updated_at", "deleted_at")
 
 class DistrictSerializer(serializers.ModelSerializer):
     province = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
         model = District
-        fields = ("id", "name", "province", "created_at", "updated_at", "deleted_at")
+        fields = ("id", "name", "province", "full_path", "created_at", "updated_at", "deleted_at")
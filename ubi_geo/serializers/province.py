@@ -1,16 +1,17 @@
 from rest_framework import serializers
 from ubi_geo.models.province import Province
+from .fields import LocationNameField
 
 
 class ProvinceSerializer(serializers.ModelSerializer):
     """Serializer para el modelo Province"""
     
-    region_name = serializers.CharField(source='region.name', read_only=True)
+    region_name = LocationNameField("region", "region_id")
     
     class Meta:
         model = Province
-        fields = ['id', 'name', 'region', 'region_name', 'created_at', 'updated_at', 'deleted_at']
-        read_only_fields = ['id', 'region_name', 'created_at', 'updated_at', 'deleted_at']
+        fields = ['id', 'name', 'region', 'region_name', 'full_path', 'created_at', 'updated_at', 'deleted_at']
+        read_only_fields = ['id', 'region_name', 'full_path', 'created_at', 'updated_at', 'deleted_at']
     
     def validate_name(self, value):
         """Validar que el nombre no esté vacío"""
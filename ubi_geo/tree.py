@@ -0,0 +1,58 @@
+"""
+Árbol Región → Provincia → Distrito en un solo documento precomprimido.
+
+El árbol se arma desde la caché de catálogos (architect.utils.reference_data),
+una vez por recarga de esos catálogos y por proceso, y se guarda ya serializado en
+identity, gzip y brotli. Forma compacta (ordenado por nombre, sin eliminados):
+
+    {"version": "<hash>",
+     "regions": [[id, nombre, [[id, nombre, [[id, nombre], ...]], ...]], ...]}
+
+`version` es el sha256 del contenido: cambia solo si cambian los datos y sirve
+como ETag fuerte.
+"""
+import hashlib
+import json
+
+from architect.utils import reference_data
+from architect.utils.precompressed import PrecompressedDocument
+from .models import Region, Province, District
+
+TREE_MODELS = (Region, Province, District)
+
+
+class LocationTree(PrecompressedDocument):
+    """Cuerpo serializado del árbol en cada codificación disponible"""
+
+    def __init__(self, regions):
+        body = json.dumps({"regions": regions}, ensure_ascii=False, separators=(",", ":"))
+        version = hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]
+        # La versión va primero para que el cliente la lea sin parsear todo
+        super().__init__(('{"version":"%s",%s' % (version, body[1:])).encode("utf-8"), version)
+
+
+def _alive(rows):
+    return sorted((obj for obj in rows if obj.deleted_at is None), key=lambda obj: (obj.name, obj.pk))
+
+
+def build_regions(regions, provinces, districts):
+    """Lista compacta a partir de las tablas {pk: instancia} de cada nivel"""
+    by_province = {}
+    for district in _alive(districts.values()):
+        by_province.setdefault(district.province_id, []).append([district.pk, district.name])
+    by_region = {}
+    for province in _alive(provinces.values()):
+        by_region.setdefault(province.region_id, []).append(
+            [province.pk, province.name, by_province.get(province.pk, [])]
+        )
+    return [
+        [region.pk, region.name, by_region.get(region.pk, [])]
+        for region in _alive(regions.values())
+    ]
+
+
+def get_tree():
+    """Árbol de los catálogos actuales; se rearma solo cuando reference_data los recarga"""
+    return reference_data.derived(
+        "ubi_geo.tree", TREE_MODELS, lambda *tables: LocationTree(build_regions(*tables))
+    )
@@ -3,6 +3,10 @@ from rest_framework.routers import DefaultRouter
 from .views.region import RegionViewSet
 from .views.province import ProvinceViewSet
 from .views.district import DistrictViewSet
+from .views.tree import location_tree
+from .views.codes import location_resolve
+from .views.autocomplete import location_autocomplete
+from .views.country import country_list, country_detail
 
 router = DefaultRouter()
 router.register(r"regions", RegionViewSet, basename="region")
@@ -10,5 +14,10 @@ router.register(r"provinces", ProvinceViewSet, basename="province")
 router.register(r"districts", DistrictViewSet, basename="district")
 
 urlpatterns = [
+    path('tree/', location_tree, name='location_tree'),
+    path('resolve/', location_resolve, name='location_resolve'),
+    path('autocomplete/', location_autocomplete, name='location_autocomplete'),
+    path('countries/', country_list, name='country_list'),
+    path('countries/<str:key>/', country_detail, name='country_detail'),
     path('', include(router.urls)),  # APIs disponibles en la raíz
 ]
\ No newline at end of file
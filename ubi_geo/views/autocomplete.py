@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from django.http import JsonResponse, HttpResponseNotAllowed
+
+from architect.utils.pagination import InvalidCursor, parse_limit
+from ubi_geo.autocomplete import LEVEL_ORDER, autocomplete
+
+
+def location_autocomplete(request):
+    """
+    GET /api/locations/autocomplete/?q=ancash
+
+    Coincidencias por prefijo de palabra, sin distinguir tildes ni mayúsculas,
+    ordenadas por relevancia. Cada resultado trae `path` (región → ... → la
+    ubicación) y `label` ("Miraflores, Lima, Lima").
+      - ?level=region|province|district  -> solo ese nivel
+      - ?limit=<n>                       -> máximo de resultados (10 por defecto, hasta 50)
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    level = request.GET.get("level") or None
+    if level and level not in LEVEL_ORDER:
+        return JsonResponse({"error": f"Nivel no válido. Disponibles: {', '.join(LEVEL_ORDER)}"}, status=400)
+    try:
+        limit = parse_limit(request.GET.get("limit"), default=10, maximum=50)
+    except InvalidCursor as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    return JsonResponse({"results": autocomplete(request.GET.get("q", ""), limit=limit, level=level)})
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.http import JsonResponse, HttpResponseNotAllowed
+from django.views.decorators.csrf import csrf_exempt
+
+from ubi_geo.codes import MAX_RESOLVE_CODES, resolve_codes
+
+
+@csrf_exempt
+def location_resolve(request):
+    """
+    Resuelve códigos ubigeo a ids y nombres en lote.
+
+    GET  /api/locations/resolve/?codes=010101,0101,01
+    POST /api/locations/resolve/  {"codes": ["010101", "150101", ...]}
+
+    Responde {"results": {código: {"level", "id", "name", "code", "province"?,
+    "region"?} | null}}; null si el código no es válido o no existe.
+    """
+    if request.method == "GET":
+        codes = [c for c in request.GET.get("codes", "").split(",") if c.strip()]
+    elif request.method == "POST":
+        try:
+            payload = json.loads(request.body.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return JsonResponse({"error": f"Error al procesar JSON: {str(e)}"}, status=400)
+        codes = payload.get("codes") if isinstance(payload, dict) else payload
+        if not isinstance(codes, list) or not all(isinstance(c, (str, int)) for c in codes):
+            return JsonResponse({"error": "Se esperaba una lista de códigos en 'codes'"}, status=400)
+    else:
+        return HttpResponseNotAllowed(["GET", "POST"])
+
+    if not codes:
+        return JsonResponse({"error": "No se enviaron códigos"}, status=400)
+    if len(codes) > MAX_RESOLVE_CODES:
+        return JsonResponse({"error": f"Máximo {MAX_RESOLVE_CODES} códigos por petición"}, status=400)
+
+    return JsonResponse({"results": resolve_codes(codes)})
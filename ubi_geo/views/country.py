@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from django.http import HttpResponse, HttpResponseNotAllowed, JsonResponse
+
+from architect.utils.precompressed import etag_matches, precompressed_response
+from ubi_geo.countries import get_catalog
+
+# Sin ?v= el cliente revalida con el ETag (304) una vez al día
+COUNTRY_CACHE_CONTROL = "public, max-age=86400"
+
+
+def country_list(request):
+    """
+    GET /api/locations/countries/    -> todos los países (sin eliminados), por nombre
+
+    Documento precomprimido (br/gzip) con ETag ligado al updated_at de la tabla;
+    con ?v=<version> se puede cachear como inmutable.
+    """
+    if request.method not in ("GET", "HEAD"):
+        return HttpResponseNotAllowed(["GET", "HEAD"])
+    return precompressed_response(request, get_catalog(), COUNTRY_CACHE_CONTROL)
+
+
+def country_detail(request, key):
+    """
+    GET /api/locations/countries/<id>/     -> país por id
+    GET /api/locations/countries/<ISO2>/   -> país por código ISO2 (p. ej. PE)
+    """
+    if request.method not in ("GET", "HEAD"):
+        return HttpResponseNotAllowed(["GET", "HEAD"])
+
+    catalog = get_catalog()
+    country = catalog.lookup(key)
+    if country is None:
+        return JsonResponse({"error": "País no encontrado"}, status=404)
+
+    if etag_matches(request.META.get("HTTP_IF_NONE_MATCH"), catalog.version):
+        response = HttpResponse(status=304)
+    else:
+        response = JsonResponse(country, json_dumps_params={"ensure_ascii": False})
+    response["ETag"] = f'"{catalog.version}"'
+    response["Cache-Control"] = COUNTRY_CACHE_CONTROL
+    return response
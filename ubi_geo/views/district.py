@@ -17,7 +17,6 @@ class DistrictViewSet(ReadOnlyModelViewSet):
     def get_queryset(self):
         qs = (
             District.objects
-            .select_related("province", "province__region")
             .filter(deleted_at__isnull=True)
             .order_by("name")
         )
@@ -14,7 +14,7 @@ class ProvinceViewSet(ReadOnlyModelViewSet):
     serializer_class = ProvinceSerializer
 
     def get_queryset(self):
-        qs = Province.objects.select_related("region").filter(deleted_at__isnull=True).order_by("name")
+        qs = Province.objects.filter(deleted_at__isnull=True).order_by("name")
         region_id = self.request.query_params.get("region")
         if region_id:
             qs = qs.filter(region_id=region_id)
@@ -24,7 +24,7 @@ class DistrictViewSet(ReadOnlyModelViewSet):
     serializer_class = DistrictSerializer
 
     def get_queryset(self):
-        qs = District.objects.select_related("province", "province__region").filter(deleted_at__isnull=True).order_by("name")
+        qs = District.objects.filter(deleted_at__isnull=True).order_by("name")
         province_id = self.request.query_params.get("province")
         if province_id:
             qs = qs.filter(province_id=province_id)
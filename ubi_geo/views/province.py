@@ -15,7 +15,7 @@ class ProvinceViewSet(ReadOnlyModelViewSet):
     serializer_class = ProvinceSerializer
 
     def get_queryset(self):
-        qs = Province.objects.select_related("region").filter(deleted_at__isnull=True).order_by("name")
+        qs = Province.objects.filter(deleted_at__isnull=True).order_by("name")
         region_id = self.request.query_params.get("region")
         if region_id:
             qs = qs.filter(region_id=region_id)
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+from django.http import HttpResponseNotAllowed
+
+from architect.utils.precompressed import precompressed_response
+from ubi_geo.tree import get_tree
+
+# Sin ?v= el cliente revalida con el ETag (304) una vez al día
+TREE_CACHE_CONTROL = "public, max-age=86400"
+
+
+def location_tree(request):
+    """
+    GET /api/locations/tree/    -> árbol completo región → provincia → distrito
+
+    Un solo documento compacto (ver ubi_geo.tree), comprimido en br/gzip según
+    Accept-Encoding. Con ?v=<version> (la de la respuesta anterior) la respuesta
+    se puede cachear como inmutable: si los datos cambian, cambia la versión.
+    """
+    if request.method not in ("GET", "HEAD"):
+        return HttpResponseNotAllowed(["GET", "HEAD"])
+    return precompressed_response(request, get_tree(), TREE_CACHE_CONTROL)
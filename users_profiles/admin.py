@@ -4,6 +4,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.db.models import Q
 
+from architect.utils.paginators import EstimatedCountAdminMixin
 from .models.user_verification_code import UserVerificationCode
 
 User = get_user_model()
@@ -16,7 +17,7 @@ except NotRegistered:
 
 
 @admin.register(User)
-class CustomUserAdmin(BaseUserAdmin):
+class CustomUserAdmin(EstimatedCountAdminMixin, BaseUserAdmin):
     """
     Admin para el CustomUser sin username/first_name/last_name.
     USERNAME_FIELD = 'email'
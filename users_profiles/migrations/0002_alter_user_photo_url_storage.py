@@ -0,0 +1,23 @@
+import architect.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users_profiles", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="photo_url",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                storage=architect.storage.get_content_storage,
+                upload_to="photo_pics/",
+                verbose_name="Foto URL",
+            ),
+        ),
+    ]
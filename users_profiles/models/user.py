@@ -4,6 +4,7 @@ from django.utils import timezone
 from django.contrib.auth.base_user import BaseUserManager
 from django.core.validators import FileExtensionValidator
 from app_types.models.document_type import DocumentType 
+from architect.storage import get_content_storage
 
 class UserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
@@ -43,6 +44,7 @@ class User(AbstractUser):
     )
     photo_url = models.ImageField(
         upload_to='photo_pics/',
+        storage=get_content_storage,
         null=True, 
         blank=True, 
         verbose_name="Foto URL"
@@ -1,7 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
-import os
 
 User = get_user_model()
 
@@ -141,19 +140,19 @@ class UserProfilePhotoSerializer(serializers.ModelSerializer):
         if photo:
             print(f"DEBUG: Subiendo foto: {photo}")
             
-            # Eliminar foto anterior si existe
-            if instance.photo_url:
-                try:
-                    if os.path.isfile(instance.photo_url.path):
-                        os.remove(instance.photo_url.path)
-                        print(f"DEBUG: Foto anterior eliminada")
-                except (ValueError, AttributeError):
-                    pass
+            old_name = instance.photo_url.name
             
             # Guardar la nueva imagen
             instance.photo_url = photo
             instance.save()
             
+            # Eliminar foto anterior si ya nadie la usa (el storage deduplica por contenido)
+            if old_name and old_name != instance.photo_url.name:
+                try:
+                    instance.photo_url.storage.delete(old_name)
+                except OSError:
+                    pass
+            
             # Refrescar para obtener la URL actualizada
             instance.refresh_from_db()
             print(f"DEBUG: Foto guardada: {instance.photo_url}")
@@ -171,14 +170,13 @@ class UserProfilePhotoSerializer(serializers.ModelSerializer):
         else:
             # Si no se proporciona foto, eliminar la existente
             if instance.photo_url:
-                try:
-                    if os.path.isfile(instance.photo_url.path):
-                        os.remove(instance.photo_url.path)
-                except (ValueError, AttributeError):
-                    pass
-                
+                storage, old_name = instance.photo_url.storage, instance.photo_url.name
                 instance.photo_url = None
                 instance.save()
+                try:
+                    storage.delete(old_name)
+                except OSError:
+                    pass
                 print("DEBUG: Foto eliminada")
         
         return instance
\ No newline at end of file
@@ -92,16 +92,15 @@ class UserProfilePhotoView(APIView):
     def delete(self, request):
         """Elimina la foto de perfil del usuario"""
         if request.user.photo_url:
-            # Eliminar archivo físico si existe
-            try:
-                import os
-                if os.path.isfile(request.user.photo_url.path):
-                    os.remove(request.user.photo_url.path)
-            except (ValueError, AttributeError):
-                pass  # El archivo no existe en el sistema de archivos
-            
+            storage, old_name = request.user.photo_url.storage, request.user.photo_url.name
             request.user.photo_url = None
             request.user.save()
+            
+            # Eliminar archivo físico si ningún otro registro lo usa
+            try:
+                storage.delete(old_name)
+            except OSError:
+                pass  # El archivo no existe en el sistema de archivos
             return Response({
                 'message': 'Foto de perfil eliminada exitosamente'
             }, status=status.HTTP_200_OK)